@@ -1,9 +1,14 @@
 # search_comparison.py
+import argparse
 import timeit
 import random
 import matplotlib.pyplot as plt
 import bisect
 
+# Общий измерительный стенд лежит в lab01/src (см. timing_harness.py), запуск:
+#     PYTHONPATH=../lab01/src python sum_analysis.py
+from timing_harness import measure, save_json
+
 # ----------------------------------------------------------
 # 1. Реализация линейного поиска
 # ----------------------------------------------------------
@@ -46,24 +51,58 @@ def binary_search(arr, target):
 
 
 # ----------------------------------------------------------
-# 3. Функция для измерения времени
+# 3. Поиск множества элементов (галопирующий проход)
 # ----------------------------------------------------------
 
-def measure_time(func, arr, target, repeats=10):
+def bisect_search(arr, target):
+    """
+    Бинарный поиск через стандартный модуль bisect (реализован на C).
+    Возвращает индекс элемента, если найден, иначе -1.
+    Сложность: O(log n)
+    """
+    i = bisect.bisect_left(arr, target)  # O(log n)
+    return i if i < len(arr) and arr[i] == target else -1  # O(1)
+
+
+def search_many(arr, targets):
     """
-    Измеряет среднее время выполнения функции поиска.
-    Возвращает время в миллисекундах.
+    Поиск сразу многих элементов в отсортированном массиве.
+    Запросы сортируются один раз, после чего массив проходится слева направо:
+    от позиции предыдущего найденного элемента делается экспоненциальный
+    (галопирующий) шаг 1, 2, 4, ... до первого arr[i] >= target, затем бинарный
+    поиск внутри найденного окна. Результаты возвращаются в исходном порядке targets.
+    Возвращает список индексов, -1 для отсутствующих элементов.
+    Сложность: O(m log m + m log(n/m)) — не хуже O(n + m) слияния и O(m log n) повторов
     """
-    total_time = timeit.timeit(lambda: func(arr, target), number=repeats)
-    avg_time_ms = (total_time / repeats) * 1000
-    return avg_time_ms
+    n = len(arr)
+    result = [-1] * len(targets)  # O(m)
+    order = sorted(range(len(targets)), key=targets.__getitem__)  # O(m log m)
+
+    lo = 0  # все элементы левее lo меньше текущего запроса
+    for j in order:  # O(m)
+        target = targets[j]
+        if lo < n and arr[lo] < target:
+            prev, step = lo, 1  # инвариант: arr[prev] < target
+            nxt = lo + 1
+            while nxt < n and arr[nxt] < target:  # O(log d), d — расстояние до цели
+                prev = nxt
+                step *= 2
+                nxt = prev + step
+            lo = bisect.bisect_left(arr, target, prev + 1, min(nxt, n))  # O(log d)
+        if lo < n and arr[lo] == target:  # O(1)
+            result[j] = lo
+    return result
+    # Общая сложность: O(m log m + m log(n/m))
 
 
 # ----------------------------------------------------------
 # 4. Подготовка данных и эксперимент
 # ----------------------------------------------------------
 
-def run_experiment():
+def run_experiment(json_path=None):
+    """
+    Основной эксперимент; json_path — путь для сохранения результатов в JSON.
+    """
     sizes = [1000, 5000, 10000, 50000, 100000, 500000, 1000000]
     linear_times = []
     binary_times = []
@@ -74,25 +113,38 @@ def run_experiment():
     print("- ОС: Windows 10")
     print("- Python: 3.13.5\n")
 
-    print("{:>10} {:>15} {:>15}".format("Размер", "Линейный поиск (мс)", "Бинарный поиск (мс)"))
-    print("-" * 45)
+    print("{:>10} {:>15} {:>10} {:>15} {:>10}".format("Размер", "Линейный поиск (мс)", "IQR",
+                                                      "Бинарный поиск (мс)", "IQR"))
+    print("-" * 67)
+    results = []
 
     for n in sizes:
         arr = sorted(random.sample(range(n * 2), n))  # создаём отсортированный массив
         target = random.choice(arr)  # выбираем существующий элемент
 
         # Замер линейного поиска
-        lin_time = measure_time(linear_search, arr, target)
+        lin_result = measure(linear_search, arr, target, params={"n": n})
         # Замер бинарного поиска
-        bin_time = measure_time(binary_search, arr, target)
+        bin_result = measure(binary_search, arr, target, params={"n": n})
+        results.extend([lin_result, bin_result])
 
+        lin_time = lin_result.median * 1000
+        bin_time = bin_result.median * 1000
         linear_times.append(lin_time)
         binary_times.append(bin_time)
 
-        print(f"{n:>10} {lin_time:>15.4f} {bin_time:>15.4f}")
+        print(f"{n:>10} {lin_time:>15.4f} {lin_result.iqr * 1000:>10.4f} "
+              f"{bin_time:>15.4f} {bin_result.iqr * 1000:>10.4f}")
+
+    if json_path:
+        save_json(results, json_path)
+        print(f"Результаты сохранены в {json_path}")
+
+    # Поиск множества элементов: где галопирующий проход обгоняет повторный поиск
+    run_search_many_experiment()
 
     # ------------------------------------------------------
-    # 5. Визуализация результатов
+    # 6. Визуализация результатов
     # ------------------------------------------------------
     plt.figure(figsize=(10, 6))
     plt.plot(sizes, linear_times, 'o-', label='Линейный поиск O(n)')
@@ -120,7 +172,7 @@ def run_experiment():
     plt.show()
 
     # ------------------------------------------------------
-    # 6. Анализ результатов
+    # 7. Анализ результатов
     # ------------------------------------------------------
     print("\nАнализ результатов:")
     print("1. Линейный поиск демонстрирует рост времени ~O(n) — при увеличении размера массива в 10 раз,")
@@ -130,9 +182,46 @@ def run_experiment():
     print("4. Эксперимент подтверждает теоретические оценки O(n) и O(log n).")
 
 
+def run_search_many_experiment(n=100000, query_counts=(10, 100, 1000, 10000, 100000, 1000000)):
+    """
+    Сравнивает search_many с повторными вызовами binary_search и bisect_search
+    при разном числе запросов m на массиве фиксированного размера n
+    и выводит точку, начиная с которой search_many выигрывает.
+    """
+    arr = sorted(random.sample(range(n * 2), n))
+    methods = {
+        "binary_search": lambda targets: [binary_search(arr, t) for t in targets],
+        "bisect": lambda targets: [bisect_search(arr, t) for t in targets],
+        "search_many": lambda targets: search_many(arr, targets),
+    }
+
+    print(f"\nПоиск множества элементов в массиве из {n} элементов:")
+    print("{:>10}".format("m") + "".join("{:>20}".format(name + " (мс)") for name in methods))
+    print("-" * (10 + 20 * len(methods)))
+
+    crossover = {}  # наименьшее m, при котором search_many быстрее метода
+    for m in query_counts:
+        targets = [random.randrange(n * 2) for _ in range(m)]
+        times = {name: min(timeit.repeat(lambda: method(targets), number=1, repeat=3)) * 1000
+                 for name, method in methods.items()}
+        print(f"{m:>10}" + "".join(f"{times[name]:>20.3f}" for name in methods))
+        for name in ("binary_search", "bisect"):
+            if name not in crossover and times["search_many"] < times[name]:
+                crossover[name] = m
+
+    for name in ("binary_search", "bisect"):
+        if name in crossover:
+            print(f"search_many быстрее {name}, начиная с m = {crossover[name]}")
+        else:
+            print(f"search_many не обогнал {name} на проверенных m")
+
+
 # ----------------------------------------------------------
 # Запуск эксперимента
 # ----------------------------------------------------------
 
 if __name__ == "__main__":
-    run_experiment()
+    parser = argparse.ArgumentParser(description="Сравнение линейного и бинарного поиска")
+    parser.add_argument("--json", metavar="PATH", help="сохранить результаты замеров в JSON")
+    args = parser.parse_args()
+    run_experiment(json_path=args.json)
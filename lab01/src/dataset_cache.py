@@ -0,0 +1,205 @@
+"""
+Постоянный кэш тестовых массивов на диске.
+
+Массив генерируется один раз и сохраняется в компактном двоичном формате:
+заголовок фиксированной длины + ключи int64 в машинном порядке байт.
+Повторные запуски открывают файл через mmap без копирования и получают
+объект с len() и индексацией, который можно передавать прямо в
+linear_search/binary_search. Размер кэша ограничен: при превышении лимита
+удаляются давно не использовавшиеся файлы (LRU по времени доступа).
+"""
+import mmap
+import os
+import random
+import re
+import struct
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен — без него используется memoryview
+    np = None
+
+MAGIC = b"BSRTKEYS"
+FORMAT_VERSION = 1
+# magic, версия формата, число ключей, версия генератора, резерв
+HEADER = struct.Struct("<8sIQII")
+HEADER_SIZE = 32  # данные выровнены по 8 байтам
+# Имя файла кэша: {generator}-{n}-{seed}.bin (seed может быть отрицательным)
+ENTRY_NAME = re.compile(r"(?P<generator>.+)-(?P<n>\d+)-(?P<seed>-?\d+)\.bin")
+
+
+def generate_sorted_sample(n, rng):
+    """Генератор run_experiment: отсортированная выборка n чисел из range(2n)."""
+    return sorted(rng.sample(range(n * 2), n))
+
+
+# Имя генератора -> (функция(n, rng), версия). Версию нужно увеличить при
+# изменении функции — файлы со старой версией будут пересозданы.
+GENERATORS = {
+    "sorted_sample": (generate_sorted_sample, 1),
+}
+
+
+class CachedArray:
+    """
+    Массив int64, открытый из файла кэша через mmap.
+    Поддерживает len(), индексацию и итерацию. Атрибут keys — memoryview
+    над отображённым файлом (индексация на C, удобно для замеров);
+    as_numpy() возвращает numpy.memmap тех же данных (если установлен NumPy).
+    """
+
+    def __init__(self, path, n):
+        self.path = path
+        self._n = n
+        self._file = open(path, "rb")
+        if n:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.keys = memoryview(self._mmap)[HEADER_SIZE:HEADER_SIZE + n * 8].cast('q')
+        else:
+            self._mmap = None
+            self.keys = memoryview(b"").cast('q')
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, index):
+        return self.keys[index]
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def as_numpy(self):
+        if np is None:
+            raise RuntimeError("Для as_numpy() требуется NumPy")
+        return np.memmap(self.path, dtype=np.int64, mode="r",
+                         offset=HEADER_SIZE, shape=(self._n,))
+
+    def close(self):
+        self.keys.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class DatasetCache:
+    """
+    Кэш массивов, ключ — (генератор, размер, seed).
+    max_bytes — ограничение суммарного размера файлов кэша.
+    """
+
+    def __init__(self, directory, max_bytes=2 * 1024 ** 3):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, generator, n, seed):
+        return os.path.join(self.directory, f"{generator}-{n}-{seed}.bin")
+
+    @staticmethod
+    def _read_header(path):
+        """Возвращает (n, версия генератора) или None, если файл повреждён/устарел."""
+        try:
+            with open(path, "rb") as f:
+                raw = f.read(HEADER.size)
+            magic, version, n, gen_version, _ = HEADER.unpack(raw)
+        except (OSError, struct.error):
+            return None
+        if magic != MAGIC or version != FORMAT_VERSION:
+            return None
+        if os.path.getsize(path) != HEADER_SIZE + n * 8:
+            return None
+        return n, gen_version
+
+    def _write(self, path, keys, gen_version):
+        """Атомарная запись: сначала во временный файл, затем переименование."""
+        data = array('q', keys)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(data), gen_version, 0)
+                    .ljust(HEADER_SIZE, b"\0"))
+            data.tofile(f)
+        os.replace(tmp_path, path)
+
+    def get(self, n, generator="sorted_sample", seed=0):
+        """
+        Возвращает CachedArray для (generator, n, seed),
+        при необходимости генерируя и сохраняя массив.
+        """
+        func, gen_version = GENERATORS[generator]
+        path = self._path(generator, n, seed)
+
+        header = self._read_header(path) if os.path.exists(path) else None
+        if header is None or header != (n, gen_version):  # нет файла или он устарел
+            self._write(path, func(n, random.Random(seed)), gen_version)
+            self.evict(keep=path)
+        os.utime(path)  # отмечаем использование для LRU
+        return CachedArray(path, n)
+
+    def invalidate(self, n=None, generator=None, seed=None):
+        """Удаляет записи кэша, подходящие под заданные (непустые) параметры ключа."""
+        for key, path, _, _ in self._entries():
+            if generator is not None and key[0] != generator:
+                continue
+            if n is not None and key[1] != n:
+                continue
+            if seed is not None and key[2] != seed:
+                continue
+            try:
+                os.remove(path)
+            except OSError:  # файл открыт в другом процессе (Windows)
+                continue
+
+    def clear(self):
+        """Полная очистка кэша."""
+        self.invalidate()
+
+    def _entries(self):
+        """
+        Файлы кэша: (ключ (генератор, n, seed), путь, размер, время последнего
+        использования). Учитываются только файлы с именем вида
+        {generator}-{n}-{seed}.bin и корректным заголовком с тем же n — чужие
+        .bin в общем каталоге (например, keys-N.bin из disk_search) не трогаются.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            match = ENTRY_NAME.fullmatch(name)
+            if match is None:
+                continue
+            path = os.path.join(self.directory, name)
+            n = int(match["n"])
+            header = self._read_header(path)
+            if header is None or header[0] != n:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:  # файл удалён другим процессом
+                continue
+            key = (match["generator"], n, int(match["seed"]))
+            entries.append((key, path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def size(self):
+        """Суммарный размер файлов кэша в байтах."""
+        return sum(size for _, _, size, _ in self._entries())
+
+    def evict(self, keep=None):
+        """Удаляет самые давно использованные файлы, пока кэш больше max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[3])  # старые — первыми
+        total = sum(size for _, _, size, _ in entries)
+        for _, path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:  # файл открыт в другом процессе (Windows)
+                continue
+            total -= size
@@ -0,0 +1,213 @@
+"""
+Поиск в отсортированных файлах, которые не помещаются в оперативную память.
+
+1. Файл фиксированной ширины: подряд записанные ключи int64. Файл отображается
+   в память через mmap, и обычный binary_search работает прямо по memoryview —
+   ОС подгружает только те страницы, к которым обращается поиск.
+2. Файл записей переменной длины (строки "ключ<TAB>данные"): строится
+   разреженный блочный индекс (первый ключ и смещение каждого блока),
+   бинарный поиск идёт по индексу, затем читается и просматривается один блок.
+"""
+import mmap
+import os
+import random
+import timeit
+from array import array
+from bisect import bisect_left, bisect_right
+
+from search_comparison import binary_search
+
+CHUNK = 1 << 16  # ключей в одном буфере записи
+
+
+def iter_sorted_sample(n, rng):
+    """
+    Потоковый вариант генератора run_experiment sorted(random.sample(range(2n), n)):
+    выборка Кнута (алгоритм S) сразу выдаёт ключи по возрастанию,
+    не держа в памяти весь массив. Сложность: O(n), память O(1).
+    """
+    needed = n
+    remaining = n * 2
+    for value in range(n * 2):
+        if rng.random() * remaining < needed:
+            yield value
+            needed -= 1
+            if needed == 0:
+                return
+        remaining -= 1
+
+
+def write_keys_file(path, keys):
+    """Записывает отсортированные ключи в файл фиксированной ширины (int64)."""
+    buffer = array('q')
+    with open(path, "wb") as f:
+        for key in keys:
+            buffer.append(key)
+            if len(buffer) >= CHUNK:
+                buffer.tofile(f)
+                del buffer[:]
+        buffer.tofile(f)
+
+
+def write_records_file(path, keys, payload_size=(0, 32), seed=0):
+    """
+    Записывает отсортированные ключи как строки "ключ<TAB>данные" переменной длины.
+    Длина данных выбирается случайно в диапазоне payload_size.
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="ascii", newline="\n") as f:
+        for key in keys:
+            f.write(f"{key}\t{'x' * rng.randint(*payload_size)}\n")
+
+
+class MappedKeys:
+    """
+    Отсортированные ключи int64 из файла, отображённого в память.
+    offset — размер заголовка перед ключами (0 для «сырого» файла,
+    dataset_cache.HEADER_SIZE для файлов DatasetCache).
+    """
+
+    def __init__(self, path, offset=0):
+        self._file = open(path, "rb")
+        self._n = (os.path.getsize(path) - offset) // 8
+        if self._n:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.keys = memoryview(self._mmap)[offset:offset + self._n * 8].cast('q')
+        else:
+            self._mmap = None
+            self.keys = memoryview(b"").cast('q')
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, index):
+        return self.keys[index]
+
+    def search(self, target):
+        """
+        binary_search прямо по отображённому файлу.
+        Возвращает индекс ключа, иначе -1. Сложность: O(log n) чтений страниц.
+        """
+        return binary_search(self.keys, target)
+
+    def close(self):
+        self.keys.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BlockIndex:
+    """
+    Разреженный блочный индекс по файлу строк "ключ<TAB>данные",
+    отсортированных по целочисленному ключу.
+    В памяти хранится только первый ключ и смещение каждого блока
+    (примерно block_size байт), то есть O(размер файла / block_size).
+    """
+
+    def __init__(self, path, block_size=4096):
+        self.path = path
+        self.first_keys = []
+        self.offsets = []
+
+        with open(path, "rb") as f:
+            offset = 0
+            next_block = 0
+            for line in f:  # один последовательный проход по файлу
+                if offset >= next_block:
+                    self.first_keys.append(int(line.split(b"\t", 1)[0]))
+                    self.offsets.append(offset)
+                    next_block = offset + block_size
+                offset += len(line)
+        self.offsets.append(offset)  # конец последнего блока
+        self._file = open(path, "rb")
+
+    def _read_block(self, block):
+        """Ключи и смещения строк блока."""
+        start, end = self.offsets[block], self.offsets[block + 1]
+        self._file.seek(start)
+        data = self._file.read(end - start)
+        keys, positions = [], []
+        position = 0
+        for line in data.splitlines(keepends=True):
+            keys.append(int(line.split(b"\t", 1)[0]))
+            positions.append(start + position)
+            position += len(line)
+        return keys, positions
+
+    def search(self, target):
+        """
+        Возвращает смещение строки с ключом target в файле, иначе -1.
+        Сложность: O(log B) по индексу + O(block_size) чтения одного блока.
+        """
+        block = bisect_right(self.first_keys, target) - 1  # O(log B)
+        if block < 0:
+            return -1
+        keys, positions = self._read_block(block)
+        i = bisect_left(keys, target)
+        return positions[i] if i < len(keys) and keys[i] == target else -1
+
+    def get(self, target):
+        """Данные записи с ключом target или None."""
+        offset = self.search(target)
+        if offset < 0:
+            return None
+        self._file.seek(offset)
+        return self._file.readline().rstrip(b"\n").split(b"\t", 1)[1].decode("ascii")
+
+    def close(self):
+        self._file.close()
+
+
+def run_disk_experiment(sizes=(10**5, 10**6, 10**7), queries=10000, directory="."):
+    """
+    Сравнение поиска по файлу на диске с загрузкой файла в список.
+    Для каждого способа выводится время открытия/загрузки (мс)
+    и среднее время одного запроса (мкс).
+    """
+    print(f"Поиск по файлам на диске ({queries} запросов):")
+    print("{:>10} {:>16} {:>14} {:>14} {:>14} {:>14} {:>14}".format(
+        "Размер", "Загрузка (мс)", "list (мкс)", "mmap откр.", "mmap (мкс)",
+        "индекс (мс)", "блоки (мкс)"))
+    print("-" * 104)
+
+    for n in sizes:
+        keys_path = os.path.join(directory, f"keys-{n}.bin")
+        records_path = os.path.join(directory, f"records-{n}.tsv")
+        write_keys_file(keys_path, iter_sorted_sample(n, random.Random(n)))
+        write_records_file(records_path, iter_sorted_sample(n, random.Random(n)))
+        targets = [random.randrange(n * 2) for _ in range(queries)]
+
+        def load_list():
+            data = array('q')
+            with open(keys_path, "rb") as f:
+                data.fromfile(f, os.path.getsize(keys_path) // 8)
+            return data.tolist()
+
+        load_time = timeit.timeit(load_list, number=1)
+        arr = load_list()
+        list_time = timeit.timeit(lambda: [binary_search(arr, t) for t in targets], number=1)
+        del arr
+
+        open_time = timeit.timeit(lambda: MappedKeys(keys_path).close(), number=1)
+        with MappedKeys(keys_path) as mapped:
+            mmap_time = timeit.timeit(lambda: [mapped.search(t) for t in targets], number=1)
+
+        start = timeit.default_timer()
+        index = BlockIndex(records_path)
+        index_time = timeit.default_timer() - start
+        block_time = timeit.timeit(lambda: [index.search(t) for t in targets], number=1)
+        index.close()
+
+        print(f"{n:>10} {load_time * 1000:>16.1f} {list_time / queries * 1e6:>14.2f} "
+              f"{open_time * 1000:>14.3f} {mmap_time / queries * 1e6:>14.2f} "
+              f"{index_time * 1000:>14.1f} {block_time / queries * 1e6:>14.2f}")
+
+        os.remove(keys_path)
+        os.remove(records_path)
@@ -0,0 +1,108 @@
+"""
+Параллельный запуск замеров run_experiment.
+
+Ячейки эксперимента (алгоритм, размер, повтор) распределяются по процессам
+ProcessPoolExecutor. Отсортированные массивы генерируются один раз в
+родительском процессе и передаются рабочим через разделяемую память
+(multiprocessing.shared_memory) как int64-буферы, а не сериализуются pickle.
+Каждый рабочий процесс закрепляется за своим ядром (где ОС это позволяет)
+и делает прогрев перед замерами.
+"""
+import multiprocessing
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from timing_harness import TimingResult, measure
+
+# Состояние рабочего процесса: размер -> (сегмент памяти, представление массива)
+_worker_arrays = {}
+
+
+def _pin_to_cpu(cpu_counter):
+    """Закрепляет текущий процесс за следующим свободным ядром (только Linux)."""
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    with cpu_counter.get_lock():
+        slot = cpu_counter.value
+        cpu_counter.value += 1
+    os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+
+def _init_worker(segments, algorithms, cpu_counter, pin_cpus):
+    """
+    Инициализация рабочего процесса: закрепление за ядром,
+    подключение к сегментам разделяемой памяти и прогрев.
+    """
+    if pin_cpus:
+        _pin_to_cpu(cpu_counter)
+
+    for n, shm_name in segments.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        # Срез по точной длине: ОС может округлить сегмент до размера страницы
+        _worker_arrays[n] = (shm, shm.buf[:n * 8].cast('q'))  # без копирования
+
+    # Прогрев: по одному вызову каждого алгоритма на самом маленьком массиве
+    smallest = _worker_arrays[min(_worker_arrays)][1]
+    for func in algorithms.values():
+        func(smallest, smallest[len(smallest) // 2])
+
+
+def _run_cell(func, n, target, budget):
+    """Замер одной ячейки в рабочем процессе. Возвращает медианное время (сек)."""
+    arr = _worker_arrays[n][1]
+    return measure(func, arr, target, budget=budget).median
+
+
+def run_parallel(algorithms, sizes, repetitions=5, workers=None, pin_cpus=True,
+                 seed=0, budget=0.05):
+    """
+    Параллельно измеряет algorithms (имя -> функция поиска) на массивах sizes.
+
+    Для каждого размера генерируется отсортированный массив
+    sorted(random.sample(range(n * 2), n)) и выбирается существующий элемент.
+    Все повторы каждой ячейки выполняются в пуле из workers процессов.
+    Возвращает словарь (имя, n) -> TimingResult, где samples — медианы
+    повторов в фиксированном порядке, так что результат не зависит от того,
+    в каком порядке процессы завершили работу.
+    """
+    rng = random.Random(seed)
+    segments = {}
+    targets = {}
+    try:
+        for n in sizes:
+            data = array('q', sorted(rng.sample(range(n * 2), n)))
+            targets[n] = data[rng.randrange(n)]
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+            shm.buf[:len(data) * data.itemsize] = data.tobytes()
+            segments[n] = shm
+
+        cpu_counter = multiprocessing.Value('i', 0)
+        cells = [(name, n, rep) for name in algorithms for n in sizes
+                 for rep in range(repetitions)]
+
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=({n: shm.name for n, shm in segments.items()},
+                          algorithms, cpu_counter, pin_cpus)) as pool:
+            futures = {cell: pool.submit(_run_cell, algorithms[cell[0]], cell[1],
+                                         targets[cell[1]], budget)
+                       for cell in cells}
+            timings = {cell: future.result() for cell, future in futures.items()}
+    finally:
+        for shm in segments.values():
+            shm.close()
+            shm.unlink()
+
+    # Детерминированное слияние: повторы упорядочены по номеру
+    results = {}
+    for name in algorithms:
+        for n in sizes:
+            samples = [timings[(name, n, rep)] for rep in range(repetitions)]
+            results[(name, n)] = TimingResult(name=name, loops=1, samples=samples,
+                                              params={"n": n, "repetitions": repetitions})
+    return results
@@ -1,6 +1,19 @@
+import argparse
 import timeit
 import random
+from bisect import bisect_left, bisect_right
 import matplotlib.pyplot as plt
+from sorted_index import SortedIndex
+from timing_harness import measure, save_json
+from parallel_runner import run_parallel
+from dataset_cache import DatasetCache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен — без него работает чисто Python-версия
+    np = None
+
+BATCH_SIZE = 10000  # количество запросов в одном пакете для замеров пропускной способности
 
 
 def linear_search(arr, target):
@@ -36,20 +49,487 @@ def binary_search(arr, target):
     # Общая сложность: O(log n)
 
 
-def measure_time(func, arr, target, repeats=200):
+def binary_search_batch(arr, targets):
+    """
+    Пакетный бинарный поиск: ищет сразу все targets в отсортированном массиве.
+    Возвращает список индексов элементов в порядке targets, -1 для отсутствующих.
+    При наличии NumPy поиск выполняется векторно (np.searchsorted), иначе —
+    через bisect_left; тип результата (list из int) от этого не зависит.
+    Для массивов без повторов результат совпадает с binary_search,
+    при повторах возвращается индекс первого вхождения.
+    Массив лучше передавать уже как np.ndarray: преобразование списка стоит O(n).
+    Сложность: O(m log n), m = len(targets)
+    """
+    n = len(arr)
+    if np is not None:
+        keys = np.asarray(arr)  # O(1) для np.ndarray, O(n) для списка
+        queries = np.asarray(targets)
+        if keys.dtype.kind in 'iuf' and queries.dtype.kind in 'iuf':
+            if n == 0:
+                return [-1] * len(queries)
+            idx = np.searchsorted(keys, queries)  # O(m log n) без интерпретатора
+            found = keys[np.minimum(idx, n - 1)] == queries  # O(m)
+            return np.where(found & (idx < n), idx, -1).tolist()  # O(m), list как без NumPy
+
+    result = []
+    for target in targets:  # O(m)
+        i = bisect_left(arr, target)  # O(log n) на C
+        result.append(i if i < n and arr[i] == target else -1)  # O(1)
+    return result
+    # Общая сложность: O(m log n)
+
+
+def linear_search_batch(arr, targets):
+    """
+    Пакетный линейный поиск в произвольном (не обязательно отсортированном) массиве.
+    Один проход строит словарь «значение -> индекс первого вхождения»,
+    после чего каждый запрос обслуживается за O(1).
+    Возвращает список индексов в порядке targets, -1 для отсутствующих,
+    что совпадает с результатом linear_search для каждого запроса.
+    Сложность: O(n + m)
+    """
+    first_index = build_first_index(arr)  # O(n)
+    return [first_index.get(target, -1) for target in targets]  # O(m)
+    # Общая сложность: O(n + m)
+
+
+def build_first_index(arr):
+    """
+    Хеш-индекс «значение -> индекс первого вхождения» для произвольного массива.
+    Сложность: O(n)
+    """
+    first_index = {}
+    for i, value in enumerate(arr):  # O(n)
+        first_index.setdefault(value, i)  # O(1) — сохраняем первое вхождение
+    return first_index
+
+
+def lower_bound(arr, target):
+    """
+    Индекс первого элемента >= target в отсортированном массиве
+    (len(arr), если такого нет).
+    Сложность: O(log n) — в том числе при любом числе повторов target
+    """
+    left = 0              # O(1)
+    right = len(arr)      # O(1) — полуинтервал [left, right)
+    while left < right:   # O(log n)
+        mid = (left + right) // 2  # O(1)
+        if arr[mid] < target:      # O(1)
+            left = mid + 1
+        else:
+            right = mid
+    return left
+    # Общая сложность: O(log n)
+
+
+def upper_bound(arr, target):
+    """
+    Индекс первого элемента > target в отсортированном массиве
+    (len(arr), если такого нет).
+    Сложность: O(log n)
+    """
+    left = 0
+    right = len(arr)
+    while left < right:   # O(log n)
+        mid = (left + right) // 2
+        if arr[mid] <= target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+    # Общая сложность: O(log n)
+
+
+def equal_range(arr, target):
+    """
+    Полуинтервал [first, last) индексов элементов, равных target.
+    Пустой интервал (first == last) означает, что элемента нет.
+    Сложность: O(log n) — два бинарных поиска вместо обхода k повторов
+    """
+    return lower_bound(arr, target), upper_bound(arr, target)
+
+
+def count_range(arr, low, high):
+    """
+    Количество элементов отсортированного массива в диапазоне [low, high).
+    Сложность: O(log n)
+    """
+    if high <= low:
+        return 0
+    return lower_bound(arr, high) - lower_bound(arr, low)
+
+
+def _bounds_array(arr, targets, side):
+    """Векторный lower/upper_bound (np.ndarray) или None, если NumPy недоступен."""
+    if np is not None:
+        keys = np.asarray(arr)
+        queries = np.asarray(targets)
+        if keys.dtype.kind in 'iuf' and queries.dtype.kind in 'iuf':
+            return np.searchsorted(keys, queries, side=side)  # O(m log n) векторно
+    return None
+
+
+def _bounds_batch(arr, targets, side):
+    """Пакетный lower_bound (side='left') или upper_bound (side='right') — список."""
+    bounds = _bounds_array(arr, targets, side)
+    if bounds is not None:
+        return bounds.tolist()  # O(m), list как без NumPy
+    bound = bisect_left if side == 'left' else bisect_right
+    return [bound(arr, target) for target in targets]  # O(m log n)
+
+
+def lower_bound_batch(arr, targets):
+    """
+    lower_bound для каждого элемента targets.
+    Возвращает список (как binary_search_batch, с NumPy и без). Сложность: O(m log n)
+    """
+    return _bounds_batch(arr, targets, 'left')
+
+
+def upper_bound_batch(arr, targets):
+    """
+    upper_bound для каждого элемента targets.
+    Возвращает список (как binary_search_batch, с NumPy и без). Сложность: O(m log n)
+    """
+    return _bounds_batch(arr, targets, 'right')
+
+
+def equal_range_batch(arr, targets):
+    """
+    equal_range для каждого элемента targets.
+    Возвращает пару списков (начала, концы) полуинтервалов. Сложность: O(m log n)
+    """
+    return lower_bound_batch(arr, targets), upper_bound_batch(arr, targets)
+
+
+def count_range_batch(arr, lows, highs):
+    """
+    count_range для каждой пары границ (lows[i], highs[i]).
+    Возвращает список; с NumPy разность считается векторно. Сложность: O(m log n)
+    """
+    starts = _bounds_array(arr, lows, 'left')
+    ends = _bounds_array(arr, highs, 'left')
+    if starts is not None and ends is not None:
+        return np.maximum(ends - starts, 0).tolist()
+    starts = lower_bound_batch(arr, lows)
+    ends = lower_bound_batch(arr, highs)
+    return [max(end - start, 0) for start, end in zip(starts, ends)]
+
+
+def measure_batch_throughput(arr, targets, repeats=3):
+    """
+    Сравнивает пропускную способность поштучного binary_search и
+    пакетного binary_search_batch на одном и том же наборе запросов.
+    Время пакетного поиска включает преобразование результата в список.
+    Возвращает кортеж (запросов/с поштучно, запросов/с пакетно).
+    """
+    keys = np.asarray(arr) if np is not None else arr  # готовим массив один раз
+    queries = np.asarray(targets) if np is not None else targets
+
+    def per_call():
+        for target in targets:
+            binary_search(arr, target)
+
+    per_call_time = min(timeit.repeat(per_call, number=1, repeat=repeats))
+    batch_time = min(timeit.repeat(lambda: binary_search_batch(keys, queries),
+                                   number=1, repeat=repeats))
+    m = len(targets)
+    return m / per_call_time, m / batch_time
+
+
+def _binary_search_range(arr, target, left, right):
+    """
+    Бинарный поиск на отрезке arr[left..right] (границы включительно).
+    Возвращает индекс элемента, если найден, иначе -1.
+    Сложность: O(log (right - left))
+    """
+    while left <= right:
+        mid = (left + right) // 2
+        value = arr[mid]
+        if value == target:
+            return mid
+        elif value < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1
+
+
+def interpolation_search(arr, target):
+    """
+    Интерполяционный поиск в отсортированном массиве чисел.
+    Позиция пробы вычисляется линейной интерполяцией между крайними значениями
+    отрезка, поэтому на равномерно распределённых ключах хватает O(log log n) проб.
+    Возвращает индекс элемента, если найден, иначе -1.
+    Сложность: O(log log n) в среднем, O(n) в худшем (сильно неравномерные ключи)
+    """
+    left = 0
+    right = len(arr) - 1
+    while left <= right:
+        low_value = arr[left]
+        high_value = arr[right]
+        if target < low_value or target > high_value:  # O(1) — цель вне отрезка
+            return -1
+        if high_value == low_value:  # все значения отрезка равны
+            return left if low_value == target else -1
+        pos = left + int((target - low_value) * (right - left) // (high_value - low_value))
+        value = arr[pos]
+        if value == target:
+            return pos
+        elif value < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+    return -1
+    # Общая сложность: O(log log n) в среднем
+
+
+def exponential_search(arr, target):
+    """
+    Экспоненциальный поиск: граница диапазона удваивается (1, 2, 4, ...),
+    пока arr[bound] < target, затем выполняется бинарный поиск в [bound/2, bound].
+    Подходит для неограниченных/потоковых префиксов: число проб зависит
+    от позиции цели i, а не от длины массива.
+    Возвращает индекс элемента, если найден, иначе -1.
+    Сложность: O(log i), i — позиция искомого элемента
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    bound = 1
+    while bound < n and arr[bound] < target:  # O(log i)
+        bound *= 2
+    return _binary_search_range(arr, target, bound // 2, min(bound, n - 1))  # O(log i)
+    # Общая сложность: O(log i)
+
+
+def interpolation_binary_search(arr, target):
+    """
+    Гибридный поиск: интерполяционная проба, подстрахованная бинарной.
+    Если интерполяционный шаг не уменьшил отрезок хотя бы вдвое
+    (признак неравномерных данных), сразу делается шаг бинарного поиска.
+    Возвращает индекс элемента, если найден, иначе -1.
+    Сложность: O(log log n) на равномерных данных, O(log n) в худшем
+    """
+    left = 0
+    right = len(arr) - 1
+    while left <= right:
+        low_value = arr[left]
+        high_value = arr[right]
+        if target < low_value or target > high_value:
+            return -1
+        if high_value == low_value:
+            return left if low_value == target else -1
+
+        size = right - left
+        pos = left + int((target - low_value) * size // (high_value - low_value))
+        value = arr[pos]
+        if value == target:
+            return pos
+        elif value < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+
+        if right - left > size // 2 and left <= right:  # интерполяция не помогла
+            mid = (left + right) // 2
+            value = arr[mid]
+            if value == target:
+                return mid
+            elif value < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+    return -1
+    # Общая сложность: O(log n) в худшем — каждые две пробы отрезок сокращается вдвое
+
+
+SEARCH_ENGINES = {
+    "binary": binary_search,
+    "interpolation": interpolation_search,
+    "exponential": exponential_search,
+    "hybrid": interpolation_binary_search,
+}
+
+
+class ProbeCounter:
+    """
+    Обёртка над массивом, подсчитывающая обращения к элементам (пробы).
+    Позволяет измерять число проб любой функции поиска без её изменения.
+    """
+    def __init__(self, arr):
+        self.arr = arr
+        self.probes = 0
+
+    def __len__(self):
+        return len(self.arr)
+
+    def __getitem__(self, index):
+        self.probes += 1
+        return self.arr[index]
+
+
+def generate_uniform(n):
+    """Отсортированные почти равномерно распределённые уникальные ключи."""
+    return sorted(random.sample(range(n * 2), n))
+
+
+def generate_zipf(n, alpha=1.2):
+    """
+    Отсортированные уникальные ключи с перекошенным распределением:
+    промежутки между соседними ключами распределены по степенному закону
+    (как ранги в законе Ципфа), поэтому отдельные скачки огромны.
+    """
+    keys = []
+    current = 0
+    for _ in range(n):
+        current += int(random.paretovariate(alpha))  # промежуток >= 1
+        keys.append(current)
+    return keys
+
+
+def generate_clustered(n, clusters=10):
+    """Отсортированные уникальные ключи, собранные в плотные кластеры с большими разрывами."""
+    keys = []
+    per_cluster = max(1, n // clusters)
+    base = 0
+    while len(keys) < n:
+        count = min(per_cluster, n - len(keys))
+        keys.extend(base + offset for offset in sorted(random.sample(range(count * 2), count)))
+        base += count * 2 + n * 100  # разрыв на порядки больше размера кластера
+    return keys
+
+
+DISTRIBUTIONS = {
+    "uniform": generate_uniform,
+    "zipf": generate_zipf,
+    "clustered": generate_clustered,
+}
+
+
+def count_probes(func, arr, targets):
+    """Возвращает среднее число проб функции поиска на наборе целей."""
+    counter = ProbeCounter(arr)
+    for target in targets:
+        func(counter, target)
+    return counter.probes / len(targets)
+
+
+def measure_time(func, arr, target, budget=0.05):
     """
     Функция для измерения времени
-    Измеряет среднее время выполнения функции поиска.
-    Возвращает время в миллисекундах.
+    Измеряет время выполнения функции поиска измерительным стендом
+    (автоподбор числа повторов под бюджет времени budget, сек).
+    Возвращает медианное время в миллисекундах.
+    """
+    return measure(func, arr, target, budget=budget).median * 1000
+
+
+def run_engines_experiment(sizes, queries=100):
+    """
+    Сравнение алгоритмов поиска (SEARCH_ENGINES) на равномерных,
+    перекошенных (Zipf) и кластеризованных данных.
+    Для каждого алгоритма выводится среднее число проб и время одного поиска (мкс).
+    """
+    print("\nАлгоритмы поиска на разных распределениях (пробы / мкс):")
+    print("{:>10} {:>10}".format("Данные", "Размер") +
+          "".join("{:>22}".format(name) for name in SEARCH_ENGINES))
+    print("-" * (21 + 22 * len(SEARCH_ENGINES)))
+
+    for dist_name, generator in DISTRIBUTIONS.items():
+        for n in sizes:
+            arr = generator(n)
+            targets = random.sample(arr, min(queries, n))  # существующие элементы
+            cells = []
+            for func in SEARCH_ENGINES.values():
+                probes = count_probes(func, arr, targets)
+                time_us = measure_time(func, arr, targets[0]) * 1000
+                cells.append(f"{probes:>10.1f} {time_us:>11.2f}")
+            print(f"{dist_name:>10} {n:>10}" + "".join(cells))
+
+
+def run_bounds_experiment(sizes, queries=1000):
     """
-    total_time = timeit.timeit(lambda: func(arr, target), number=repeats)
-    avg_time_ms = (total_time / repeats) * 1000
-    return avg_time_ms
+    Стоимость запросов границ и диапазонов на массиве с повторами:
+    время одного вызова (мкс) для lower_bound, upper_bound, equal_range,
+    count_range и одного запроса в составе count_range_batch.
+    """
+    names = ["lower_bound", "upper_bound", "equal_range", "count_range", "count_batch"]
+    print("\nЗапросы границ и диапазонов (мкс на запрос, массив с повторами):")
+    print("{:>10}".format("Размер") + "".join("{:>14}".format(name) for name in names))
+    print("-" * (10 + 14 * len(names)))
+
+    for n in sizes:
+        arr = sorted(random.choices(range(n // 4 + 1), k=n))  # в среднем ~4 повтора ключа
+        target = random.choice(arr)
+        low = random.randrange(n // 4)
+        high = low + n // 40 + 1
+        lows = [random.randrange(n // 4) for _ in range(queries)]
+        highs = [x + n // 40 + 1 for x in lows]
+        keys = np.asarray(arr) if np is not None else arr
+
+        times = [
+            measure_time(lower_bound, arr, target),
+            measure_time(upper_bound, arr, target),
+            measure_time(equal_range, arr, target),
+            measure(count_range, arr, low, high, budget=0.05).median * 1000,
+            measure(count_range_batch, keys, lows, highs, budget=0.05).median * 1000 / queries,
+        ]
+        print(f"{n:>10}" + "".join(f"{t * 1000:>14.3f}" for t in times))
+
+
+def run_eytzinger_experiment(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), queries=100000):
+    """
+    Режим бенчмарка SortedIndex (раскладка Эйтцингера) против binary_search и bisect.
+    Для каждого размера выводится среднее время одного запроса (нс).
+    """
+    print(f"Раскладка Эйтцингера ({queries} запросов, нс на запрос):")
+    print("{:>10} {:>15} {:>15} {:>15}".format("Размер", "binary_search",
+                                               "bisect", "SortedIndex"))
+    print("-" * 58)
+
+    for n in sizes:
+        arr = sorted(random.sample(range(n * 2), n))
+        index = SortedIndex(arr)
+        targets = [random.randrange(n * 2) for _ in range(queries)]
+
+        def run_binary():
+            for target in targets:
+                binary_search(arr, target)
+
+        def run_bisect():
+            for target in targets:
+                bisect_left(arr, target)
+
+        def run_index():
+            search = index.search
+            for target in targets:
+                search(target)
+
+        times = [min(timeit.repeat(func, number=1, repeat=3)) / queries * 1e9
+                 for func in (run_binary, run_bisect, run_index)]
+        print(f"{n:>10} {times[0]:>15.1f} {times[1]:>15.1f} {times[2]:>15.1f}")
 
 
-def run_experiment():
+def measure_searches(arr, n):
+    """Замер линейного и бинарного поиска существующего элемента в arr."""
+    target = arr[random.randrange(n)]  # выбираем существующий элемент
+
+    # Замер линейного поиска
+    lin_result = measure(linear_search, arr, target, params={"n": n})
+    # Замер бинарного поиска
+    bin_result = measure(binary_search, arr, target, params={"n": n})
+    return lin_result, bin_result
+
+
+def run_experiment(json_path=None, workers=None, cache_dir=None):
     """
     Функция для подготовки данных и эксперимента
+    json_path — путь для сохранения результатов основного замера в JSON;
+    workers — число процессов для параллельного основного замера
+    (по умолчанию замер последовательный);
+    cache_dir — каталог DatasetCache: массивы основного замера генерируются
+    один раз и далее открываются из кэша через mmap.
     """
     sizes = [1000, 5000, 10000, 50000, 100000, 500000, 1000000]
     linear_times = []
@@ -61,23 +541,60 @@ def run_experiment():
     print("- ОС: Windows 10")
     print("- Python: 3.13.5\n")
 
-    print("{:>10} {:>15} {:>15}".format("Размер", "Линейный поиск (мс)",
-                                        "Бинарный поиск (мс)"))
-    print("-" * 45)
+    print("{:>10} {:>15} {:>10} {:>15} {:>10}".format("Размер", "Линейный поиск (мс)", "IQR",
+                                                      "Бинарный поиск (мс)", "IQR"))
+    print("-" * 67)
+    results = []
 
-    for n in sizes:
-        arr = sorted(random.sample(range(n * 2), n))  # создаём отсортированный массив
-        target = random.choice(arr)  # выбираем существующий элемент
+    cache = DatasetCache(cache_dir) if cache_dir else None
 
-        # Замер линейного поиска
-        lin_time = measure_time(linear_search, arr, target)
-        # Замер бинарного поиска
-        bin_time = measure_time(binary_search, arr, target)
+    if workers:
+        # Ячейки (алгоритм, размер, повтор) считаются в пуле процессов
+        parallel = run_parallel({"linear_search": linear_search,
+                                 "binary_search": binary_search},
+                                sizes, workers=workers)
 
+    for n in sizes:
+        if workers:
+            lin_result = parallel[("linear_search", n)]
+            bin_result = parallel[("binary_search", n)]
+        elif cache_dir:
+            # Массив из кэша, без копирования; файл и mmap закрываются после замера
+            with cache.get(n) as data:
+                lin_result, bin_result = measure_searches(data.keys, n)
+        else:
+            arr = sorted(random.sample(range(n * 2), n))  # создаём отсортированный массив
+            lin_result, bin_result = measure_searches(arr, n)
+        results.extend([lin_result, bin_result])
+
+        lin_time = lin_result.median * 1000
+        bin_time = bin_result.median * 1000
         linear_times.append(lin_time)
         binary_times.append(bin_time)
 
-        print(f"{n:>10} {lin_time:>15.4f} {bin_time:>15.4f}")
+        print(f"{n:>10} {lin_time:>15.4f} {lin_result.iqr * 1000:>10.4f} "
+              f"{bin_time:>15.4f} {bin_result.iqr * 1000:>10.4f}")
+
+    if json_path:
+        save_json(results, json_path)
+        print(f"Результаты сохранены в {json_path}")
+
+    # Пакетный поиск: поштучные вызовы против одного векторного вызова
+    print(f"\nПакетный бинарный поиск ({BATCH_SIZE} запросов, "
+          f"{'NumPy' if np is not None else 'bisect'}):")
+    print("{:>10} {:>20} {:>20} {:>10}".format("Размер", "Поштучно (запр/с)",
+                                              "Пакетно (запр/с)", "Ускорение"))
+    print("-" * 63)
+
+    for n in sizes:
+        arr = sorted(random.sample(range(n * 2), n))
+        targets = [random.randrange(n * 2) for _ in range(BATCH_SIZE)]  # ~половина промахов
+        per_call_qps, batch_qps = measure_batch_throughput(arr, targets)
+        print(f"{n:>10} {per_call_qps:>20.0f} {batch_qps:>20.0f} "
+              f"{batch_qps / per_call_qps:>9.1f}x")
+
+    run_engines_experiment(sizes)
+    run_bounds_experiment(sizes)
 
 
 # Визуализация результатов
@@ -109,4 +626,23 @@ def run_experiment():
 
 
 if __name__ == "__main__":
-    run_experiment()
+    parser = argparse.ArgumentParser(description="Сравнение алгоритмов поиска")
+    parser.add_argument("mode", nargs="?", default="basic",
+                        choices=["basic", "eytzinger", "disk"],
+                        help="basic — основной эксперимент, eytzinger — бенчмарк SortedIndex, "
+                             "disk — поиск по файлам на диске")
+    parser.add_argument("--json", metavar="PATH",
+                        help="сохранить результаты основного замера в JSON")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="выполнить основной замер параллельно в N процессах")
+    parser.add_argument("--cache", metavar="DIR",
+                        help="брать массивы основного замера из кэша DatasetCache в DIR")
+    args = parser.parse_args()
+
+    if args.mode == "eytzinger":
+        run_eytzinger_experiment()
+    elif args.mode == "disk":
+        from disk_search import run_disk_experiment  # disk_search сам импортирует этот модуль
+        run_disk_experiment()
+    else:
+        run_experiment(json_path=args.json, workers=args.workers, cache_dir=args.cache)
@@ -0,0 +1,146 @@
+"""
+Адаптивный диспетчер поиска поверх linear_search/binary_search.
+"""
+import operator
+import time
+from collections import OrderedDict
+from itertools import islice
+
+from search_comparison import (linear_search, binary_search,
+                               interpolation_binary_search, build_first_index)
+
+
+class _ArrayProfile:
+    """Собранные на лету сведения о массиве."""
+
+    def __init__(self, arr):
+        self.arr = arr  # сильная ссылка: id(arr) не будет переиспользован
+        self.length = len(arr)
+        self.is_sorted = None  # определяется лениво
+        self.numeric = None
+        self.queries = 0
+        self.hash_index = None
+
+
+class Searcher:
+    """
+    Единая точка поиска, выбирающая алгоритм по нагрузке:
+
+    - маленький массив (n <= small_threshold)     -> линейный поиск;
+    - отсортированный массив                      -> интерполяционно-бинарный
+      поиск для чисел, бинарный для остальных ключей;
+    - неотсортированный массив, к которому пришло
+      не меньше hash_threshold запросов          -> хеш-индекс, построенный по требованию;
+    - иначе                                       -> линейный поиск.
+
+    Профиль массива (длина, отсортированность, число запросов, хеш-индекс)
+    хранится для max_profiles последних массивов. Изменение длины массива
+    сбрасывает профиль; после изменения элементов на месте нужно вызвать
+    invalidate(arr). Результат всегда совпадает с контрактом linear_search:
+    индекс элемента или -1 (для массивов с повторами — индекс одного из вхождений).
+    """
+
+    PATHS = ("linear", "binary", "interpolation", "hash")
+
+    def __init__(self, small_threshold=32, hash_threshold=8, max_profiles=16):
+        self.small_threshold = small_threshold
+        self.hash_threshold = hash_threshold
+        self.max_profiles = max_profiles
+        self._profiles = OrderedDict()  # id(arr) -> _ArrayProfile, LRU
+        self.calls = dict.fromkeys(self.PATHS, 0)
+        self.total_time = dict.fromkeys(self.PATHS, 0.0)
+
+    def _profile(self, arr):
+        key = id(arr)
+        profile = self._profiles.get(key)
+        if profile is None or profile.arr is not arr or profile.length != len(arr):
+            profile = _ArrayProfile(arr)
+            self._profiles[key] = profile
+            if len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        else:
+            self._profiles.move_to_end(key)
+        return profile
+
+    def invalidate(self, arr):
+        """Забыть профиль массива (после его изменения на месте)."""
+        self._profiles.pop(id(arr), None)
+
+    def _choose(self, profile, arr):
+        """Выбор пути; подготовка (проверка сортировки, индекс) — здесь же."""
+        n = profile.length
+        if n <= self.small_threshold:
+            return "linear"
+
+        if profile.is_sorted is None:  # O(n) один раз на массив
+            profile.is_sorted = all(map(operator.le, arr, islice(arr, 1, None)))
+            profile.numeric = all(isinstance(arr[i], (int, float)) for i in (0, n - 1))
+        if profile.is_sorted:
+            return "interpolation" if profile.numeric else "binary"
+
+        if profile.hash_index is None and profile.queries >= self.hash_threshold:
+            profile.hash_index = build_first_index(arr)  # O(n) один раз
+        return "hash" if profile.hash_index is not None else "linear"
+
+    def search(self, arr, target):
+        """
+        Поиск target в arr выбранным по профилю способом.
+        Возвращает индекс элемента, если найден, иначе -1.
+        """
+        start = time.perf_counter()
+        profile = self._profile(arr)
+        profile.queries += 1
+        path = self._choose(profile, arr)
+
+        if path == "linear":
+            result = linear_search(arr, target)
+        elif path == "binary":
+            result = binary_search(arr, target)
+        elif path == "interpolation":
+            result = interpolation_binary_search(arr, target)
+        else:
+            result = profile.hash_index.get(target, -1)
+
+        self.calls[path] += 1
+        self.total_time[path] += time.perf_counter() - start
+        return result
+
+    def stats(self):
+        """
+        Счётчики путей: число вызовов, суммарное и амортизированное время (сек).
+        Стоимость подготовки (проверка сортировки, построение индекса)
+        входит во время того пути, на котором она произошла.
+        """
+        return {
+            path: {
+                "calls": self.calls[path],
+                "total_time": self.total_time[path],
+                "amortized_time": (self.total_time[path] / self.calls[path]
+                                   if self.calls[path] else 0.0),
+            }
+            for path in self.PATHS
+        }
+
+    def reset_stats(self):
+        """Обнулить счётчики путей (профили массивов сохраняются)."""
+        self.calls = dict.fromkeys(self.PATHS, 0)
+        self.total_time = dict.fromkeys(self.PATHS, 0.0)
+
+
+if __name__ == "__main__":
+    import random
+
+    searcher = Searcher()
+    small = [5, 3, 9, 1]
+    sorted_arr = sorted(random.sample(range(200000), 100000))
+    unsorted_arr = random.sample(range(200000), 100000)
+    hot_keys = random.sample(unsorted_arr, 10)
+
+    for _ in range(1000):
+        searcher.search(small, random.choice(small))
+        searcher.search(sorted_arr, random.choice(sorted_arr))
+        searcher.search(unsorted_arr, random.choice(hot_keys))
+
+    print("{:>15} {:>10} {:>18}".format("Путь", "Вызовов", "Амортизировано (мкс)"))
+    for path, counters in searcher.stats().items():
+        print(f"{path:>15} {counters['calls']:>10} {counters['amortized_time'] * 1e6:>18.2f}")
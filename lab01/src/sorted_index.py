@@ -0,0 +1,116 @@
+"""
+Индекс для многократного поиска в отсортированном массиве
+в порядке Эйтцингера (обход дерева в ширину, BFS-порядок).
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен — без него работает чисто Python-версия
+    np = None
+
+
+class SortedIndex:
+    """
+    Статический индекс над отсортированным списком целых чисел (int64).
+
+    Ключи хранятся в компактном буфере array('q') в порядке Эйтцингера:
+    корень неявного дерева в ячейке 1, потомки узла k — в ячейках 2k и 2k+1.
+    Первые уровни дерева, которые посещает каждый поиск, лежат в памяти рядом,
+    поэтому поиск лучше использует кэш процессора, чем классический
+    бинарный поиск по середине отрезка. Параллельный буфер positions
+    хранит для каждой ячейки индекс ключа в исходном отсортированном списке.
+    """
+
+    def __init__(self, sorted_keys):
+        """
+        Построение индекса по отсортированному списку.
+        Сложность: O(n)
+        """
+        n = len(sorted_keys)
+        self._n = n
+        self._keys = array('q', bytes(8 * (n + 1)))  # ячейка 0 не используется
+        self._positions = array('q', bytes(8 * (n + 1)))
+
+        # Итеративный in-order обход неявного дерева: i-й по порядку узел
+        # получает i-й по величине ключ
+        i = 0
+        k = 1
+        stack = []
+        while stack or k <= n:  # O(n)
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self._keys[k] = sorted_keys[i]
+            self._positions[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def __len__(self):
+        return self._n
+
+    def _descend(self, target):
+        """
+        Спуск по дереву без ветвления на сравнении: k = 2k + (key < target).
+        Возвращает ячейку первого ключа >= target или 0, если такого нет.
+        Сложность: O(log n)
+        """
+        keys = self._keys
+        n = self._n
+        k = 1
+        while k <= n:  # O(log n)
+            k = 2 * k + (keys[k] < target)
+        # Отбрасываем хвост из правых поворотов и последний левый поворот
+        return k >> ((~k) & (k + 1)).bit_length()  # O(1)
+
+    def search(self, target):
+        """
+        Поиск ключа.
+        Возвращает индекс ключа в исходном отсортированном списке, иначе -1.
+        Сложность: O(log n)
+        """
+        k = self._descend(target)
+        if k and self._keys[k] == target:
+            return self._positions[k]
+        return -1
+
+    def lower_bound(self, target):
+        """
+        Индекс первого ключа >= target в исходном списке (len(self), если его нет).
+        Сложность: O(log n)
+        """
+        k = self._descend(target)
+        return self._positions[k] if k else self._n
+
+    def search_batch(self, targets):
+        """
+        Пакетный поиск: все запросы спускаются по дереву одновременно.
+        Возвращает список индексов (как search для каждого запроса).
+        Векторный путь NumPy используется только для целочисленных запросов,
+        помещающихся в int64; остальные (float, большие int, смешанные)
+        обрабатываются поштучно, чтобы не усекать их при приведении типа.
+        Сложность: O(m log n)
+        """
+        if np is None or self._n == 0:
+            return [self.search(target) for target in targets]
+
+        queries = np.asarray(targets)
+        if queries.dtype.kind not in 'iu' or queries.dtype == np.uint64:
+            return [self.search(target) for target in queries.tolist()]  # числа Python
+
+        n = self._n
+        keys = np.frombuffer(self._keys, dtype=np.int64)  # без копирования
+        positions = np.frombuffer(self._positions, dtype=np.int64)
+        queries = queries.astype(np.int64, copy=False)
+
+        k = np.ones(len(queries), dtype=np.int64)
+        for _ in range(n.bit_length()):  # высота дерева
+            active = k <= n
+            step = 2 * k + (keys[np.minimum(k, n)] < queries)
+            k = np.where(active, step, k)
+
+        lowest_zero = ~k & (k + 1)  # младший нулевой бит k
+        k >>= np.log2(lowest_zero).astype(np.int64) + 1
+        found = (k > 0) & (keys[k] == queries)
+        return np.where(found, positions[k], -1).tolist()
@@ -0,0 +1,172 @@
+"""
+Общий измерительный стенд для экспериментов lab00/lab01.
+
+Вместо фиксированного числа повторов timeit стенд сам подбирает число
+вызовов в одном замере под бюджет времени, делает прогрев, по желанию
+отключает сборщик мусора и считает устойчивые статистики
+(медиана, IQR, минимум, доверительный интервал медианы, выбросы).
+Результаты сохраняются в JSON для отслеживания регрессий между версиями.
+
+Стенд используется и вне lab01 — lab00/sum_analysis.py и
+lab02/src/performance_analysis.py. Эти скрипты не меняют sys.path сами:
+каталог lab01/src передаётся через PYTHONPATH, например из lab00:
+    PYTHONPATH=../lab01/src python sum_analysis.py
+"""
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TimingResult:
+    """Результат замера: время одного вызова (сек) в каждом из замеров."""
+    name: str
+    loops: int
+    samples: list
+    params: dict = field(default_factory=dict)
+
+    @property
+    def median(self):
+        return statistics.median(self.samples)
+
+    @property
+    def min(self):
+        return min(self.samples)
+
+    @property
+    def mean(self):
+        return statistics.fmean(self.samples)
+
+    @property
+    def quartiles(self):
+        if len(self.samples) < 2:
+            return self.samples[0], self.samples[0]
+        q1, _, q3 = statistics.quantiles(self.samples, n=4)
+        return q1, q3
+
+    @property
+    def iqr(self):
+        q1, q3 = self.quartiles
+        return q3 - q1
+
+    @property
+    def confidence_interval(self):
+        """
+        95% доверительный интервал медианы по порядковым статистикам
+        (не требует нормальности распределения времени).
+        """
+        ordered = sorted(self.samples)
+        n = len(ordered)
+        half_width = 1.96 * math.sqrt(n) / 2
+        low = max(0, math.floor(n / 2 - half_width))
+        high = min(n - 1, math.ceil(n / 2 + half_width) - 1)
+        return ordered[low], ordered[high]
+
+    @property
+    def outliers(self):
+        """Замеры за пределами границ Тьюки [Q1 - 1.5 IQR, Q3 + 1.5 IQR]."""
+        q1, q3 = self.quartiles
+        spread = 1.5 * (q3 - q1)
+        return [s for s in self.samples if s < q1 - spread or s > q3 + spread]
+
+    def to_dict(self):
+        ci_low, ci_high = self.confidence_interval
+        return {
+            "name": self.name,
+            "params": self.params,
+            "loops": self.loops,
+            "samples": len(self.samples),
+            "median": self.median,
+            "min": self.min,
+            "mean": self.mean,
+            "iqr": self.iqr,
+            "ci95": [ci_low, ci_high],
+            "outliers": len(self.outliers),
+        }
+
+    def __str__(self):
+        ci_low, ci_high = self.confidence_interval
+        return (f"{self.name}: медиана {self.median * 1000:.4f} мс "
+                f"(IQR {self.iqr * 1000:.4f}, min {self.min * 1000:.4f}, "
+                f"95% ДИ [{ci_low * 1000:.4f}; {ci_high * 1000:.4f}], "
+                f"выбросов {len(self.outliers)}/{len(self.samples)})")
+
+
+def _run(func, args, loops):
+    """Время выполнения loops вызовов func(*args), сек."""
+    start = time.perf_counter()
+    for _ in range(loops):
+        func(*args)
+    return time.perf_counter() - start
+
+
+def calibrate_loops(func, args, sample_time):
+    """
+    Подбирает число вызовов в одном замере (1, 2, 5, 10, 20, 50, ...),
+    чтобы замер длился не меньше sample_time секунд.
+    Возвращает (loops, время одного вызова в сек).
+    """
+    loops = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = loops * multiplier
+            elapsed = _run(func, args, number)
+            if elapsed >= sample_time:
+                return number, elapsed / number
+        loops *= 10
+
+
+def measure(func, *args, name=None, params=None, budget=0.2, min_samples=5,
+            max_samples=50, warmup=1, disable_gc=True):
+    """
+    Измеряет время одного вызова func(*args).
+
+    budget      — примерный бюджет времени на все замеры (сек);
+    min_samples — минимум замеров, даже если один вызов дольше бюджета;
+    max_samples — максимум замеров для быстрых функций;
+    warmup      — число прогревочных вызовов перед калибровкой;
+    disable_gc  — отключать ли сборщик мусора на время замеров.
+    """
+    for _ in range(warmup):
+        func(*args)
+
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.disable()
+    try:
+        loops, per_call = calibrate_loops(func, args, budget / max_samples)
+        count = int(budget / (per_call * loops))
+        count = max(min_samples, min(max_samples, count))
+        samples = [_run(func, args, loops) / loops for _ in range(count)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return TimingResult(name=name or getattr(func, "__name__", "func"),
+                        loops=loops, samples=samples, params=params or {})
+
+
+def environment():
+    """Описание окружения для сопоставления результатов разных запусков."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def save_json(results, path):
+    """Сохраняет список TimingResult вместе с описанием окружения в JSON-файл."""
+    report = {
+        "environment": environment(),
+        "results": [result.to_dict() for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
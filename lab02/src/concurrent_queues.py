@@ -0,0 +1,356 @@
+"""
+Очереди для обмена задачами между производителями и потребителями,
+построенные на узлах связного списка из linked_list.py.
+
+LinkedQueue      — потокобезопасная MPMC-очередь (несколько производителей
+                   и потребителей) по схеме Майкла–Скотта с двумя блокировками:
+                   производители берут только блокировку хвоста, потребители —
+                   только блокировку головы, поэтому они не мешают друг другу.
+AsyncLinkedQueue — очередь для asyncio поверх LinkedList.
+"""
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+from linked_list import LinkedList, SlottedNode
+
+
+class LinkedQueue:
+    """
+    Потокобезопасная очередь на связном списке с фиктивным головным узлом.
+    maxsize <= 0 — неограниченная очередь. Ошибки — queue.Full/queue.Empty,
+    как у стандартной queue.Queue.
+
+    В быстром пути производитель берёт только блокировку хвоста, потребитель —
+    только блокировку головы. Условные переменные используются лишь тогда,
+    когда кто-то действительно ждёт: счётчики ожидающих проверяются после
+    публикации узла/освобождения места, поэтому пробуждение не теряется.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._head = self._tail = SlottedNode(None)  # фиктивный узел
+        self._head_lock = threading.Lock()  # для потребителей
+        self._tail_lock = threading.Lock()  # для производителей
+        self._not_empty = threading.Condition(self._head_lock)
+        self._not_full = threading.Condition(self._tail_lock)
+        self._puts = 0  # меняется только под блокировкой хвоста
+        self._gets = 0  # меняется только под блокировкой головы
+        self._waiting_getters = 0
+        self._waiting_putters = 0
+
+    def qsize(self):
+        return self._puts - self._gets  # приблизительно, как у queue.Queue
+
+    def empty(self):
+        return self._head.next is None
+
+    @staticmethod
+    def _remaining(deadline):
+        return None if deadline is None else deadline - time.monotonic()
+
+    def _free_slots(self, wanted, block, deadline):
+        """
+        Ждёт (под блокировкой хвоста) хотя бы одно свободное место и
+        возвращает, сколько из wanted элементов можно добавить сейчас.
+        """
+        if self.maxsize <= 0:
+            return wanted
+        while True:
+            free = self.maxsize - (self._puts - self._gets)
+            if free > 0:
+                return min(free, wanted)
+            remaining = self._remaining(deadline)
+            if not block or (remaining is not None and remaining <= 0):
+                raise queue.Full
+            self._waiting_putters += 1
+            try:
+                if self.maxsize - (self._puts - self._gets) <= 0:  # повторная проверка
+                    self._not_full.wait(remaining)
+            finally:
+                self._waiting_putters -= 1
+
+    def _put_chunks(self, items, block, timeout):
+        deadline = None if not block or timeout is None else time.monotonic() + timeout
+        # Цепочка узлов строится и связывается вне блокировки
+        nodes = [SlottedNode(item) for item in items]
+        for node, following in zip(nodes, nodes[1:]):
+            node.next = following
+        i = 0
+        while i < len(nodes):
+            with self._tail_lock:
+                count = self._free_slots(len(nodes) - i, block, deadline)
+                last = nodes[i + count - 1]
+                last.next = None  # O(1): цепочка обрезается по свободному месту
+                self._tail.next = nodes[i]  # публикация цепочки
+                self._tail = last
+                self._puts += count
+            i += count
+            if self._waiting_getters:  # будим потребителей, только если они ждут
+                with self._not_empty:
+                    self._not_empty.notify(count)
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Добавление элемента в конец очереди.
+        Сложность: O(1)
+        """
+        self._put_chunks([item], block, timeout)
+
+    def put_many(self, items, block=True, timeout=None):
+        """
+        Пакетное добавление: элементы присоединяются цепочками за одно
+        взятие блокировки (размер цепочки ограничен свободным местом).
+        При queue.Full часть элементов может быть уже добавлена.
+        Сложность: O(k)
+        """
+        self._put_chunks(list(items), block, timeout)
+
+    def _take(self, k, block, timeout):
+        """Снимает с головы от 1 до k элементов."""
+        deadline = None if not block or timeout is None else time.monotonic() + timeout
+        result = []
+        with self._head_lock:
+            while self._head.next is None:
+                remaining = self._remaining(deadline)
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Empty
+                self._waiting_getters += 1
+                try:
+                    if self._head.next is None:  # повторная проверка
+                        self._not_empty.wait(remaining)
+                finally:
+                    self._waiting_getters -= 1
+
+            head = self._head
+            while len(result) < k and head.next is not None:
+                head = head.next
+                result.append(head.data)
+                head.data = None  # узел становится новым фиктивным
+            self._head = head
+            self._gets += len(result)
+        if self._waiting_putters:  # будим производителей, только если они ждут
+            with self._not_full:
+                self._not_full.notify(len(result))
+        return result
+
+    def get(self, block=True, timeout=None):
+        """
+        Извлечение элемента из начала очереди.
+        Сложность: O(1)
+        """
+        return self._take(1, block, timeout)[0]
+
+    def get_many(self, k, block=True, timeout=None):
+        """
+        Пакетное извлечение: ждёт хотя бы один элемент и забирает
+        до k уже готовых элементов за одно взятие блокировки.
+        При k <= 0 сразу возвращает пустой список, не трогая очередь.
+        Сложность: O(k)
+        """
+        if k <= 0:
+            return []
+        return self._take(k, block, timeout)
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+
+class AsyncLinkedQueue:
+    """
+    Очередь для asyncio на LinkedList. Все операции выполняются в одном
+    цикле событий, поэтому блокировки не нужны; ожидающие производители и
+    потребители хранятся в очередях future, как в asyncio.Queue.
+    maxsize <= 0 — неограниченная очередь.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._items = LinkedList()
+        self._getters = deque()
+        self._putters = deque()
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return len(self._items) == 0
+
+    def full(self):
+        return 0 < self.maxsize <= len(self._items)
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, still_waiting):
+        """Ожидание, пока still_waiting() не станет ложным."""
+        while still_waiting():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not still_waiting() and not waiter.cancelled():
+                    self._wakeup_next(waiters)  # передаём пробуждение дальше
+                raise
+
+    def put_nowait(self, item):
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.insert_at_end(item)  # O(1)
+        self._wakeup_next(self._getters)
+
+    def get_nowait(self):
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._items.delete_from_start()  # O(1)
+        self._wakeup_next(self._putters)
+        return item
+
+    async def put(self, item):
+        await self._wait(self._putters, self.full)
+        self.put_nowait(item)
+
+    async def get(self):
+        await self._wait(self._getters, self.empty)
+        return self.get_nowait()
+
+    async def put_many(self, items):
+        """Пакетное добавление: ожидание только при заполненной очереди."""
+        for item in items:
+            if self.full():
+                await self._wait(self._putters, self.full)
+            self.put_nowait(item)
+
+    async def get_many(self, k):
+        """
+        Ждёт хотя бы один элемент и забирает до k готовых элементов.
+        При k <= 0 сразу возвращает пустой список, не трогая очередь.
+        """
+        if k <= 0:
+            return []
+        result = [await self.get()]
+        while len(result) < k and not self.empty():
+            result.append(self.get_nowait())
+        return result
+
+
+# ------------------ Бенчмарк ------------------
+
+class _DequeQueue:
+    """collections.deque как очередь: append/popleft атомарны, ожидание — опросом."""
+
+    def __init__(self):
+        self._deque = deque()
+
+    def put(self, item):
+        self._deque.append(item)
+
+    def get(self):
+        while True:
+            try:
+                return self._deque.popleft()
+            except IndexError:
+                time.sleep(0)  # уступаем GIL производителям
+
+
+def _run_threads(q, producers, consumers, items, batch):
+    """Время передачи items элементов от producers потоков к consumers потокам."""
+    per_producer = items // producers
+    stop = object()
+
+    def produce():
+        if batch > 1:
+            for start in range(0, per_producer, batch):
+                q.put_many(range(start, min(start + batch, per_producer)))
+        else:
+            for i in range(per_producer):
+                q.put(i)
+
+    def consume():
+        while True:
+            got = q.get_many(batch) if batch > 1 else [q.get()]
+            stops = sum(item is stop for item in got)
+            if stops:
+                for _ in range(stops - 1):  # чужие стоп-сигналы возвращаем в очередь
+                    q.put(stop)
+                return
+
+    workers = [threading.Thread(target=produce) for _ in range(producers)]
+    readers = [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for thread in workers + readers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    for _ in readers:
+        q.put(stop)
+    for thread in readers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+async def _run_async(q, producers, consumers, items):
+    per_producer = items // producers
+    stop = object()
+
+    async def produce():
+        for i in range(per_producer):
+            await q.put(i)
+
+    async def consume():
+        while await q.get() is not stop:
+            pass
+
+    start = time.perf_counter()
+    readers = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    for _ in readers:
+        await q.put(stop)
+    await asyncio.gather(*readers)
+    return time.perf_counter() - start
+
+
+def run_benchmark(items=200000, configs=((1, 1), (4, 4), (8, 2)), maxsize=1024):
+    """Пропускная способность (элементов/с) при N производителях и M потребителях."""
+    print(f"Потоки: {items} элементов, ограничение очереди {maxsize}")
+    for producers, consumers in configs:
+        results = {
+            "queue.Queue": _run_threads(queue.Queue(maxsize), producers, consumers, items, 1),
+            "deque": _run_threads(_DequeQueue(), producers, consumers, items, 1),
+            "LinkedQueue": _run_threads(LinkedQueue(maxsize), producers, consumers, items, 1),
+            "LinkedQueue (пакеты 64)": _run_threads(LinkedQueue(maxsize), producers,
+                                                    consumers, items, 64),
+        }
+        row = ", ".join(f"{name}: {items / t:.0f}" for name, t in results.items())
+        print(f"  {producers}P/{consumers}C -> {row}")
+
+    print(f"asyncio: {items} элементов, ограничение очереди {maxsize}")
+    for producers, consumers in configs:
+        results = {
+            "asyncio.Queue": asyncio.run(_run_async(asyncio.Queue(maxsize), producers,
+                                                    consumers, items)),
+            "AsyncLinkedQueue": asyncio.run(_run_async(AsyncLinkedQueue(maxsize), producers,
+                                                       consumers, items)),
+        }
+        row = ", ".join(f"{name}: {items / t:.0f}" for name, t in results.items())
+        print(f"  {producers}P/{consumers}C -> {row}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,3 +1,7 @@
+from array import array
+from itertools import chain, islice
+
+
 class Node:
     """Класс узла связного списка"""
     def __init__(self, data):
@@ -6,34 +10,52 @@ class Node:
         #  O(1) - создание узла занимает постоянное время
 
 
+class SlottedNode:
+    """Узел связного списка без __dict__: атрибуты хранятся в __slots__"""
+    __slots__ = ("data", "next")
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        #  O(1) - создание узла занимает постоянное время
+
+
 class LinkedList:
     """Односвязный список с поддержкой хвоста для O(1) вставки в конец"""
+    node_class = Node  # класс узлов; подклассы могут заменить его
+
     def __init__(self):
         self.head = None
         self.tail = None
+        self._size = 0
         #  O(1) - инициализация пустого списка
 
+    def __len__(self):
+        return self._size  # O(1) - размер поддерживается при каждой операции
+
     def insert_at_start(self, data):
         """
         Вставка в начало списка        
         """
-        new_node = Node(data)  # O(1)
+        new_node = self.node_class(data)  # O(1)
         new_node.next = self.head  # O(1)
         self.head = new_node  # O(1)
         if self.tail is None:  # O(1)
             self.tail = new_node  # O(1)
+        self._size += 1  # O(1)
         #  O(1) - вставка всегда занимает постоянное время
 
     def insert_at_end(self, data):
         """
         Вставка в конец списка        
         """
-        new_node = Node(data)  # O(1)
+        new_node = self.node_class(data)  # O(1)
         if self.tail:  # O(1)
             self.tail.next = new_node  # O(1)
             self.tail = new_node  # O(1)
         else:  # список пустой
             self.head = self.tail = new_node  # O(1)
+        self._size += 1  # O(1)
         #  O(1) - благодаря хранению tail указателя вставка в конец постоянна
 
     def delete_from_start(self):
@@ -46,6 +68,7 @@ class LinkedList:
         self.head = self.head.next  # O(1)
         if self.head is None:  # O(1)
             self.tail = None  # O(1)
+        self._size -= 1  # O(1)
         return removed_data  # O(1)
         #  O(1) - всегда удаляем первый элемент, не нужно проходить список
 
@@ -61,6 +84,538 @@ class LinkedList:
         return elements  # O(1)
         #  O(n) - нужно пройти весь список из n элементов
 
+    def __iter__(self):
+        """
+        Ленивый обход: элементы выдаются по одному, список не создаётся
+        """
+        current = self.head  # O(1)
+        while current:  # O(n) - но память O(1)
+            yield current.data
+            current = current.next
+
+    def window(self, start, stop=None):
+        """
+        Окно элементов [start, stop) в стиле itertools.islice, без копирования списка
+        """
+        return islice(self, start, stop)  # O(stop)
+
+    def drain(self, k=None):
+        """
+        Потоковое извлечение до k элементов из начала (все, если k=None):
+        каждый элемент удаляется из списка в момент выдачи
+        """
+        count = len(self) if k is None else min(k, len(self))
+        for _ in range(count):  # O(k)
+            yield self.delete_from_start()
+
+
+class SlottedLinkedList(LinkedList):
+    """LinkedList на узлах SlottedNode — меньше памяти на каждый узел"""
+    node_class = SlottedNode
+
+
+class PooledLinkedList:
+    """
+    Односвязный список на параллельных массивах с пулом свободных ячеек.
+    Вместо объектов Node данные хранятся в списке _data, а ссылки «next» —
+    целыми индексами в компактном array('q') _next (-1 означает None).
+    Ячейки, освобождённые delete_from_start, попадают в free-list и
+    переиспользуются следующими вставками, поэтому очередь с постоянным
+    оборотом элементов не создаёт новых объектов и не нагружает сборщик мусора.
+    Публичный интерфейс совпадает с LinkedList, кроме узлов: индексы
+    первой и последней ячеек (_head, _tail) внутренние, элементы
+    перебираются через итерацию или traversal().
+    """
+    def __init__(self, capacity=16):
+        capacity = max(1, capacity)
+        self._data = [None] * capacity  # O(capacity)
+        self._next = array('q', range(1, capacity + 1))  # все ячейки — в free-list
+        self._next[capacity - 1] = -1
+        self._free = 0  # голова списка свободных ячеек
+        self._head = -1
+        self._tail = -1
+        self._size = 0
+        #  O(capacity) - предварительное выделение пула
+
+    def __len__(self):
+        return self._size  # O(1)
+
+    def _grow(self):
+        """Удвоение пула, новые ячейки добавляются в free-list"""
+        old = len(self._data)
+        new = old * 2
+        self._data.extend([None] * old)  # O(old)
+        self._next.extend(range(old + 1, new + 1))  # O(old)
+        self._next[new - 1] = -1
+        self._free = old
+        #  O(n), но амортизированно O(1) на вставку
+
+    def _allocate(self, data):
+        """Взять ячейку из free-list"""
+        if self._free == -1:  # O(1)
+            self._grow()  # амортизированно O(1)
+        slot = self._free  # O(1)
+        self._free = self._next[slot]  # O(1)
+        self._data[slot] = data  # O(1)
+        self._next[slot] = -1  # O(1)
+        return slot
+
+    def insert_at_start(self, data):
+        """
+        Вставка в начало списка
+        """
+        slot = self._allocate(data)  # O(1) амортизированно
+        self._next[slot] = self._head  # O(1)
+        self._head = slot  # O(1)
+        if self._tail == -1:  # O(1)
+            self._tail = slot  # O(1)
+        self._size += 1  # O(1)
+        #  O(1) амортизированно
+
+    def insert_at_end(self, data):
+        """
+        Вставка в конец списка
+        """
+        slot = self._allocate(data)  # O(1) амортизированно
+        if self._tail != -1:  # O(1)
+            self._next[self._tail] = slot  # O(1)
+            self._tail = slot  # O(1)
+        else:  # список пустой
+            self._head = self._tail = slot  # O(1)
+        self._size += 1  # O(1)
+        #  O(1) амортизированно
+
+    def delete_from_start(self):
+        """
+        Удаление из начала списка, ячейка возвращается в пул
+        """
+        if self._head == -1:  # O(1)
+            return None
+        slot = self._head  # O(1)
+        removed_data = self._data[slot]  # O(1)
+        self._data[slot] = None  # O(1) - не удерживаем ссылку на данные
+        self._head = self._next[slot]  # O(1)
+        self._next[slot] = self._free  # O(1) - ячейка в начало free-list
+        self._free = slot  # O(1)
+        if self._head == -1:  # O(1)
+            self._tail = -1  # O(1)
+        self._size -= 1  # O(1)
+        return removed_data  # O(1)
+        #  O(1)
+
+    def traversal(self):
+        """
+        Обход списка
+        """
+        elements = []  # O(1)
+        data = self._data
+        next_ = self._next
+        current = self._head  # O(1)
+        while current != -1:  # O(n) - проход по всем элементам
+            elements.append(data[current])  # O(1) на каждый элемент
+            current = next_[current]  # O(1) на каждый элемент
+        return elements  # O(1)
+        #  O(n) - нужно пройти весь список из n элементов
+
+    def __iter__(self):
+        """
+        Ленивый обход без создания списка
+        """
+        data = self._data
+        next_ = self._next
+        current = self._head
+        while current != -1:  # O(n) - но память O(1)
+            yield data[current]
+            current = next_[current]
+
+    def window(self, start, stop=None):
+        """
+        Окно элементов [start, stop) в стиле itertools.islice
+        """
+        return islice(self, start, stop)  # O(stop)
+
+    def drain(self, k=None):
+        """
+        Потоковое извлечение до k элементов из начала (все, если k=None)
+        """
+        count = len(self) if k is None else min(k, len(self))
+        for _ in range(count):  # O(k)
+            yield self.delete_from_start()
+
+
+class _Chunk:
+    """Узел развёрнутого списка: массив фиксированной ёмкости и границы [start, end)"""
+    __slots__ = ("items", "start", "end", "next")
+
+    def __init__(self, capacity, position):
+        self.items = [None] * capacity  # O(capacity)
+        self.start = position
+        self.end = position
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    Развёрнутый (unrolled) связный список: каждый узел хранит до capacity
+    элементов в массиве, поэтому на элемент приходится в capacity раз меньше
+    узлов и переходов по ссылкам. Поддерживает тот же интерфейс, что LinkedList,
+    а также пакетные extend/pop_many и ленивую итерацию без создания списка.
+    """
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self._size = 0
+        #  O(1) - инициализация пустого списка
+
+    def __len__(self):
+        return self._size  # O(1)
+
+    def insert_at_start(self, data):
+        """
+        Вставка в начало списка
+        """
+        head = self.head
+        if head is None or head.start == 0:  # O(1) - нет места перед первым элементом
+            head = _Chunk(self.capacity, self.capacity)  # заполняется справа налево
+            head.next = self.head
+            self.head = head
+            if self.tail is None:
+                self.tail = head
+        head.start -= 1  # O(1)
+        head.items[head.start] = data  # O(1)
+        self._size += 1
+        #  O(1) - новый узел создаётся раз в capacity вставок
+
+    def insert_at_end(self, data):
+        """
+        Вставка в конец списка
+        """
+        tail = self.tail
+        if tail is None or tail.end == self.capacity:  # O(1) - узел заполнен
+            self._append_chunk()
+            tail = self.tail
+        tail.items[tail.end] = data  # O(1)
+        tail.end += 1  # O(1)
+        self._size += 1
+        #  O(1) - новый узел создаётся раз в capacity вставок
+
+    def _append_chunk(self):
+        """Добавление пустого узла в конец списка"""
+        chunk = _Chunk(self.capacity, 0)
+        if self.tail is None:
+            self.head = self.tail = chunk
+        else:
+            self.tail.next = chunk
+            self.tail = chunk
+
+    def extend(self, iterable):
+        """
+        Пакетная вставка в конец: элементы копируются в узлы срезами
+        """
+        it = iter(iterable)
+        while True:
+            tail = self.tail
+            if tail is None or tail.end == self.capacity:
+                batch = list(islice(it, self.capacity))  # O(capacity) на C
+                if not batch:
+                    break
+                self._append_chunk()
+                tail = self.tail
+            else:
+                batch = list(islice(it, self.capacity - tail.end))
+                if not batch:
+                    break
+            tail.items[tail.end:tail.end + len(batch)] = batch  # O(len(batch)) на C
+            tail.end += len(batch)
+            self._size += len(batch)
+        #  O(k) для k элементов, но без вызова метода на каждый элемент
+
+    def delete_from_start(self):
+        """
+        Удаление из начала списка
+        """
+        head = self.head
+        if head is None:  # O(1)
+            return None
+        removed_data = head.items[head.start]  # O(1)
+        head.items[head.start] = None  # O(1) - не удерживаем ссылку на данные
+        head.start += 1  # O(1)
+        self._size -= 1
+        if head.start == head.end:  # O(1) - узел опустел
+            self.head = head.next
+            if self.head is None:
+                self.tail = None
+        return removed_data  # O(1)
+        #  O(1)
+
+    def pop_many(self, k):
+        """
+        Пакетное удаление до k элементов из начала списка.
+        Возвращает список удалённых элементов в порядке очереди.
+        """
+        removed = []
+        while k > 0 and self.head is not None:
+            head = self.head
+            take = min(k, head.end - head.start)
+            stop = head.start + take
+            removed.extend(head.items[head.start:stop])  # O(take) на C
+            head.items[head.start:stop] = [None] * take
+            head.start = stop
+            self._size -= take
+            k -= take
+            if head.start == head.end:
+                self.head = head.next
+                if self.head is None:
+                    self.tail = None
+        return removed
+        #  O(k)
+
+    def _chunks(self):
+        chunk = self.head
+        while chunk is not None:  # O(n / capacity) переходов по ссылкам
+            yield chunk
+            chunk = chunk.next
+
+    def __iter__(self):
+        """Ленивый обход без создания промежуточного списка"""
+        # Элементы внутри узла перебираются на C (islice), Python-код — только на узел
+        return chain.from_iterable(islice(chunk.items, chunk.start, chunk.end)
+                                   for chunk in self._chunks())
+
+    def window(self, start, stop=None):
+        """
+        Окно элементов [start, stop) в стиле itertools.islice
+        """
+        return islice(self, start, stop)  # O(stop)
+
+    def drain(self, k=None):
+        """
+        Потоковое извлечение до k элементов из начала (все, если k=None);
+        элементы снимаются пакетами по одному узлу
+        """
+        remaining = len(self) if k is None else min(k, len(self))
+        while remaining > 0:  # O(k)
+            batch = self.pop_many(min(remaining, self.capacity))
+            remaining -= len(batch)
+            yield from batch
+
+    def traversal(self):
+        """
+        Обход списка
+        """
+        return list(self)  # O(n)
+
+
+class DoublyNode:
+    """Узел двусвязного списка; служит и дескриптором элемента"""
+    __slots__ = ("key", "data", "prev", "next")
+
+    def __init__(self, key, data):
+        self.key = key
+        self.data = data
+        self.prev = None
+        self.next = None
+
+
+class DoublyLinkedList:
+    """
+    Двусвязный список с фиктивным узлом-кольцом (без проверок на None).
+    Вставки возвращают узел-дескриптор, по которому удаление и перенос
+    выполняются за O(1). Операции по ключу (find, remove, move_to_front;
+    ключ по умолчанию — сами данные) при indexed=False ищут узел линейно,
+    как LinkedList, и допускают повторяющиеся значения. При indexed=True
+    поддерживается словарь ключ -> узел: операции по ключу — O(1), но ключи
+    должны быть уникальны. Общие методы совпадают с LinkedList.
+    """
+    def __init__(self, indexed=False):
+        self._root = DoublyNode(None, None)  # фиктивный узел: root.next — голова, root.prev — хвост
+        self._root.prev = self._root.next = self._root
+        self._index = {} if indexed else None
+        self._size = 0
+        #  O(1)
+
+    def __len__(self):
+        return self._size  # O(1)
+
+    def __contains__(self, key):
+        return self.find(key) is not None  # O(1) с индексом, иначе O(n)
+
+    @property
+    def head(self):
+        node = self._root.next
+        return None if node is self._root else node
+
+    @property
+    def tail(self):
+        node = self._root.prev
+        return None if node is self._root else node
+
+    def _link_after(self, anchor, node):
+        node.prev = anchor  # O(1)
+        node.next = anchor.next
+        anchor.next.prev = node
+        anchor.next = node
+
+    def _unlink(self, node):
+        node.prev.next = node.next  # O(1)
+        node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def _insert(self, anchor, data, key):
+        key = data if key is None else key
+        if self._index is not None:
+            if key in self._index:
+                raise KeyError(f"Ключ {key!r} уже есть в списке")
+        node = DoublyNode(key, data)
+        self._link_after(anchor, node)
+        if self._index is not None:
+            self._index[key] = node
+        self._size += 1
+        return node
+
+    def insert_at_start(self, data, key=None):
+        """
+        Вставка в начало списка, возвращает узел-дескриптор
+        """
+        return self._insert(self._root, data, key)  # O(1)
+
+    def insert_at_end(self, data, key=None):
+        """
+        Вставка в конец списка, возвращает узел-дескриптор
+        """
+        return self._insert(self._root.prev, data, key)  # O(1)
+
+    def get_node(self, key):
+        """Узел по ключу (KeyError, если ключа нет)"""
+        node = self.find(key)
+        if node is None:
+            raise KeyError(key)
+        return node
+
+    def find(self, key):
+        """Узел по ключу или None (без индекса — первый узел с этим ключом)"""
+        if self._index is not None:
+            return self._index.get(key)  # O(1)
+        root = self._root
+        node = root.next
+        while node is not root:  # O(n)
+            if node.key == key:
+                return node
+            node = node.next
+        return None
+
+    def remove_node(self, node):
+        """
+        Удаление произвольного элемента по дескриптору
+        """
+        self._unlink(node)  # O(1)
+        if self._index is not None:
+            del self._index[node.key]
+        self._size -= 1
+        return node.data
+
+    def remove(self, key):
+        """
+        Удаление элемента по ключу, возвращает данные (KeyError, если ключа нет)
+        """
+        return self.remove_node(self.get_node(key))  # O(1) с индексом, иначе O(n)
+
+    def move_node_to_front(self, node):
+        """Перенос элемента в начало по дескриптору"""
+        if self._root.next is not node:  # O(1)
+            self._unlink(node)
+            self._link_after(self._root, node)
+
+    def move_to_front(self, key):
+        """
+        Перенос элемента в начало по ключу (KeyError, если ключа нет)
+        """
+        self.move_node_to_front(self.get_node(key))  # O(1) с индексом, иначе O(n)
+
+    def delete_from_start(self):
+        """
+        Удаление из начала списка
+        """
+        node = self.head
+        return None if node is None else self.remove_node(node)  # O(1)
+
+    def pop_back(self):
+        """
+        Удаление из конца списка
+        """
+        node = self.tail
+        return None if node is None else self.remove_node(node)  # O(1)
+
+    def __iter__(self):
+        """
+        Ленивый обход от головы к хвосту
+        """
+        root = self._root
+        node = root.next
+        while node is not root:  # O(n) - память O(1)
+            yield node.data
+            node = node.next
+
+    def window(self, start, stop=None):
+        """
+        Ленивый срез данных [start, stop) без копирования списка
+        Сложность: O(stop) на полный обход среза
+        """
+        return islice(self, start, stop)  # O(stop)
+
+    def drain(self, k=None):
+        """
+        Ленивое извлечение до k элементов из начала (все, если k не задан)
+        Сложность: O(1) на элемент, O(k) всего
+        """
+        count = len(self) if k is None else min(k, len(self))
+        for _ in range(count):  # O(k)
+            yield self.delete_from_start()
+
+    def traversal(self):
+        """
+        Обход списка
+        """
+        return list(self)  # O(n)
+
+
+class LRUCache:
+    """
+    LRU-кэш на DoublyLinkedList: недавно использованные элементы — в начале
+    списка, при переполнении вытесняется хвост. Все операции O(1).
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._list = DoublyLinkedList(indexed=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._list)
+
+    def __contains__(self, key):
+        return key in self._list
+
+    def get(self, key, default=None):
+        node = self._list.find(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self._list.move_node_to_front(node)  # O(1)
+        self.hits += 1
+        return node.data
+
+    def put(self, key, value):
+        node = self._list.find(key)
+        if node is not None:
+            node.data = value
+            self._list.move_node_to_front(node)  # O(1)
+            return
+        self._list.insert_at_start(value, key)
+        if len(self._list) > self.capacity:
+            self._list.remove_node(self._list.tail)  # вытеснение за O(1)
+
 
 if __name__ == "__main__":
     # Простой тест
@@ -70,4 +625,19 @@ if __name__ == "__main__":
     ll.insert_at_end(3)
     print("Содержимое списка:", ll.traversal())
     ll.delete_from_start()
-    print("После удаления с начала:", ll.traversal())
\ No newline at end of file
+    print("После удаления с начала:", ll.traversal())
+
+    pll = PooledLinkedList()
+    pll.insert_at_start(1)
+    pll.insert_at_start(2)
+    pll.insert_at_end(3)
+    print("PooledLinkedList:", pll.traversal())
+    pll.delete_from_start()
+    print("После удаления с начала:", pll.traversal())
+
+    lru = LRUCache(2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.get("a")
+    lru.put("c", 3)  # вытесняет "b"
+    print("LRUCache:", "b" in lru, lru.get("a"), lru.get("c"))
@@ -0,0 +1,109 @@
+"""
+Учёт памяти узловых структур данных (tracemalloc).
+
+Для каждой структуры измеряется, сколько байт памяти приходится на один
+элемент: обычные узлы с __dict__ против вариантов с __slots__
+(lab02 Node, lab06 TreeNode, lab07 PriorityItem, lab08 HuffmanNode).
+"""
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+from linked_list import LinkedList, SlottedLinkedList, PooledLinkedList
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+
+
+def bytes_per_element(build, values):
+    """
+    Память (байт на элемент), которую выделяет build(values).
+    Значения создаются заранее и в замер не входят — учитываются
+    только узлы и служебные объекты самой структуры.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build(values)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return (after - before) / len(values)
+
+
+def build_linked_list(cls):
+    def build(values):
+        ll = cls()
+        for value in values:
+            ll.insert_at_end(value)
+        return ll
+    return build
+
+
+def _import_lab(lab):
+    """Добавляет lab/src соседней лабораторной в sys.path."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", lab, "src")
+    if path not in sys.path:
+        sys.path.append(path)
+
+
+def structures():
+    """Список (название, построитель структуры из списка значений)."""
+    _import_lab("lab06")
+    _import_lab("lab07")
+    _import_lab("lab08")
+    from binary_search_tree import BinarySearchTree, SlottedBinarySearchTree
+    from priority_queue import PriorityQueue, SlottedPriorityQueue
+    from greedy_algorithms import HuffmanNode, SlottedHuffmanNode, build_huffman_tree
+
+    def build_tree(cls):
+        def build(values):
+            tree = cls()
+            for value in values:
+                tree.insert(value)
+            return tree
+        return build
+
+    def build_queue(cls):
+        def build(values):
+            pq = cls()
+            for value in values:
+                pq.enqueue(value, value)
+            return pq
+        return build
+
+    def build_huffman(node_class):
+        def build(values):
+            return build_huffman_tree(dict(zip(values, values)), node_class=node_class)
+        return build
+
+    return [
+        ("LinkedList (Node)", build_linked_list(LinkedList)),
+        ("LinkedList (SlottedNode)", build_linked_list(SlottedLinkedList)),
+        ("PooledLinkedList", build_linked_list(PooledLinkedList)),
+        ("BST (TreeNode)", build_tree(BinarySearchTree)),
+        ("BST (SlottedTreeNode)", build_tree(SlottedBinarySearchTree)),
+        ("PriorityQueue (PriorityItem)", build_queue(PriorityQueue)),
+        ("PriorityQueue (SlottedPriorityItem)", build_queue(SlottedPriorityQueue)),
+        ("Huffman (HuffmanNode)", build_huffman(HuffmanNode)),
+        ("Huffman (SlottedHuffmanNode)", build_huffman(SlottedHuffmanNode)),
+    ]
+
+
+def main(sizes=SIZES):
+    print("Память на элемент (байт):")
+    print("{:>38}".format("Структура") + "".join("{:>12}".format(n) for n in sizes))
+    print("-" * (38 + 12 * len(sizes)))
+
+    for name, build in structures():
+        cells = []
+        for n in sizes:
+            values = list(range(n))
+            random.shuffle(values)  # случайный порядок — сбалансированное BST
+            cells.append(f"{bytes_per_element(build, values):>12.1f}")
+        print(f"{name:>38}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,95 +1,478 @@
-import timeit
-from collections import deque
-import matplotlib.pyplot as plt
-from linked_list import LinkedList
+"""
+Набор бенчмарков структур данных lab02.
 
-REPEAT = 10  # количество повторов для timeit
-sizes = [100, 500, 1000, 2000, 5000]  # размеры теста
+Операции: вставка в начало, вставка в конец, удаление из начала, обход и
+очередь с оборотом — для list, deque, LinkedList, PooledLinkedList,
+UnrolledLinkedList и DoublyLinkedList; удаление произвольных элементов
+(list.remove против DoublyLinkedList.remove) и LRU-кэш (OrderedDict против
+LRUCache на DoublyLinkedList). Для каждой пары (операция, структура, n) выводятся
+операций/с, пиковая память (tracemalloc) и число блоков памяти на операцию
+(sys.getallocatedblocks). Результаты сохраняются в JSON и сравниваются с
+сохранённым базовым прогоном.
 
-# ------------------ Функции для замеров ------------------
-def test_insert_start_list(n):
-    """
-    Вставка n элементов в начало списка (list)
-    """
-    lst = []
+Запуск (общий стенд timing_harness — из lab01/src):
+    PYTHONPATH=../../lab01/src python performance_analysis.py [--sizes ...]
+        [--json out.json] [--baseline base.json] [--plot]
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict, deque
+from functools import partial
+
+from linked_list import (LinkedList, PooledLinkedList, UnrolledLinkedList,
+                         DoublyLinkedList, LRUCache)
+
+# Общий измерительный стенд лежит в lab01/src (см. timing_harness.py)
+from timing_harness import TimingResult, environment
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+REGRESSION_THRESHOLD = 0.10  # замедление больше 10% считается регрессией
+
+
+# ------------------ Подготовка структур ------------------
+def build_list(n):
+    return list(range(n))
+
+
+def build_deque(n):
+    return deque(range(n))
+
+
+def build_linked(cls):
+    def build(n):
+        ll = cls()
+        for i in range(n):
+            ll.insert_at_end(i)
+        return ll
+    return build
+
+
+def build_unrolled(n):
+    ull = UnrolledLinkedList()
+    ull.extend(range(n))
+    return ull
+
+
+def empty(cls):
+    return lambda n: cls()
+
+
+# ------------------ Операции (n раз) ------------------
+def insert_start_list(lst, n):
     for i in range(n):
         lst.insert(0, i)
     # Сложность: O(n^2) - каждая вставка в начало списка list требует сдвига всех элементов
+    return lst
 
-def test_insert_start_linkedlist(n):
-    """
-    Вставка n элементов в начало связного списка (LinkedList)
-    """
-    ll = LinkedList()
+
+def insert_start_deque(q, n):
+    for i in range(n):
+        q.appendleft(i)
+    # Сложность: O(n) - appendleft() выполняется за O(1)
+    return q
+
+
+def insert_start_linked(ll, n):
     for i in range(n):
         ll.insert_at_start(i)
     # Сложность: O(n) - каждая вставка O(1), всего n вставок
+    return ll
 
-def test_queue_list(n):
-    """
-    Удаление n элементов с начала списка (list)
-    """
-    lst = list(range(n))
+
+def insert_end_list(lst, n):
+    for i in range(n):
+        lst.append(i)
+    # Сложность: O(n) - append амортизированно O(1)
+    return lst
+
+
+def insert_end_deque(q, n):
+    for i in range(n):
+        q.append(i)
+    return q
+
+
+def insert_end_linked(ll, n):
+    for i in range(n):
+        ll.insert_at_end(i)
+    # Сложность: O(n) - вставка в конец O(1) благодаря указателю на хвост
+    return ll
+
+
+def pop_front_list(lst, n):
     for _ in range(n):
         lst.pop(0)
     # Сложность: O(n^2) - pop(0) сдвигает все оставшиеся элементы на каждом шаге
+    return lst
 
-def test_queue_deque(n):
-    """
-    Удаление n элементов с начала двусторонней очереди (deque)
-    """
-    q = deque(range(n))
+
+def pop_front_deque(q, n):
     for _ in range(n):
         q.popleft()
     # Сложность: O(n) - popleft() выполняется за O(1) для каждого элемента
+    return q
+
+
+def pop_front_linked(ll, n):
+    for _ in range(n):
+        ll.delete_from_start()
+    # Сложность: O(n)
+    return ll
+
+
+def traversal(structure, n):
+    """
+    Полный обход структуры без сохранения элементов
+    """
+    for _ in structure:
+        pass
+    # Сложность: O(n)
+    return structure
+
+
+def queue_cycle_deque(q, n):
+    for i in range(n):
+        q.popleft()
+        q.append(i)
+    return q
+
+
+def queue_cycle_linked(ll, n):
+    """
+    Очередь с оборотом: n раз удаление из начала и вставка в конец
+    (у PooledLinkedList ячейки переиспользуются)
+    """
+    for i in range(n):
+        ll.delete_from_start()
+        ll.insert_at_end(i)
+    # Сложность: O(n) - все операции O(1)
+    return ll
+
+
+def shuffled_keys(build):
+    """Подготовка для remove_random: структура из n ключей и ключи в случайном порядке."""
+    def setup(n):
+        keys = list(range(n))
+        random.Random(n).shuffle(keys)
+        return build(n), keys
+    return setup
+
+
+def remove_random_list(state, n):
+    lst, keys = state
+    for key in keys:
+        lst.remove(key)
+    # Сложность: O(n^2) - поиск и сдвиг элементов при каждом удалении
+    return lst
+
+
+def remove_random_doubly(state, n):
+    ll, keys = state
+    for key in keys:
+        ll.remove(key)
+    # Сложность: O(n) - узел находится по индексу ключей и удаляется за O(1)
+    return ll
+
+
+class OrderedDictLRU:
+    """LRU-кэш на OrderedDict — эталон для сравнения с LRUCache"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.capacity:
+            self._data.popitem(last=False)
+
+
+def lru_workload(cls):
+    """
+    Подготовка LRU-нагрузки: кэш на n // 10 элементов и n запросов
+    с перекосом к «горячим» ключам (примерно степенной закон).
+    """
+    def setup(n):
+        rng = random.Random(n)
+        trace = [int(n * rng.random() ** 3) for _ in range(n)]
+        return cls(max(1, n // 10)), trace
+    return setup
+
+
+def lru_run(state, n):
+    cache, trace = state
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, key)  # промах: «загрузка» значения
+    return cache
+
+
+LINKED = {
+    "LinkedList": LinkedList,
+    "PooledLinkedList": PooledLinkedList,
+    "DoublyLinkedList": DoublyLinkedList,
+}
+
+# операция -> структура -> (подготовка(n), операция(состояние, n))
+BENCHMARKS = {
+    "insert_start": {
+        "list": (empty(list), insert_start_list),
+        "deque": (empty(deque), insert_start_deque),
+        **{name: (empty(cls), insert_start_linked) for name, cls in LINKED.items()},
+        "UnrolledLinkedList": (empty(UnrolledLinkedList), insert_start_linked),
+    },
+    "insert_end": {
+        "list": (empty(list), insert_end_list),
+        "deque": (empty(deque), insert_end_deque),
+        **{name: (empty(cls), insert_end_linked) for name, cls in LINKED.items()},
+        "UnrolledLinkedList": (empty(UnrolledLinkedList), insert_end_linked),
+    },
+    "pop_front": {
+        "list": (build_list, pop_front_list),
+        "deque": (build_deque, pop_front_deque),
+        **{name: (build_linked(cls), pop_front_linked) for name, cls in LINKED.items()},
+        "UnrolledLinkedList": (build_unrolled, pop_front_linked),
+    },
+    "traversal": {
+        "list": (build_list, traversal),
+        "deque": (build_deque, traversal),
+        **{name: (build_linked(cls), traversal) for name, cls in LINKED.items()},
+        "UnrolledLinkedList": (build_unrolled, traversal),
+    },
+    "queue_cycle": {
+        "deque": (build_deque, queue_cycle_deque),
+        **{name: (build_linked(cls), queue_cycle_linked) for name, cls in LINKED.items()},
+        "UnrolledLinkedList": (build_unrolled, queue_cycle_linked),
+    },
+    "remove_random": {
+        "list": (shuffled_keys(build_list), remove_random_list),
+        "DoublyLinkedList": (shuffled_keys(build_linked(partial(DoublyLinkedList, indexed=True))),
+                             remove_random_doubly),
+    },
+    "lru": {
+        "OrderedDict": (lru_workload(OrderedDictLRU), lru_run),
+        "LRUCache": (lru_workload(LRUCache), lru_run),
+    },
+}
+
+# Квадратичные операции меряются только до указанного n: сдвиг памяти
+# в list.insert(0)/pop(0) быстрый, а list.remove ещё и сравнивает элементы
+QUADRATIC_LIMITS = {
+    ("insert_start", "list"): 10**5,
+    ("pop_front", "list"): 10**5,
+    ("remove_random", "list"): 10**4,
+}
+
+
+# ------------------ Замеры ------------------
+def repeats_for(n):
+    """Число замеров: больше для малых n, не меньше 3 для больших."""
+    return max(3, min(15, 10**6 // n))
+
+
+def time_operation(setup, run, n, repeats):
+    """
+    Время (сек) каждого из repeats прогонов run(setup(n), n).
+    Подготовка в замер не входит, сборщик мусора отключён.
+    """
+    samples = []
+    for _ in range(repeats):
+        state = setup(n)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(state, n)
+            samples.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        del state
+    return samples
+
+
+def memory_profile(setup, run, n):
+    """
+    Отдельный прогон под tracemalloc: пиковый объём памяти, выделенной
+    во время операции (байт; подготовленная структура не учитывается),
+    и чистое число блоков памяти на операцию — выделенные минус
+    освобождённые (отрицательное для удаления).
+    """
+    state = setup(n)
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = run(state, n)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del result, state
+    return peak, blocks / n
+
+
+def run_suite(sizes=SIZES, operations=None, structures=None, limits=QUADRATIC_LIMITS,
+              verbose=True):
+    """
+    Прогон набора. Возвращает список записей (словарей) с полями
+    operation, structure, n, ops_per_sec, peak_bytes, blocks_per_op, timing.
+    """
+    records = []
+    for operation, variants in BENCHMARKS.items():
+        if operations and operation not in operations:
+            continue
+        if verbose:
+            print(f"\n{operation}:")
+            print("{:>20} {:>10} {:>14} {:>12} {:>14} {:>12}".format(
+                "Структура", "n", "Операций/с", "IQR (%)", "Пик памяти", "Блоков/оп"))
+        for structure, (setup, run) in variants.items():
+            if structures and structure not in structures:
+                continue
+            for n in sizes:
+                if n > limits.get((operation, structure), n):
+                    continue
+                samples = time_operation(setup, run, n, repeats_for(n))
+                peak, blocks = memory_profile(setup, run, n)
+                timing = TimingResult(name=f"{operation}/{structure}", loops=1, samples=samples,
+                                      params={"operation": operation, "structure": structure, "n": n})
+                record = {
+                    "operation": operation,
+                    "structure": structure,
+                    "n": n,
+                    "ops_per_sec": n / timing.median,
+                    "peak_bytes": peak,
+                    "blocks_per_op": blocks,
+                    "timing": timing.to_dict(),
+                }
+                records.append(record)
+                if verbose:
+                    print(f"{structure:>20} {n:>10} {record['ops_per_sec']:>14.0f} "
+                          f"{timing.iqr / timing.median * 100:>12.1f} "
+                          f"{peak / 2**20:>11.2f} МБ {blocks:>12.2f}")
+    return records
+
+
+def save_report(records, path):
+    """JSON-отчёт в формате timing_harness.save_json: окружение + результаты."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": records}, f,
+                  ensure_ascii=False, indent=2)
+
+
+def compare_with_baseline(records, baseline_path, threshold=REGRESSION_THRESHOLD):
+    """
+    Сравнение с базовым прогоном по (operation, structure, n).
+    Регрессия — медиана медленнее на threshold и больше и 95% доверительные
+    интервалы медиан не пересекаются (разница не объясняется шумом).
+    Возвращает список регрессий (словарей) и печатает таблицу изменений.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["operation"], r["structure"], r["n"]): r
+                    for r in json.load(f)["results"]}
+
+    regressions = []
+    print(f"\nСравнение с {baseline_path}:")
+    print("{:>14} {:>20} {:>10} {:>12} {:>12}".format(
+        "Операция", "Структура", "n", "Изменение", "Статус"))
+    for record in records:
+        key = (record["operation"], record["structure"], record["n"])
+        if key not in baseline:
+            continue
+        old, new = baseline[key]["timing"], record["timing"]
+        change = new["median"] / old["median"] - 1
+        if change > threshold and new["ci95"][0] > old["ci95"][1]:
+            status = "регрессия"
+            regressions.append({"key": key, "change": change})
+        elif change < -threshold and new["ci95"][1] < old["ci95"][0]:
+            status = "ускорение"
+        else:
+            status = "в пределах шума"
+        print(f"{key[0]:>14} {key[1]:>20} {key[2]:>10} {change * 100:>+11.1f}% {status:>12}")
+    return regressions
+
+
+def traversal_peak_memory(ll, traverse):
+    """
+    Пиковая память (байт), выделенная при обходе готового списка ll функцией traverse.
+    """
+    tracemalloc.start()
+    traverse(ll)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def traversal_memory_report(n):
+    """Пиковая память способов обхода LinkedList из n элементов."""
+    big = build_linked(LinkedList)(n)
+    peak_traversal = traversal_peak_memory(big, lambda ll: ll.traversal())
+    peak_iter = traversal_peak_memory(big, lambda ll: traversal(ll, n))
+    peak_window = traversal_peak_memory(big, lambda ll: sum(ll.window(0, 1000)))
+    print(f"\nОбход LinkedList из {n} элементов, пиковая память: "
+          f"traversal() {peak_traversal / 2**20:.1f} МБ, __iter__ {peak_iter / 2**10:.1f} КБ, "
+          f"window(0, 1000) {peak_window / 2**10:.1f} КБ")
+
+
+def plot(records):
+    """Графики отчёта: вставка в начало list vs LinkedList, очередь list vs deque."""
+    import matplotlib.pyplot as plt
+
+    def series(operation, structure):
+        points = [(r["n"], r["timing"]["median"]) for r in records
+                  if r["operation"] == operation and r["structure"] == structure]
+        return [n for n, _ in points], [t for _, t in points]
+
+    for operation, pairs, title in (
+            ("insert_start", (("list", "list insert(0, item)"),
+                              ("LinkedList", "LinkedList insert_at_start")),
+             "Вставка в начало: list vs LinkedList"),
+            ("pop_front", (("list", "list pop(0)"), ("deque", "deque popleft()")),
+             "Очередь: list vs deque")):
+        plt.figure(figsize=(8, 5))
+        for structure, label in pairs:
+            plt.plot(*series(operation, structure), marker='o', label=label)
+        plt.xscale('log')
+        plt.yscale('log')
+        plt.xlabel('Количество элементов')
+        plt.ylabel('Время (сек)')
+        plt.title(title)
+        plt.legend()
+        plt.grid(True)
+        plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки структур данных lab02")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--operations", nargs="+", choices=list(BENCHMARKS))
+    parser.add_argument("--structures", nargs="+")
+    parser.add_argument("--json", metavar="PATH", help="сохранить результаты в JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="сравнить с сохранённым JSON")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--plot", action="store_true", help="построить графики")
+    args = parser.parse_args(argv)
+
+    records = run_suite(args.sizes, args.operations, args.structures)
+    traversal_memory_report(max(args.sizes))
+    if args.json:
+        save_report(records, args.json)
+    regressions = []
+    if args.baseline:
+        regressions = compare_with_baseline(records, args.baseline, args.threshold)
+    if args.plot:
+        plot(records)
+    return 1 if regressions else 0
+
 
-# ------------------ Замеры вставки в начало ------------------
-list_start_times = []
-ll_start_times = []
-
-for n in sizes:
-    t_list = timeit.timeit(lambda: test_insert_start_list(n), number=REPEAT)
-    t_ll = timeit.timeit(lambda: test_insert_start_linkedlist(n), number=REPEAT)
-    list_start_times.append(t_list)
-    ll_start_times.append(t_ll)
-
-print("Вставка в начало:")
-for i, n in enumerate(sizes):
-    print(f"{n} элементов -> list: {list_start_times[i]:.6f}, LinkedList: {ll_start_times[i]:.6f}")
-
-# ------------------ Замеры очереди (удаление из начала) ------------------
-list_queue_times = []
-deque_times = []
-
-for n in sizes:
-    t_list = timeit.timeit(lambda: test_queue_list(n), number=REPEAT)
-    t_deque = timeit.timeit(lambda: test_queue_deque(n), number=REPEAT)
-    list_queue_times.append(t_list)
-    deque_times.append(t_deque)
-
-print("\nОчередь (удаление из начала):")
-for i, n in enumerate(sizes):
-    print(f"{n} элементов -> list pop(0): {list_queue_times[i]:.6f}, deque popleft(): {deque_times[i]:.6f}")
-
-# ------------------ Визуализация ------------------
-# Вставка в начало
-plt.figure(figsize=(8,5))
-plt.plot(sizes, list_start_times, marker='o', label='list insert(0, item)')
-plt.plot(sizes, ll_start_times, marker='o', label='LinkedList insert_at_start')
-plt.xlabel('Количество элементов')
-plt.ylabel('Время (сек)')
-plt.title('Вставка в начало: list vs LinkedList')
-plt.legend()
-plt.grid(True)
-plt.show()
-
-# Очередь
-plt.figure(figsize=(8,5))
-plt.plot(sizes, list_queue_times, marker='o', label='list pop(0)')
-plt.plot(sizes, deque_times, marker='o', label='deque popleft()')
-plt.xlabel('Количество элементов')
-plt.ylabel('Время (сек)')
-plt.title('Очередь: list vs deque')
-plt.legend()
-plt.grid(True)
-plt.show()
+if __name__ == "__main__":
+    sys.exit(main())
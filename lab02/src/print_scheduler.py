@@ -0,0 +1,294 @@
+"""
+Планировщик очереди печати (развитие task_solutions.print_queue).
+
+- задачи группируются в пакеты и выполняются пулом потоков;
+- приоритеты: меньшее число — более высокий приоритет (как в lab07);
+- справедливость между арендаторами (tenant): внутри уровня приоритета
+  арендаторы обслуживаются по кругу, по одной задаче за ход;
+- журнал буферизуется: строки пакета записываются одним вызовом write;
+- метрики: пропускная способность и гистограммы задержек для подбора
+  размера пула.
+"""
+import heapq
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class Histogram:
+    """
+    Гистограмма с логарифмическими корзинами (границы — степени двойки
+    в единицах unit). Запись O(1), память O(число корзин).
+    """
+
+    def __init__(self, unit=1e-6):
+        self.unit = unit
+        self.buckets = {}  # показатель степени -> количество
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        bucket = int(value / self.unit).bit_length()  # [2^(b-1), 2^b) единиц
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """p-й процентиль: линейная интерполяция внутри корзины."""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            count = self.buckets[bucket]
+            if seen + count >= rank:
+                low = (1 << bucket >> 1) * self.unit
+                high = (1 << bucket) * self.unit
+                return min(low + (high - low) * (rank - seen) / count, self.max)
+            seen += count
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": {f"<{(1 << b) * self.unit:g}": c
+                        for b, c in sorted(self.buckets.items())},
+        }
+
+
+def default_handler(task):
+    """Обработчик по умолчанию — как в print_queue: только строка журнала."""
+    return f"Processing task: {task}"
+
+
+class PrintScheduler:
+    """
+    Планировщик задач печати.
+
+    handler(task) выполняется в пуле из workers потоков и возвращает строку
+    журнала (или None). Задачи берутся пакетами по batch_size; одновременно
+    в работе не больше 2 * workers пакетов. log — поток для журнала.
+    """
+
+    def __init__(self, handler=default_handler, workers=4, batch_size=32, log=None):
+        self.handler = handler
+        self.workers = workers
+        self.batch_size = batch_size
+        self.log = log if log is not None else sys.stdout
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._levels = {}  # приоритет -> OrderedDict(арендатор -> deque задач)
+        self._active = []  # куча приоритетов с непустыми уровнями
+        self._pending = 0
+        self._executor = None
+        self.reset_stats()
+
+    # ---------- Очередь ----------
+
+    def submit(self, task, priority=0, tenant="default"):
+        """
+        Добавление задачи. Сложность: O(1), O(log P) для нового уровня приоритета.
+        """
+        with self._lock:
+            level = self._levels.get(priority)
+            if level is None:
+                level = self._levels[priority] = OrderedDict()
+                heapq.heappush(self._active, priority)
+            jobs = level.get(tenant)
+            if jobs is None:
+                jobs = level[tenant] = deque()
+            jobs.append((task, time.perf_counter()))
+            self._pending += 1
+
+    def submit_many(self, tasks, priority=0, tenant="default"):
+        for task in tasks:
+            self.submit(task, priority, tenant)
+
+    def pending(self):
+        return self._pending
+
+    def _next_batch(self):
+        """
+        Очередной пакет: задачи самого приоритетного уровня, арендаторы —
+        по кругу (одна задача за ход). Сложность: O(batch_size).
+        """
+        batch = []
+        with self._lock:
+            while len(batch) < self.batch_size and self._active:
+                priority = self._active[0]
+                level = self._levels[priority]
+                tenant, jobs = level.popitem(last=False)  # следующий по кругу
+                batch.append(jobs.popleft())
+                if jobs:
+                    level[tenant] = jobs  # в конец круга
+                if not level:
+                    del self._levels[priority]
+                    heapq.heappop(self._active)
+            self._pending -= len(batch)
+        return batch
+
+    # ---------- Выполнение ----------
+
+    def _run_batch(self, batch):
+        """
+        Выполнение пакета в потоке пула; журнал пакета — одной записью.
+        Исключение обработчика не прерывает пакет: задача считается
+        неудачной, а в журнал пишется строка с ошибкой.
+        """
+        latency = Histogram()
+        lines = []
+        failed = 0
+        start = time.perf_counter()
+        for task, submitted in batch:
+            try:
+                line = self.handler(task)
+            except Exception as error:
+                failed += 1
+                line = f"Task failed: {task}: {error!r}"
+            if line is not None:
+                lines.append(line)
+            latency.record(time.perf_counter() - submitted)
+        elapsed = time.perf_counter() - start
+        if lines:
+            text = "\n".join(lines) + "\n"
+            with self._log_lock:
+                self.log.write(text)
+        return len(batch), failed, elapsed, latency
+
+    def _collect(self, future):
+        count, failed, elapsed, latency = future.result()
+        self.completed += count - failed
+        self.failed += failed
+        self.latency.merge(latency)
+        self.batch_throughput.record(count / elapsed if elapsed > 0 else 0.0)
+
+    def run_pending(self):
+        """
+        Выполняет все задачи в очереди (включая добавленные во время работы)
+        и возвращает число успешно выполненных задач; неудачные учитываются
+        в failed. Если пакет завершился ошибкой вне обработчика (например,
+        при записи журнала), новые пакеты не запускаются, уже запущенные
+        дожидаются и учитываются, после чего первая ошибка пробрасывается.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        done_before = self.completed
+        start = time.perf_counter()
+        in_flight = set()
+        error = None
+        while True:
+            while error is None and len(in_flight) < 2 * self.workers:
+                batch = self._next_batch()
+                if not batch:
+                    break
+                in_flight.add(self._executor.submit(self._run_batch, batch))
+            if not in_flight:
+                break
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    self._collect(future)
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+        self.busy_time += time.perf_counter() - start
+        self.log.flush()
+        if error is not None:
+            raise error
+        return self.completed - done_before
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- Метрики ----------
+
+    def reset_stats(self):
+        self.completed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.latency = Histogram()  # от submit до завершения, сек
+        self.batch_throughput = Histogram(unit=1.0)  # задач/с внутри пакета
+
+    def stats(self):
+        """Пропускная способность (задач/с) и гистограммы для подбора размера пула."""
+        return {
+            "workers": self.workers,
+            "batch_size": self.batch_size,
+            "completed": self.completed,
+            "failed": self.failed,
+            "throughput": self.completed / self.busy_time if self.busy_time else 0.0,
+            "latency": self.latency.to_dict(),
+            "batch_throughput": self.batch_throughput.to_dict(),
+        }
+
+
+def run_benchmark(tasks=100000, tenants=8, pool_sizes=(1, 2, 4, 8)):
+    """
+    Пропускная способность и задержки при разных размерах пула:
+    обработчик только с журналом (CPU, упирается в GIL) и с имитацией
+    ввода-вывода 1 мс (time.sleep отпускает GIL — пул масштабируется).
+    Журнал пишется в /dev/null, базовая линия — print_queue.
+    """
+    import os
+    from task_solutions import print_queue
+
+    def io_handler(task):
+        time.sleep(0.001)
+        return f"Processing task: {task}"
+
+    with open(os.devnull, "w") as devnull:
+        saved, sys.stdout = sys.stdout, devnull
+        try:
+            start = time.perf_counter()
+            print_queue([f"task{i}" for i in range(tasks)])
+            base = tasks / (time.perf_counter() - start)
+        finally:
+            sys.stdout = saved
+        print(f"print_queue: {base:.0f} задач/с ({tasks} задач)")
+
+        for title, handler, count in (("только журнал", default_handler, tasks),
+                                      ("ввод-вывод 1 мс", io_handler, tasks // 50)):
+            print(f"Обработчик: {title}, {count} задач")
+            print("{:>8} {:>14} {:>12} {:>12} {:>12}".format(
+                "Пул", "Задач/с", "p50 (мс)", "p99 (мс)", "max (мс)"))
+            for workers in pool_sizes:
+                with PrintScheduler(handler, workers=workers, log=devnull) as scheduler:
+                    for i in range(count):
+                        scheduler.submit(f"task{i}", priority=i % 3, tenant=i % tenants)
+                    scheduler.run_pending()
+                    stats = scheduler.stats()
+                latency = stats["latency"]
+                print(f"{workers:>8} {stats['throughput']:>14.0f} {latency['p50'] * 1000:>12.2f} "
+                      f"{latency['p99'] * 1000:>12.2f} {latency['max'] * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,133 @@
+"""
+Бенчмарки решений задач из task_solutions.py на больших входах.
+"""
+import argparse
+import random
+import time
+
+from task_solutions import (find_unbalanced, is_balanced, is_palindrome,
+                            are_palindromes, are_balanced, CHUNK_SIZE, np)
+
+# Синтетические фрагменты: один вид скобок и JSON-подобный текст
+SINGLE_TYPE_PATTERN = b"(a + (b * c) - ((d / e) + f)) * (g - h) + "
+MIXED_PATTERN = b'{"key": [1, 2, {"nested": (3, 4)}], "list": [[5], [6, {"x": 7}]]}, '
+
+
+def is_balanced_baseline(expr):
+    """Исходная реализация: перебор pairs.values() на каждый символ."""
+    stack = []
+    pairs = {'(': ')', '[': ']', '{': '}'}
+    for char in expr:
+        if char in pairs:
+            stack.append(char)
+        elif char in pairs.values():
+            if not stack or pairs[stack.pop()] != char:
+                return False
+    return not stack
+
+
+def synthetic_chunks(pattern, total_bytes, chunk_size=CHUNK_SIZE):
+    """
+    Итератор фрагментов общим размером около total_bytes: pattern
+    повторяется целое число раз, а вход целиком не хранится в памяти.
+    """
+    chunk = pattern * max(1, chunk_size // len(pattern))
+    full, rest = divmod(total_bytes // len(pattern) * len(pattern), len(chunk))
+    for _ in range(full):
+        yield chunk
+    if rest:
+        yield chunk[:rest]
+
+
+def benchmark_brackets(total_bytes=1 << 30, baseline_bytes=16 << 20):
+    """
+    Пропускная способность (МБ/с) потоковой проверки скобок на total_bytes
+    синтетического входа. Исходный is_balanced проверяется на первых
+    baseline_bytes (на всём входе он работал бы слишком долго).
+    """
+    print(f"Проверка скобок: {total_bytes / 2**20:.0f} МБ синтетического входа")
+    print("{:>16} {:>20} {:>20} {:>12}".format(
+        "Вход", "find_unbalanced", "исходный is_balanced", "Ускорение"))
+    print("-" * 72)
+
+    for name, pattern in (("один вид", SINGLE_TYPE_PATTERN), ("JSON-подобный", MIXED_PATTERN)):
+        start = time.perf_counter()
+        result = find_unbalanced(synthetic_chunks(pattern, total_bytes))
+        streaming = total_bytes / (time.perf_counter() - start) / 2**20
+        assert result == -1
+
+        text = b"".join(synthetic_chunks(pattern, baseline_bytes)).decode("ascii")
+        start = time.perf_counter()
+        is_balanced_baseline(text)
+        baseline = baseline_bytes / (time.perf_counter() - start) / 2**20
+
+        print(f"{name:>16} {streaming:>15.1f} МБ/с {baseline:>15.1f} МБ/с "
+              f"{streaming / baseline:>11.1f}x")
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def random_words(count, seed=0, alphabet="abc", max_length=12):
+    """count коротких строк, примерно половина — палиндромы."""
+    rng = random.Random(seed)
+    words = []
+    for _ in range(count):
+        half = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length // 2)))
+        words.append(half + half[::-1] if rng.random() < 0.5 else half + rng.choice(alphabet))
+    return words
+
+
+def benchmark_palindromes(length=10**7, count=10**6):
+    """
+    Путь через deque (итератор на входе) против быстрых путей is_palindrome
+    на одной длинной последовательности и пакетных API на count коротких строк.
+    """
+    half = "ab" * (length // 4)
+    text = half + half[::-1]
+    print(f"Палиндром длины {len(text)} (мс):")
+    rows = [
+        ("deque (итератор)", _timed(is_palindrome, iter(text))),
+        ("str", _timed(is_palindrome, text)),
+        ("bytes", _timed(is_palindrome, text.encode("ascii"))),
+        ("memoryview", _timed(is_palindrome, memoryview(text.encode("ascii")))),
+    ]
+    if np is not None:
+        rows.append(("numpy", _timed(is_palindrome, np.frombuffer(text.encode("ascii"),
+                                                                    dtype=np.uint8))))
+    for name, seconds in rows:
+        print(f"{name:>20} {seconds * 1000:>10.2f}")
+
+    words = random_words(count)
+    print(f"Пакетная проверка {count} коротких строк (мс):")
+    rows = [
+        ("is_palindrome(deque)", _timed(lambda: [is_palindrome(iter(w)) for w in words])),
+        ("is_palindrome(str)", _timed(lambda: [is_palindrome(w) for w in words])),
+        ("are_palindromes(list)", _timed(are_palindromes, words)),
+    ]
+    if np is not None:
+        rows.append(("are_palindromes(ndarray)", _timed(are_palindromes, np.array(words))))
+    exprs = ["".join(random.Random(i).choice("()[]{}a") for _ in range(len(w))) for i, w in
+             enumerate(words[:count // 10])]
+    exprs = [e + "([{}])" for e in exprs]
+    rows += [
+        (f"is_balanced x{len(exprs)}", _timed(lambda: [is_balanced(e) for e in exprs])),
+        (f"are_balanced x{len(exprs)}", _timed(are_balanced, exprs)),
+    ]
+    for name, seconds in rows:
+        print(f"{name:>26} {seconds * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1 << 30,
+                        help="размер синтетического входа в байтах")
+    parser.add_argument("--words", type=int, default=10**6,
+                        help="число коротких строк для пакетных проверок")
+    args = parser.parse_args()
+    benchmark_brackets(args.size)
+    print()
+    benchmark_palindromes(count=args.words)
@@ -1,47 +1,286 @@
+import re
+import sys
 from collections import deque
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен — нужен только для массивов NumPy
+    np = None
+
+BRACKETS = b"()[]{}"
+_OPENERS = b"([{"
+# Предвычисленные таблицы классификации символов: O(1) на символ
+_CLOSER_TO_OPENER = {')': '(', ']': '[', '}': '{'}
+_NON_BRACKETS = bytes(b for b in range(256) if b not in BRACKETS)  # для bytes.translate
+_NON_BRACKETS_SEPARATOR = bytes(b for b in range(256) if b not in BRACKETS + b"|")
+_DEPTH_STEP = bytes.maketrans(BRACKETS, b"\x01\xff\x01\xff\x01\xff")  # +1 / -1 (int8)
+_OPENER_FOR = [0] * 256  # закрывающая скобка -> код открывающей, остальные -> 0
+for _open, _close in zip(_OPENERS, b")]}"):
+    _OPENER_FOR[_close] = _open
+_BRACKET_RE = re.compile(rb"[()\[\]{}]")
+
+CHUNK_SIZE = 1 << 20
 
 
 def is_balanced(expr):
     """
     Задача 1: Сбалансированные скобки
     """
+    if isinstance(expr, (str, bytes, bytearray, memoryview)):
+        residue = _cancel_pairs(_as_bytes(expr).translate(None, _NON_BRACKETS))
+        if b"()" in residue or b"[]" in residue or b"{}" in residue:
+            return find_unbalanced(residue) < 0  # глубокая вложенность
+        return not residue
+
     stack = []
-    pairs = {'(': ')', '[': ']', '{': '}'}
     for char in expr:
-        if char in pairs:
+        if char in '([{':
             stack.append(char)
-        elif char in pairs.values():
-            if not stack or pairs[stack.pop()] != char:
+        elif char in _CLOSER_TO_OPENER:  # O(1) вместо перебора pairs.values()
+            if not stack or stack.pop() != _CLOSER_TO_OPENER[char]:
                 return False
     return not stack
 
 
+def _as_bytes(chunk):
+    """
+    Фрагмент в виде bytes той же длины: скобки — ASCII, поэтому символы
+    вне Latin-1 можно заменить на '?' без сдвига смещений.
+    """
+    if isinstance(chunk, str):
+        return chunk.encode("latin-1", "replace")
+    return bytes(chunk)
+
+
+def _iter_chunks(source, chunk_size):
+    """Фрагменты из строки/bytes, файла (метод read) или итератора фрагментов."""
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        yield _as_bytes(source)
+    elif hasattr(source, "read"):
+        for chunk in iter(lambda: source.read(chunk_size), source.read(0)):
+            yield _as_bytes(chunk)
+    else:
+        for chunk in source:
+            yield _as_bytes(chunk)
+
+
+def _bracket_offset(chunk, k):
+    """Смещение k-й (с нуля) скобки во фрагменте."""
+    for i, match in enumerate(_BRACKET_RE.finditer(chunk)):
+        if i == k:
+            return match.start()
+    raise IndexError(k)
+
+
+def _scan_single_type(brackets, opener, stack):
+    """
+    Быстрый путь для фрагмента со скобками одного вида: счётчик глубины.
+    Стек хранится сжатым ([открывающая, количество]), поэтому достаточно
+    проверить, что накопленная глубина не опускается ниже верхней серии.
+    Возвращает индекс ошибочной скобки или -1. Цикл по символам — на C.
+    """
+    top = stack[-1][1] if stack and stack[-1][0] == opener else 0
+    steps = memoryview(brackets.translate(_DEPTH_STEP)).cast('b')
+    if min(accumulate(steps, initial=top)) < 0:
+        for k, depth in enumerate(accumulate(steps, initial=top)):
+            if depth < 0:
+                return k - 1  # первая глубина — начальная, а не скобка
+    depth = top + brackets.count(opener) - (len(brackets) - brackets.count(opener))
+    if top:
+        stack.pop()
+    if depth:
+        stack.append([opener, depth])
+    return -1
+
+
+def _scan_mixed(brackets, stack):
+    """Общий путь: стек открывающих скобок. Возвращает индекс ошибки или -1."""
+    for k, code in enumerate(brackets):
+        opener = _OPENER_FOR[code]
+        if not opener:  # открывающая скобка
+            if stack and stack[-1][0] == code:
+                stack[-1][1] += 1
+            else:
+                stack.append([code, 1])
+        elif not stack or stack[-1][0] != opener:
+            return k
+        else:
+            run = stack[-1]
+            run[1] -= 1
+            if not run[1]:
+                stack.pop()
+    return -1
+
+
+def _cancel_pairs(brackets, rounds=16):
+    """
+    Удаляет соседние пары "()", "[]", "{}" (на C, через bytes.replace),
+    пока строка заметно сокращается. Удаление таких пар не меняет ни
+    результата проверки, ни итогового стека, поэтому на мелко вложенных
+    данных (JSON, конфиги) Python-циклу остаётся лишь короткий остаток.
+    """
+    for _ in range(rounds):
+        reduced = brackets.replace(b"()", b"").replace(b"[]", b"").replace(b"{}", b"")
+        shrunk = len(brackets) - len(reduced)
+        brackets = reduced
+        if shrunk * 8 < len(brackets):  # глубокая вложенность — дальше стек
+            break
+    return brackets
+
+
+def find_unbalanced(source, chunk_size=CHUNK_SIZE):
+    """
+    Потоковая проверка скобок для входов, не помещающихся в память.
+    source — строка/bytes, файл (текстовый или двоичный) или итератор
+    фрагментов. Возвращает смещение первой ошибки (лишняя или не та
+    закрывающая скобка) либо длину входа, если остались незакрытые
+    скобки; -1 — скобки сбалансированы.
+    Сложность: O(n) времени, O(глубина) памяти.
+    """
+    stack = []  # серии одинаковых открывающих скобок: [код, количество]
+    offset = 0
+    for chunk in _iter_chunks(source, chunk_size):
+        brackets = chunk.translate(None, _NON_BRACKETS)  # только скобки
+        residue = _cancel_pairs(brackets)
+        kinds = [opener for opener, closer in zip(_OPENERS, b")]}")
+                 if opener in residue or closer in residue]
+        saved = [run[:] for run in stack]
+        if not kinds:
+            error = -1
+        elif len(kinds) == 1:
+            error = _scan_single_type(residue, kinds[0], stack)
+        else:
+            error = _scan_mixed(residue, stack)
+        if error >= 0:  # индекс в остатке -> повторный проход по всему фрагменту
+            error = _scan_mixed(brackets, saved)
+        if error >= 0:
+            return offset + _bracket_offset(chunk, error)
+        offset += len(chunk)
+    return offset if stack else -1
+
+
 def print_queue(tasks):
     """
     Задача 2: Очередь печати
     """
     q = deque(tasks)
+    # Строки журнала собираются в буфер и выводятся одной записью
+    # вместо print на каждую задачу (см. также print_scheduler.py)
+    lines = []
     while q:
         task = q.popleft()
-        print(f"Processing task: {task}")   
+        lines.append(f"Processing task: {task}\n")
+    sys.stdout.write("".join(lines))
+
+
+def _is_palindrome_sliced(seq):
+    """Сравнение первой половины с перевёрнутой второй — один срез на C."""
+    half = len(seq) // 2
+    return seq[:half] == seq[:-half - 1:-1]
 
 
 def is_palindrome(seq):
     """
     Задача 3: Палиндром
     """
-    d = deque(seq)
+    if isinstance(seq, (str, bytes, bytearray)):
+        return _is_palindrome_sliced(seq)  # O(n) без вызовов на каждый символ
+    if isinstance(seq, memoryview) and seq.ndim == 1:
+        return _is_palindrome_sliced(seq)
+    if np is not None and isinstance(seq, np.ndarray) and seq.ndim == 1:
+        half = len(seq) // 2
+        return bool(np.array_equal(seq[:half], seq[::-1][:half]))
+
+    d = deque(seq)  # произвольная последовательность или итератор
     while len(d) > 1:
         if d.popleft() != d.pop():
             return False
     return True
 
 
+def _are_palindromes_numpy(array):
+    """
+    Векторная проверка массива NumPy: строки двумерного массива либо
+    одномерный массив строк фиксированной ширины (dtype 'U'/'S'), которые
+    группируются по длине — внутри группы это матрица символов.
+    """
+    if array.ndim == 2:
+        half = array.shape[1] // 2
+        return (array[:, :half] == array[:, :-half - 1:-1]).all(axis=1)
+
+    width = array.dtype.itemsize // (4 if array.dtype.kind == "U" else 1)
+    chars = array.view(np.uint32 if array.dtype.kind == "U" else np.uint8)
+    chars = chars.reshape(len(array), width)
+    lengths = np.char.str_len(array)
+    result = np.ones(len(array), dtype=bool)  # длины 0 и 1 — палиндромы
+    for length in np.unique(lengths).tolist():
+        if length < 2:
+            continue
+        rows = np.flatnonzero(lengths == length)
+        group = chars[rows, :length]
+        half = length // 2
+        result[rows] = (group[:, :half] == group[:, ::-1][:, :half]).all(axis=1)
+    return result
+
+
+def are_palindromes(seqs):
+    """
+    Пакетная проверка множества последовательностей (например, миллиона
+    коротких строк). Массив NumPy (двумерный или строк фиксированной
+    ширины) проверяется векторно; для списка строк/bytes быстрее всего
+    оказывается сравнение с перевёрнутым срезом — перенос миллиона
+    объектов str в NumPy стоит дороже самой проверки.
+    Возвращает список bool в порядке входа.
+    """
+    if np is not None and isinstance(seqs, np.ndarray) and (
+            seqs.ndim == 2 or seqs.dtype.kind in "US"):
+        return _are_palindromes_numpy(seqs).tolist()
+    return [seq == seq[::-1] if isinstance(seq, (str, bytes, bytearray)) else is_palindrome(seq)
+            for seq in seqs]
+
+
+def _join_brackets(exprs):
+    """
+    Скобки всех строк одним буфером bytes с разделителем "|": склейка и
+    фильтрация выполняются за один вызов на весь пакет. Если разделитель
+    встречается внутри самих строк, фильтруется каждая строка отдельно.
+    """
+    for sep in ("|", b"|"):
+        try:
+            joined = sep.join(exprs)
+        except TypeError:  # в пакете строки другого типа
+            continue
+        if joined.count(sep) == len(exprs) - 1:
+            return _as_bytes(joined).translate(None, _NON_BRACKETS_SEPARATOR)
+    return b"|".join([_as_bytes(expr).translate(None, _NON_BRACKETS) for expr in exprs])
+
+
+def are_balanced(exprs):
+    """
+    Пакетная проверка скобок во множестве коротких строк/bytes.
+    Отфильтрованные скобки всех строк склеиваются через разделитель "|",
+    и соседние пары удаляются сразу во всём буфере (разделитель не даёт
+    паре образоваться через границу строк). Остатки, в которых ещё есть
+    соседние пары (глубокая вложенность), досматриваются find_unbalanced.
+    Возвращает список bool в порядке входа.
+    """
+    exprs = list(exprs)
+    if not exprs:
+        return []
+    reduced = _cancel_pairs(_join_brackets(exprs))
+    residues = reduced.split(b"|")
+    if b"()" not in reduced and b"[]" not in reduced and b"{}" not in reduced:
+        return [not residue for residue in residues]  # остатки больше не сократятся
+    return [not residue or find_unbalanced(residue) < 0 for residue in residues]
+
+
 if __name__ == "__main__":
     # Тесты
     print("Сбалансированность скобок:")
     print(is_balanced("{[()]}"))  # True
     print(is_balanced("{[(])}"))  # False
+    print(find_unbalanced(iter(["{[(", "])}"])))  # 3 — смещение первой ошибки
 
     print("\nОчередь печати:")
     print_queue(["task1", "task2", "task3"])
@@ -1,4 +1,7 @@
-from time import time
+import threading
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from time import monotonic
 
 calls_naive = 0
 
@@ -19,25 +22,229 @@ def fibonacci_naive(n):
     # Глубина рекурсии: O(n)
 
 
-calls_memo = 0
-memo = {}
+# ------------------ Кэши с вытеснением ------------------
 
-def fibonacci_memo(n):
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions expirations maxsize currsize")
+
+_MISSING = object()
+
+
+class LRUMemoCache:
     """
-    Мемоизированная функция Фибоначчи.
+    Вытеснение давно не использовавшихся записей (LRU).
+    OrderedDict: обращение переносит ключ в конец, вытесняется начало.
     """
-    global calls_memo, memo
-    calls_memo += 1  # O(1)
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
 
-    if n in memo:    # O(1)
-        return memo[n]  # O(1)
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        value = self._data.get(key, _MISSING)  # O(1)
+        if value is not _MISSING:
+            self._data.move_to_end(key)  # O(1)
+        return value
+
+    def put(self, key, value):
+        """Добавление записи; возвращает число вытесненных записей."""
+        self._data[key] = value  # O(1)
+        self._data.move_to_end(key)
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)  # O(1)
+            return 1
+        return 0
+
+    def clear(self):
+        self._data.clear()
+
+
+class LFUMemoCache:
+    """
+    Вытеснение наименее часто используемых записей (LFU) за O(1):
+    записи сгруппированы по частоте обращений, внутри группы — в порядке
+    последнего обращения (при равной частоте вытесняется более старая).
+    """
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._data = {}  # ключ -> [значение, частота]
+        self._by_freq = {}  # частота -> OrderedDict ключей
+        self._min_freq = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def _touch(self, key, entry):
+        freq = entry[1]
+        group = self._by_freq[freq]
+        del group[key]
+        if not group:
+            del self._by_freq[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        entry[1] = freq + 1
+        self._by_freq.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def get(self, key):
+        entry = self._data.get(key)  # O(1)
+        if entry is None:
+            return _MISSING
+        self._touch(key, entry)  # O(1)
+        return entry[0]
+
+    def put(self, key, value):
+        if self.maxsize == 0:
+            return 0
+        entry = self._data.get(key)
+        if entry is not None:
+            entry[0] = value
+            self._touch(key, entry)
+            return 0
+        evicted = 0
+        if self.maxsize is not None and len(self._data) >= self.maxsize:
+            group = self._by_freq[self._min_freq]
+            old_key, _ = group.popitem(last=False)  # O(1)
+            if not group:
+                del self._by_freq[self._min_freq]
+            del self._data[old_key]
+            evicted = 1
+        self._data[key] = [value, 1]
+        self._by_freq.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+        return evicted
+
+    def clear(self):
+        self._data.clear()
+        self._by_freq.clear()
+        self._min_freq = 0
+
+
+class TTLMemoCache:
+    """
+    Записи живут ttl секунд с момента вычисления; при переполнении
+    вытесняется самая старая запись (порядок добавления).
+    """
+    def __init__(self, maxsize=None, ttl=60.0, clock=monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data = OrderedDict()  # ключ -> (значение, момент истечения)
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        entry = self._data.get(key)  # O(1)
+        if entry is None:
+            return _MISSING
+        if entry[1] <= self.clock():
+            del self._data[key]  # запись устарела
+            self.expirations += 1
+            return _MISSING
+        return entry[0]
+
+    def put(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = (value, self.clock() + self.ttl)  # O(1)
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)  # O(1)
+            return 1
+        return 0
+
+    def clear(self):
+        self._data.clear()
 
-    if n <= 1:       # O(1)
-        memo[n] = n  # O(1)
-    else:
-        memo[n] = fibonacci_memo(n - 1) + fibonacci_memo(n - 2)  # O(1)
 
-    return memo[n]  # O(1)
+POLICIES = {"lru": LRUMemoCache, "lfu": LFUMemoCache, "ttl": TTLMemoCache}
+
+
+def _make_key(args, kwargs):
+    """Ключ кэша; один аргумент int/str используется как есть (как в functools)."""
+    if not kwargs:
+        if len(args) == 1 and type(args[0]) in (int, str):
+            return args[0]
+        return args
+    return args + (_MISSING,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(maxsize=None, policy="lru", ttl=None):
+    """
+    Декоратор мемоизации с собственным кэшем у каждой функции.
+
+    maxsize — ограничение числа записей (None — без ограничения);
+    policy  — "lru", "lfu" или "ttl" (тогда ttl — время жизни записи, сек).
+
+    Обращения к кэшу защищены RLock; сама функция вычисляется вне
+    блокировки, поэтому рекурсия и параллельные вызовы не блокируют друг
+    друга (одно значение может быть вычислено дважды — результат тот же).
+    У обёртки есть cache_info(), cache_clear() и атрибут cache.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Неизвестная политика вытеснения: {policy}")
+    if (policy == "ttl") != (ttl is not None):
+        raise ValueError("ttl задаётся только вместе с policy='ttl'")
+
+    def decorator(func):
+        cache = TTLMemoCache(maxsize, ttl) if policy == "ttl" else POLICIES[policy](maxsize)
+        lock = threading.RLock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            with lock:
+                value = cache.get(key)  # O(1)
+                if value is not _MISSING:
+                    stats["hits"] += 1
+                    return value
+                stats["misses"] += 1
+            value = func(*args, **kwargs)  # вне блокировки
+            with lock:
+                stats["evictions"] += cache.put(key, value)  # O(1)
+            return value
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats["hits"], stats["misses"], stats["evictions"],
+                                 getattr(cache, "expirations", 0), maxsize, len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, evictions=0)
+                if policy == "ttl":
+                    cache.expirations = 0
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+_WARM_STEP = 256  # шаг прогрева кэша fibonacci_memo
+
+
+@memoize(maxsize=2 * _WARM_STEP)
+def fibonacci_memo(n):
+    """
+    Мемоизированная функция Фибоначчи.
+    Кэш и счётчики — у самой функции: fibonacci_memo.cache_info(),
+    число вызовов = hits + misses; сброс — fibonacci_memo.cache_clear().
+
+    Каждый уровень рекурсии — два кадра (обёртка и функция), поэтому при
+    n > _WARM_STEP кэш сначала заполняется снизу вверх через F(n - _WARM_STEP):
+    спуск к F(n - 1) останавливается на нём не глубже _WARM_STEP уровней.
+    Кэшу хватает последних 2 * _WARM_STEP значений.
+    """
+    if n <= 1:       # O(1)
+        return n     # O(1)
+    if n > _WARM_STEP:
+        fibonacci_memo(n - _WARM_STEP)  # прогрев кэша, O(1) при попадании
+    return fibonacci_memo(n - 1) + fibonacci_memo(n - 2)  # O(1) при попадании в кэш
 
     # Итоговая сложность: O(n)
-    # Глубина рекурсии: O(n)
+    # Глубина рекурсии: O(n / _WARM_STEP + _WARM_STEP)
@@ -1,6 +1,17 @@
+import contextlib
+import math
+import os
+import random
+import sys
+import tempfile
 import time
+import tracemalloc
 import matplotlib.pyplot as plt
-from memoization import fibonacci_naive, fibonacci_memo, memo, calls_memo, calls_naive
+import memoization
+import recursion
+import recursion_tasks
+import trampoline
+from memoization import fibonacci_naive, fibonacci_memo, memoize
 
 def measure_times(max_n=35):
     naive_times = []
@@ -8,20 +19,21 @@ def measure_times(max_n=35):
     sizes = list(range(5, max_n + 1))
 
     for n in sizes:
-        global calls_naive, calls_memo, memo
-        calls_naive = 0
+        memoization.calls_naive = 0  # счётчик — атрибут модуля memoization
         t1 = time.time()
         fibonacci_naive(n)
         t2 = time.time()
         naive_times.append(t2 - t1)
 
-        calls_memo = 0
-        memo = {}
+        fibonacci_memo.cache_clear()  # каждый замер — с пустым кэшем
         t3 = time.time()
         fibonacci_memo(n)
         t4 = time.time()
         memo_times.append(t4 - t3)
 
+    print(f"n = {max_n}: вызовов наивной версии {memoization.calls_naive}, "
+          f"мемоизированной {sum(fibonacci_memo.cache_info()[:2])}")
+
     plt.figure(figsize=(8,5))
     plt.plot(sizes, naive_times, marker='o', label='Наивная рекурсия')
     plt.plot(sizes, memo_times, marker='o', label='Мемоизация')
@@ -33,9 +45,283 @@ def measure_times(max_n=35):
     plt.show()
 
 
+def measure_cache_sizes(cache_sizes=(16, 64, 256, 1024, 4096, None), requests=200000,
+                        keys=10000, policies=("lru", "lfu", "ttl")):
+    """
+    Доля попаданий и память кэша в зависимости от размера и политики.
+    Нагрузка — requests обращений к keys ключам со степенным перекосом
+    (несколько «горячих» ключей и длинный хвост редких).
+    Память — прирост выделенной памяти к концу прогона (tracemalloc).
+    """
+    rng = random.Random(0)
+    trace = [int(keys * rng.random() ** 3) for _ in range(requests)]
+
+    print(f"Доля попаданий и память кэша ({requests} обращений, {keys} ключей):")
+    print("{:>8} {:>8} {:>12} {:>12} {:>14}".format(
+        "Политика", "Размер", "Попадания", "Вытеснено", "Память (КБ)"))
+    for policy in policies:
+        for size in cache_sizes:
+            ttl = 60.0 if policy == "ttl" else None
+
+            @memoize(maxsize=size, policy=policy, ttl=ttl)
+            def load(key):
+                return str(key) * 4  # «дорогое» значение
+
+            tracemalloc.start()
+            for key in trace:
+                load(key)
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            info = load.cache_info()
+            hit_rate = info.hits / (info.hits + info.misses)
+            label = "∞" if size is None else size
+            print(f"{policy:>8} {label:>8} {hit_rate * 100:>11.1f}% {info.evictions:>12} "
+                  f"{memory / 1024:>14.1f}")
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def _recursion_limit(limit):
+    """Временный лимит рекурсии — чтобы рекурсивные версии дошли до конца."""
+    saved = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(saved, limit))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(saved)
+
+
+def _make_tree(root, depth, width):
+    """Каталог-«цепочка» глубины depth, в каждом каталоге width файлов."""
+    path = root
+    for level in range(depth):
+        for i in range(width):
+            open(os.path.join(path, f"f{i}"), "w").close()
+        path = os.path.join(path, "d")
+        os.mkdir(path)
+
+
+def _max_chain_depth(root, depth):
+    """
+    Глубина «цепочки» _make_tree в root (не больше depth), при которой
+    путь к последнему файлу укладывается в ограничение ОС на длину пути:
+    PC_PATH_MAX на POSIX, MAX_PATH = 260 символов на Windows.
+    """
+    try:
+        limit = os.pathconf(root, "PC_PATH_MAX")
+    except (AttributeError, OSError, ValueError):  # Windows: os.pathconf нет
+        limit = 260
+    # Каждый уровень добавляет "/d", tempfile — ещё ~20 символов на имя каталога
+    return max(0, min(depth, (limit - len(os.path.abspath(root)) - 40) // 2))
+
+
+def compare_recursive_iterative():
+    """
+    Рекурсивные версии против итеративных (явный стек или цикл) и трамплина.
+    Рекурсивные версии запускаются с поднятым лимитом рекурсии, иначе на
+    больших глубинах они завершаются RecursionError; вывод — в /dev/null.
+    """
+    base = os.path.dirname(os.path.abspath(__file__))
+    sys.path.append(os.path.join(base, "..", "..", "lab06", "src"))
+    sys.path.append(os.path.join(base, "..", "..", "lab08", "src"))
+    from binary_search_tree import BinarySearchTree
+    from greedy_algorithms import (build_huffman_tree, generate_huffman_codes,
+                                   generate_huffman_codes_iterative)
+
+    rows = []  # (задача, параметры, рекурсия, трамплин или None, итерация)
+
+    for n in (1000, 10000, 100000):
+        with _recursion_limit(n + 100):
+            rows.append(("factorial", f"n={n}", _timed(recursion.factorial, n),
+                         _timed(trampoline.factorial, n), _timed(recursion.factorial_iterative, n)))
+
+    exponents = [random.randint(10**5, 10**6) for _ in range(100000)]
+    rows.append(("fast_power", "100000 степеней",
+                 _timed(lambda: [recursion.fast_power(1.0000001, e) for e in exponents]), None,
+                 _timed(lambda: [recursion.fast_power_iterative(1.0000001, e) for e in exponents])))
+
+    arr = list(range(0, 2 * 10**6, 2))
+    targets = [random.randrange(2 * 10**6) for _ in range(100000)]
+    rows.append(("binary_search", "n=10^6, 100000 поисков",
+                 _timed(lambda: [recursion_tasks.binary_search(arr, t) for t in targets]), None,
+                 _timed(lambda: [recursion_tasks.binary_search_iterative(arr, t) for t in targets])))
+
+    chains = [(10, 2000)]
+    deep = _max_chain_depth(tempfile.gettempdir(), 1500)
+    if deep > 10:
+        chains.append((deep, 5))  # на Windows (MAX_PATH) глубина меньше 1500
+    else:
+        print("walk_directory: глубокий каталог пропущен — ограничение длины пути")
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for depth, width in chains:
+            with tempfile.TemporaryDirectory() as root:
+                _make_tree(root, depth, width)
+                with _recursion_limit(depth + 100):
+                    rows.append(("walk_directory", f"глубина {depth}, {width} файлов",
+                                 _timed(recursion_tasks.walk_directory, root), None,
+                                 _timed(recursion_tasks.walk_directory_iterative, root)))
+
+        n = 18
+        rows.append(("hanoi", f"n={n}", _timed(recursion_tasks.hanoi, n, 'A', 'C', 'B'),
+                     _timed(trampoline.hanoi, n, 'A', 'C', 'B'),
+                     _timed(recursion_tasks.hanoi_iterative, n, 'A', 'C', 'B')))
+
+    for title, values in (("случайные", random.sample(range(10**6), 100000)),
+                          ("вырожденное", list(range(5000)))):
+        trees = []
+        for _ in range(2):
+            tree = BinarySearchTree()
+            tree.insert(values[0])
+            node = tree.root
+            if title == "вырожденное":  # цепочку строим напрямую: вставка O(n^2)
+                for value in values[1:]:
+                    node.right = tree.node_class(value)
+                    node = node.right
+                tree._size = len(values)
+            else:
+                for value in values[1:]:
+                    tree.insert(value)
+            trees.append(tree)
+        order = values[::-1]  # для цепочки — удаление с самого глубокого узла
+        with _recursion_limit(len(values) + 100):
+            rows.append(("BST delete", f"{title}, n={len(values)}",
+                         _timed(lambda: [trees[0].delete_recursive(v) for v in order]), None,
+                         _timed(lambda: [trees[1].delete(v) for v in order])))
+
+    for title, frequencies in (("256 символов", {chr(i): random.randint(1, 1000) for i in range(256)}),
+                               ("глубина 3000", {i: 2 ** i for i in range(3000)})):
+        tree = build_huffman_tree(frequencies)
+        with _recursion_limit(len(frequencies) + 100):
+            rows.append(("huffman codes", title,
+                         _timed(lambda: [generate_huffman_codes(tree) for _ in range(10)]), None,
+                         _timed(lambda: [generate_huffman_codes_iterative(tree) for _ in range(10)])))
+
+    print("Рекурсия против итерации (мс):")
+    print("{:>16} {:>26} {:>12} {:>12} {:>12} {:>10}".format(
+        "Задача", "Параметры", "Рекурсия", "Трамплин", "Итерация", "Ускорение"))
+    for name, params, recursive, trampolined, iterative in rows:
+        trampolined = "—" if trampolined is None else f"{trampolined * 1000:.1f}"
+        print(f"{name:>16} {params:>26} {recursive * 1000:>12.1f} {trampolined:>12} "
+              f"{iterative * 1000:>12.1f} {recursive / iterative:>9.2f}x")
+
+
+def make_synthetic_tree(root, files=10**6, files_per_dir=100, fanout=10):
+    """
+    Синтетическое дерево: files пустых файлов по files_per_dir в каталоге,
+    у каждого каталога до fanout подкаталогов (заполнение по уровням).
+    """
+    directories = [root]
+    created = 0
+    i = 0
+    while created < files:
+        directory = directories[i]
+        for k in range(min(files_per_dir, files - created)):
+            open(os.path.join(directory, f"file{k}.dat"), "w").close()
+        created += min(files_per_dir, files - created)
+        for k in range(fanout):
+            if len(directories) * files_per_dir >= files:
+                break
+            child = os.path.join(directory, f"dir{k}")
+            os.mkdir(child)
+            directories.append(child)
+        i += 1
+    return len(directories)
+
+
+def compare_directory_walkers(files=10**6, pool_sizes=(2, 4, 8)):
+    """
+    walk_directory, его итеративная версия и os.walk против scan_directory
+    (последовательно и с пулом потоков) на синтетическом дереве из files
+    файлов во временном каталоге. Вывод деревьев — в /dev/null.
+    """
+    def count(entries):
+        return sum(1 for _ in entries)
+
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        directories = make_synthetic_tree(root, files)
+        print(f"Дерево: {files} файлов, {directories} каталогов "
+              f"(создано за {time.perf_counter() - start:.1f} с)")
+        count(os.walk(root))  # прогрев кэша каталогов
+
+        rows = []
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            rows.append(("walk_directory", _timed(recursion_tasks.walk_directory, root)))
+            rows.append(("walk_directory_iterative",
+                         _timed(recursion_tasks.walk_directory_iterative, root)))
+            rows.append(("print_tree", _timed(recursion_tasks.print_tree, root)))
+        rows.append(("os.walk", _timed(lambda: count(os.walk(root)))))
+        rows.append(("scan_directory", _timed(lambda: count(recursion_tasks.scan_directory(root)))))
+        for workers in pool_sizes:
+            rows.append((f"scan_directory, {workers} потоков",
+                         _timed(lambda: count(recursion_tasks.scan_directory(root, workers=workers)))))
+
+        def walk_sizes():
+            return sum(os.path.getsize(os.path.join(d, f)) for d, _, fs in os.walk(root) for f in fs)
+
+        rows.append(("os.walk + getsize", _timed(walk_sizes)))
+        rows.append(("directory_summary", _timed(recursion_tasks.directory_summary, root)))
+        for workers in pool_sizes:
+            rows.append((f"directory_summary, {workers} потоков",
+                         _timed(lambda: recursion_tasks.directory_summary(root, workers=workers))))
+
+    base = rows[0][1]
+    print("{:>34} {:>10} {:>14} {:>10}".format("Обход", "Время (с)", "Записей/с", "Ускорение"))
+    for name, seconds in rows:
+        print(f"{name:>34} {seconds:>10.2f} {(files + directories) / seconds:>14.0f} "
+              f"{base / seconds:>9.2f}x")
+
+
+def compare_factorials(sizes=(10**5, 2 * 10**5, 5 * 10**5, 10**6), processes=None,
+                       sequential_limit=2 * 10**5):
+    """
+    Время вычисления n! и C(n, n // 2): последовательное умножение,
+    дерево произведений, prime swing (с пулом процессов и без) и math.
+    Последовательное умножение квадратично по размеру результата, поэтому
+    оно измеряется только до sequential_limit. Результаты сверяются с math.
+    """
+    processes = processes or os.cpu_count()
+    print(f"Факториал и биномиальный коэффициент (с), пул: {processes} процессов")
+    print("{:>9} {:>12} {:>12} {:>12} {:>12} {:>12} {:>12} {:>12} {:>12}".format(
+        "n", "цикл", "дерево", "дерево, пул", "swing", "swing, пул", "math",
+        "C(n,n/2)", "math.comb"))
+    for n in sizes:
+        expected = math.factorial(n)
+        row = []
+        if n <= sequential_limit:
+            row.append(_timed(recursion.factorial_iterative, n))
+        else:
+            row.append(None)
+        for func, pool in ((recursion.factorial_binary_split, None),
+                           (recursion.factorial_binary_split, processes),
+                           (recursion.factorial_prime_swing, None),
+                           (recursion.factorial_prime_swing, processes)):
+            start = time.perf_counter()
+            assert func(n, pool) == expected
+            row.append(time.perf_counter() - start)
+        row.append(_timed(math.factorial, n))
+        start = time.perf_counter()
+        assert recursion.binomial(n, n // 2) == math.comb(n, n // 2)
+        row.append(time.perf_counter() - start)
+        row.append(_timed(math.comb, n, n // 2))
+        print(f"{n:>9} " + " ".join("{:>12}".format("—" if t is None else f"{t:.3f}")
+                                    for t in row))
+
+
 # Пример использования Ханойских башен
 # hanoi(3, 'A', 'C', 'B')
 
 
 if __name__ == "__main__":
-    measure_times(35)
\ No newline at end of file
+    measure_cache_sizes()
+    compare_recursive_iterative()
+    compare_directory_walkers()
+    compare_factorials()
+    measure_times(35)
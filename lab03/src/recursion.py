@@ -1,3 +1,13 @@
+import multiprocessing
+from bisect import bisect_right
+from math import isqrt
+
+
+def _check_index(n):
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+
+
 def factorial(n):
     """
     Рекурсивное вычисление факториала n!
@@ -11,6 +21,176 @@ def factorial(n):
     # Глубина рекурсии: O(n)
 
 
+def factorial_iterative(n):
+    """
+    Итеративное вычисление факториала n! — без рекурсии и её ограничения глубины.
+    При n < 0 — ValueError, как у math.factorial.
+    """
+    _check_index(n)              # O(1)
+    result = 1                   # O(1)
+    for i in range(2, n + 1):    # O(n) итераций
+        result *= i              # O(1) операция умножения
+
+    return result
+
+    # Итоговая сложность: O(n)
+    # Дополнительная память: O(1) (кроме самого результата)
+
+
+# ------------------ Факториал больших чисел ------------------
+
+PARALLEL_THRESHOLD = 20000  # меньше множителей — процессы не окупаются
+
+
+def _product(values, lo, hi):
+    """
+    Произведение values[lo:hi] бинарным разбиением: перемножаются числа
+    близкого размера, поэтому дорогих умножений «большое на маленькое» нет.
+    """
+    if hi - lo <= 8:              # лист дерева произведений
+        result = 1
+        for i in range(lo, hi):   # O(1) умножений небольших чисел
+            result *= values[i]
+        return result
+
+    mid = (lo + hi) // 2
+    return _product(values, lo, mid) * _product(values, mid, hi)
+
+    # Итоговая сложность: O(M(N) log n), M(N) — умножение N-битных чисел
+    # Глубина рекурсии: O(log n)
+
+
+def _product_all(values):
+    return _product(values, 0, len(values))
+
+
+def product(values, processes=None):
+    """
+    Произведение последовательности целых (range или list) деревом произведений.
+    processes — число процессов для листовых произведений: values делится
+    на processes * 4 чередующиеся части (values[i::parts]) примерно равного
+    размера, их произведения считаются в пуле и перемножаются деревом.
+    """
+    if processes is None or len(values) < PARALLEL_THRESHOLD:
+        return _product_all(values)
+
+    parts = processes * 4
+    with multiprocessing.Pool(processes) as pool:
+        partial = pool.map(_product_all, [values[i::parts] for i in range(parts)])
+    return _product_all(partial)
+
+
+def factorial_binary_split(n, processes=None):
+    """
+    n! как произведение 2..n деревом произведений (binary splitting).
+    При n < 0 — ValueError, как у math.factorial.
+    """
+    _check_index(n)
+    return product(range(2, n + 1), processes)  # O(M(n log n) log n)
+
+
+def primes_up_to(n):
+    """
+    Простые числа не больше n — решето Эратосфена на bytearray.
+    """
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, isqrt(n) + 1):   # O(n log log n)
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p in range(n + 1) if sieve[p]]
+
+
+def _swing(n, primes, processes=None):
+    """
+    Нечётная часть «качающегося» факториала n! / (n // 2)!^2 через
+    разложение на простые: показатель p равен числу нечётных n // p^k (k >= 1).
+    primes — простые не больше n (могут быть и больше — они не используются).
+    """
+    factors = []
+    root = isqrt(n)
+    end = bisect_right(primes, n)
+    for i in range(1, end):        # primes[0] == 2: двойки учитываются сдвигом
+        p = primes[i]
+        if p <= root:              # показатель может быть больше 1
+            q, power = n, 1
+            while q >= p:
+                q //= p
+                if q & 1:
+                    power *= p
+            if power > 1:
+                factors.append(power)
+        elif p <= n // 2:          # p^2 > n: показатель (n // p) mod 2
+            if (n // p) & 1:
+                factors.append(p)
+        else:                      # n/2 < p <= n: показатель 1
+            factors.extend(primes[i:end])
+            break
+    return product(factors, processes)
+
+
+def factorial_prime_swing(n, processes=None):
+    """
+    n! алгоритмом prime swing (П. Лушный): n! = (n // 2)!^2 * swing(n),
+    swing(n) собирается из степеней простых — множителей в ~log n раз
+    меньше, чем в 2..n, и все они перемножаются деревом произведений.
+    Считается нечётная часть, степень двойки n - popcount(n) — одним сдвигом.
+    При n < 0 — ValueError, как у math.factorial.
+    """
+    _check_index(n)
+    if n < 2:
+        return 1
+    primes = primes_up_to(n)  # одно решето на все уровни
+
+    def odd_part(m):
+        if m < 2:
+            return 1
+        half = odd_part(m // 2)               # глубина O(log n)
+        return half * half * _swing(m, primes, processes)
+
+    return odd_part(n) << (n - bin(n).count("1"))
+
+    # Итоговая сложность: O(M(n log n) log n), с меньшей константой, чем binary split
+
+
+def binomial(n, k, processes=None):
+    """
+    Биномиальный коэффициент C(n, k) через показатели простых (формула
+    Лежандра): e_p = sum(n // p^i - k // p^i - (n - k) // p^i) — без
+    вычисления трёх факториалов и деления больших чисел.
+    """
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    if k == 0:
+        return 1
+
+    factors = []
+    root = isqrt(n)
+    for p in primes_up_to(n):
+        if p > n - k:              # p входит в числитель ровно один раз
+            factors.append(p)
+        elif p > n // 2:           # в числителе не встречается
+            continue
+        elif p > root:             # показатель 0 или 1
+            if n % p < k % p:
+                factors.append(p)
+        else:
+            power = 1
+            pk = p
+            while pk <= n:
+                if n // pk - k // pk - (n - k) // pk:
+                    power *= p
+                pk *= p
+            if power > 1:
+                factors.append(power)
+    return product(factors, processes)
+
+    # Итоговая сложность: O(n log log n) на решето + произведение π(n) множителей
+
+
 def fibonacci(n):
     """
     Наивная рекурсивная функция Фибоначчи.
@@ -44,12 +224,122 @@ def fast_power(a, n):
     # Глубина рекурсии: O(log n)
 
 
+def fast_power_iterative(a, n):
+    """
+    Быстрое возведение в степень циклом по битам n (справа налево):
+    a^n = произведение a^(2^i) по единичным битам n.
+    """
+    result = 1       # O(1)
+    while n > 0:     # O(log n) итераций
+        if n % 2 == 1:       # O(1)
+            result *= a      # O(1)
+        n //= 2              # O(1)
+        if n > 0:
+            a *= a           # O(1); после старшего бита не возводим
+
+    return result
+
+    # Итоговая сложность: O(log n)
+    # Дополнительная память: O(1)
+
+
+def _fib_pair(n, m=None):
+    """
+    Пара (F(n), F(n+1)) методом быстрого удвоения — та же идея, что в
+    fast_power: задача для n сводится к задаче для n // 2.
+        F(2k)   = F(k) * (2 * F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+    Если задан m, все значения берутся по модулю m (числа остаются меньше m).
+    Единственная реализация удвоения в модуле: на ней построены
+    fibonacci_fast_doubling и fib_mod.
+    """
+    if n == 0:                           # O(1)
+        return (0, 1) if m is None else (0, 1 % m)
+
+    a, b = _fib_pair(n // 2, m)  # O(log n) рекурсивных вызовов
+    c = a * (2 * b - a)          # F(2k)
+    d = a * a + b * b            # F(2k+1)
+    if m is not None:
+        c, d = c % m, d % m
+    if n % 2 == 0:
+        return c, d
+    return (d, c + d) if m is None else (d, (c + d) % m)
+
+    # Итоговая сложность: O(log n) шагов
+    # Глубина рекурсии: n.bit_length() (332 для n = 10^100)
+
+
+def fibonacci_fast_doubling(n):
+    """
+    Число Фибоначчи F(n) быстрым удвоением (F(0) = 0, F(1) = 1, n >= 0;
+    при n < 0 — ValueError). То же поведение, что Fibonacci.fast_doubling в lab09.
+    """
+    _check_index(n)
+    return _fib_pair(n)[0]
+
+    # Итоговая сложность: O(log n) умножений длинных чисел
+    # Глубина рекурсии: O(log n)
+
+
+def _matrix_multiply(x, y):
+    """Произведение матриц 2x2, заданных кортежами ((a, b), (c, d))."""
+    (a, b), (c, d) = x
+    (e, f), (g, h) = y
+    return ((a * e + b * g, a * f + b * h),
+            (c * e + d * g, c * f + d * h))  # O(1) умножений
+
+
+def matrix_power(m, n):
+    """
+    Быстрое возведение матрицы 2x2 в степень n (как fast_power для чисел).
+    n >= 0; при n < 0 — ValueError (обратная матрица не вычисляется).
+    """
+    _check_index(n)                     # O(1)
+    if n == 0:                          # O(1)
+        return ((1, 0), (0, 1))         # единичная матрица
+
+    if n % 2 == 0:
+        half = matrix_power(m, n // 2)  # O(log n)
+        return _matrix_multiply(half, half)
+    else:
+        return _matrix_multiply(m, matrix_power(m, n - 1))
+
+    # Итоговая сложность: O(log n) умножений матриц
+    # Глубина рекурсии: O(log n)
+
+
+def fibonacci_matrix(n):
+    """
+    Число Фибоначчи через степень матрицы [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]].
+    n >= 0; при n < 0 — ValueError, как у fibonacci_fast_doubling.
+    """
+    _check_index(n)
+    return matrix_power(((1, 1), (1, 0)), n)[0][1]  # O(log n)
+
+
+def fib_mod(n, m):
+    """
+    F(n) mod m для огромных n (например, 10^100): то же быстрое удвоение
+    (_fib_pair), но по модулю m, поэтому все числа остаются меньше m.
+    n >= 0, m >= 1; при n < 0 — ValueError. То же поведение, что
+    Fibonacci.fib_mod в lab09.
+    """
+    _check_index(n)
+    return _fib_pair(n, m)[0]
+
+    # Итоговая сложность: O(log n) операций с числами меньше m
+    # Глубина рекурсии: O(log n)
+
 
 if __name__ == "__main__":
     # Факториал
     print("factorial(5) =", factorial(5))          # 120
     print("factorial(1) =", factorial(1))          # 1
     print("factorial(0) =", factorial(0))          # 1
+    print("factorial_iterative(5) =", factorial_iterative(5))  # 120
+    print("factorial_binary_split(20) =", factorial_binary_split(20))  # 2432902008176640000
+    print("factorial_prime_swing(20) =", factorial_prime_swing(20))    # 2432902008176640000
+    print("binomial(50, 25) =", binomial(50, 25))                      # 126410606437752
 
     # Фибоначчи (наивная версия — медленная!)
     print("fibonacci(10) =", fibonacci(10))        # 55
@@ -58,4 +348,10 @@ if __name__ == "__main__":
     # Быстрое возведение в степень
     print("fast_power(2, 10) =", fast_power(2, 10))  # 1024
     print("fast_power(3, 5) =", fast_power(3, 5))    # 243
-    print("fast_power(10, 0) =", fast_power(10, 0))  # 1
\ No newline at end of file
+    print("fast_power(10, 0) =", fast_power(10, 0))  # 1
+    print("fast_power_iterative(3, 5) =", fast_power_iterative(3, 5))  # 243
+
+    # Фибоначчи за O(log n)
+    print("fibonacci_fast_doubling(100) =", fibonacci_fast_doubling(100))  # 354224848179261915075
+    print("fibonacci_matrix(100) =", fibonacci_matrix(100))                # 354224848179261915075
+    print("fib_mod(10**100, 10**9 + 7) =", fib_mod(10**100, 10**9 + 7))
\ No newline at end of file
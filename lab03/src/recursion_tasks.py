@@ -1,4 +1,8 @@
 import os
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from fnmatch import fnmatch
 
 def binary_search(arr, target, left=0, right=None):
     """
@@ -22,6 +26,29 @@ def binary_search(arr, target, left=0, right=None):
     # Итоговая сложность: O(log n)
     # Глубина рекурсии: O(log n)
 
+def binary_search_iterative(arr, target, left=0, right=None):
+    """
+    Итеративный бинарный поиск: те же границы, что в рекурсивной версии,
+    но вместо вызова — сужение [left, right] в цикле.
+    """
+    if right is None:          # O(1)
+        right = len(arr) - 1   # O(1)
+
+    while left <= right:            # O(log n) итераций
+        mid = (left + right) // 2   # O(1)
+
+        if arr[mid] == target:      # O(1)
+            return mid              # O(1)
+        elif arr[mid] > target:     # O(1)
+            right = mid - 1         # O(1)
+        else:
+            left = mid + 1          # O(1)
+
+    return -1
+
+    # Итоговая сложность: O(log n)
+    # Дополнительная память: O(1)
+
 def walk_directory(path, indent=0):
     """
     Рекурсивный вывод дерева каталогов.
@@ -36,6 +63,172 @@ def walk_directory(path, indent=0):
     # Итоговая сложность: O(N), где N — все файлы и папки
     # Глубина рекурсии: O(h), h — максимальная вложенность
 
+def walk_directory_iterative(path, indent=0):
+    """
+    Вывод дерева каталогов с явным стеком итераторов вместо рекурсии;
+    порядок вывода тот же, что у walk_directory.
+    """
+    stack = [(iter(os.listdir(path)), path, indent)]  # O(k)
+    while stack:
+        items, parent, level = stack[-1]
+        item = next(items, None)    # O(1)
+        if item is None:
+            stack.pop()             # каталог обойдён
+            continue
+
+        full = os.path.join(parent, item)  # O(1)
+        print(" " * level + item)          # O(1)
+
+        if os.path.isdir(full):            # O(1)
+            stack.append((iter(os.listdir(full)), full, level + 4))  # O(k)
+
+    # Итоговая сложность: O(N), где N — все файлы и папки
+    # Дополнительная память: O(h) итераторов в стеке
+
+WalkEntry = namedtuple("WalkEntry", "path name depth is_dir is_symlink size mtime")
+
+DirectorySummary = namedtuple("DirectorySummary", "files dirs size latest_mtime")
+
+_new_entry = tuple.__new__  # быстрее WalkEntry(...) на миллионах записей
+
+
+def _scan_one(path, depth, pattern, exclude, follow_symlinks, with_stats, onerror):
+    """
+    Содержимое одного каталога через os.scandir: тип берётся из dirent без
+    отдельного stat; stat выполняется только при with_stats.
+    is_dir, как os.path.isdir, истинно и для ссылки на каталог; заходить
+    в такую ссылку или нет, решает follow_symlinks.
+    Возвращает (записи для выдачи, подкаталоги для спуска в порядке чтения).
+    """
+    entries = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if exclude and any(fnmatch(name, p) for p in exclude):
+                    continue
+                is_symlink = entry.is_symlink()  # O(1), из dirent
+                try:
+                    is_dir = entry.is_dir()  # O(1) из dirent, stat только для ссылок
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if follow_symlinks or not is_symlink:
+                        subdirs.append(len(entries))
+                elif pattern is not None and not fnmatch(name, pattern):
+                    continue
+                size = mtime = None
+                if with_stats:
+                    try:
+                        st = entry.stat(follow_symlinks=follow_symlinks)
+                        size, mtime = st.st_size, st.st_mtime
+                    except OSError:
+                        pass
+                entries.append(_new_entry(WalkEntry, (entry.path, name, depth, is_dir, is_symlink,
+                                                       size, mtime)))
+    except OSError as error:
+        if onerror is not None:
+            onerror(error)
+    return entries, subdirs
+
+
+def scan_directory(path, max_depth=None, pattern=None, exclude=(), follow_symlinks=False,
+                   with_stats=False, workers=None, onerror=None):
+    """
+    Генератор записей WalkEntry дерева каталогов на os.scandir.
+
+    max_depth       — глубина спуска (0 — только содержимое path, None — без ограничения);
+    pattern         — шаблон fnmatch для файлов (каталоги выдаются и обходятся всегда);
+    exclude         — шаблоны имён, которые пропускаются целиком (вместе с поддеревом);
+    follow_symlinks — заходить ли в ссылки на каталоги (по умолчанию нет, как os.walk;
+                      walk_directory заходит, и циклы ссылок он не обрабатывает);
+                      сами ссылки выдаются всегда, is_dir у них — как os.path.isdir;
+    with_stats      — заполнить size и mtime (один stat на запись);
+    workers         — размер пула потоков: подкаталоги читаются параллельно,
+                      порядок каталогов — по готовности (внутри каталога сохраняется);
+                      None — последовательный обход в том же порядке, что walk_directory;
+    onerror         — вызывается с OSError для нечитаемых каталогов (иначе они пропускаются).
+    """
+    args = (pattern, exclude, follow_symlinks, with_stats, onerror)
+    if workers is None:
+        # Последовательно: явный стек итераторов по спискам записей
+        stack = [iter(_scan_one(path, 0, *args)[0])]
+        while stack:
+            for entry in stack[-1]:
+                yield entry
+                if (entry.is_dir and (follow_symlinks or not entry.is_symlink)
+                        and (max_depth is None or entry.depth < max_depth)):
+                    children, _ = _scan_one(entry.path, entry.depth + 1, *args)  # O(k)
+                    stack.append(iter(children))
+                    break
+            else:
+                stack.pop()  # каталог обойдён
+        return
+
+    # Параллельно: не больше 4 * workers каталогов в работе, остальные ждут в очереди
+    waiting = deque([(path, 0)])
+    in_flight = set()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while waiting or in_flight:
+                while waiting and len(in_flight) < 4 * workers:
+                    directory, depth = waiting.popleft()
+                    in_flight.add(executor.submit(_scan_one, directory, depth, *args))
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entries, subdirs = future.result()
+                    for i in subdirs:
+                        entry = entries[i]
+                        if max_depth is None or entry.depth < max_depth:
+                            waiting.append((entry.path, entry.depth + 1))
+                    yield from entries
+        finally:
+            for future in in_flight:
+                future.cancel()  # генератор закрыт досрочно
+
+    # Итоговая сложность: O(N) записей, один системный вызов getdents на каталог
+    # Дополнительная память: O(h * k) в последовательном режиме
+
+
+def print_tree(path, indent=0, batch=4096, **options):
+    """
+    Вывод дерева каталогов в формате walk_directory, но через scan_directory
+    и с буферизацией: строки пишутся пачками по batch одним вызовом write.
+    options передаются в scan_directory (порядок вывода — только без workers).
+    Как и walk_directory, по умолчанию заходит в ссылки на каталоги
+    (follow_symlinks=True); follow_symlinks=False выводит ссылку без содержимого.
+    """
+    options.setdefault("follow_symlinks", True)
+    lines = []
+    for entry in scan_directory(path, **options):
+        lines.append(" " * (indent + 4 * entry.depth) + entry.name + "\n")
+        if len(lines) >= batch:
+            sys.stdout.write("".join(lines))
+            lines.clear()
+    sys.stdout.write("".join(lines))
+
+
+def directory_summary(path, **options):
+    """
+    Число файлов и каталогов, суммарный размер файлов (байт) и время
+    последнего изменения по всему дереву. options — как у scan_directory.
+    Ссылка на каталог считается каталогом и без follow_symlinks.
+    """
+    files = dirs = size = 0
+    latest = None
+    for entry in scan_directory(path, with_stats=True, **options):
+        if entry.is_dir:
+            dirs += 1
+            continue
+        files += 1
+        if entry.size is not None:
+            size += entry.size
+            if latest is None or entry.mtime > latest:
+                latest = entry.mtime
+    return DirectorySummary(files, dirs, size, latest)
+
+
 def hanoi(n, start, end, aux):
     """
     Решение задачи Ханойских башен.
@@ -53,6 +246,30 @@ def hanoi(n, start, end, aux):
     # Итоговая сложность: O(2^n)
     # Глубина рекурсии: O(n)
 
+def hanoi_iterative(n, start, end, aux):
+    """
+    Ханойские башни с явным стеком вместо рекурсии. Спуск к диску 1 идёт
+    циклом; в стек откладывается кадр (n, start, end, aux), который после
+    переноса n-1 дисков делает ход диском n и переходит ко второй
+    половине — переносу n-1 дисков с aux на end. Порядок ходов как у hanoi.
+    """
+    stack = []  # O(n) кадров
+    while True:
+        while n > 1:                   # спуск: перенос n-1 дисков на aux
+            stack.append((n, start, end, aux))
+            n, end, aux = n - 1, aux, end
+
+        print(f"Перенести диск 1 со стержня {start} на стержень {end}")  # O(1)
+        if not stack:
+            break
+
+        n, start, end, aux = stack.pop()
+        print(f"Перенести диск {n} со стержня {start} на стержень {end}")  # O(1)
+        n, start, aux = n - 1, aux, start  # перенос n-1 дисков с aux на end
+
+    # Итоговая сложность: O(2^n)
+    # Дополнительная память: O(n) кадров в стеке
+
 if __name__ == "__main__":
    
     # 1. Бинарный поиск    
@@ -61,6 +278,7 @@ if __name__ == "__main__":
     print("binary_search(arr, 1) =", binary_search(arr, 1))   # 0
     print("binary_search(arr, 15) =", binary_search(arr, 15)) # 6
     print("binary_search(arr, 100) =", binary_search(arr, 100)) # -1
+    print("binary_search_iterative(arr, 7) =", binary_search_iterative(arr, 7))  # 3
 
    
     # 2. Обход файловой системы
@@ -69,6 +287,8 @@ if __name__ == "__main__":
     # WARNING: может вывести много текста!
     walk_directory(".")
 
+    print("\nscan_directory: сводка по текущей папке:", directory_summary("."))
+
     
     # 3. Ханойские башни
     
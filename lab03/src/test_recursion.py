@@ -0,0 +1,63 @@
+import math
+import unittest
+from memoization import fibonacci_memo
+from recursion import (factorial_iterative, factorial_binary_split, factorial_prime_swing,
+                       fibonacci_fast_doubling, fibonacci_matrix, fib_mod, matrix_power)
+
+
+class TestMemoization(unittest.TestCase):
+
+    def setUp(self):
+        """Каждый тест — с пустым кэшем"""
+        fibonacci_memo.cache_clear()
+
+    def test_fibonacci_memo_cold_cache_depth(self):
+        """Холодный вызов fibonacci_memo(900) не упирается в лимит рекурсии"""
+        a, b = 0, 1
+        for _ in range(900):
+            a, b = b, a + b
+        self.assertEqual(fibonacci_memo(900), a)
+
+    def test_fibonacci_memo_bounded(self):
+        """Кэш fibonacci_memo ограничен"""
+        fibonacci_memo(2000)
+        info = fibonacci_memo.cache_info()
+        self.assertIsNotNone(info.maxsize)
+        self.assertLessEqual(info.currsize, info.maxsize)
+
+
+class TestFactorial(unittest.TestCase):
+
+    FACTORIALS = (factorial_iterative, factorial_binary_split, factorial_prime_swing)
+
+    def test_matches_math_factorial(self):
+        """Все версии совпадают с math.factorial"""
+        for n in list(range(50)) + [1000, 2345]:
+            for func in self.FACTORIALS:
+                self.assertEqual(func(n), math.factorial(n), f"{func.__name__}({n})")
+
+    def test_negative(self):
+        """Отрицательный n — ValueError, как у math.factorial"""
+        for func in self.FACTORIALS:
+            with self.assertRaises(ValueError):
+                func(-1)
+
+
+class TestFibonacciLog(unittest.TestCase):
+
+    def test_methods_agree(self):
+        """Быстрое удвоение и степень матрицы дают одни и те же числа"""
+        for n in range(100):
+            self.assertEqual(fibonacci_fast_doubling(n), fibonacci_matrix(n))
+            self.assertEqual(fib_mod(n, 1000), fibonacci_matrix(n) % 1000)
+
+    def test_negative_index(self):
+        """Отрицательный n — ValueError, а не RecursionError"""
+        for func in (fibonacci_fast_doubling, fibonacci_matrix,
+                     lambda n: fib_mod(n, 7), lambda n: matrix_power(((1, 1), (1, 0)), n)):
+            with self.assertRaises(ValueError):
+                func(-5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Трамплин: рекурсия без стека вызовов Python.
+
+Рекурсивная функция записывается генератором: вместо вызова самой себя
+она отдаёт (yield) кадр вложенного вызова и получает его результат:
+
+    @stack_safe
+    def factorial(n):
+        if n <= 1:
+            return 1
+        return n * (yield factorial(n - 1))
+
+Кадры хранятся в явном стеке (списке) в куче, поэтому глубина ограничена
+только памятью, а не sys.getrecursionlimit().
+"""
+import threading
+from functools import wraps
+
+_state = threading.local()
+
+
+def run(frame):
+    """
+    Выполнение генератора-кадра с явным стеком.
+    Отданный генератор — вложенный вызов: он кладётся на стек, а его
+    результат (return) передаётся обратно через send. Исключение
+    вложенного вызова пробрасывается в вызывающий кадр (throw).
+    Сложность: O(1) на шаг, память O(глубина).
+    """
+    stack = [frame]
+    value = None
+    error = None
+    while stack:
+        top = stack[-1]
+        try:
+            if error is not None:
+                exc, error = error, None
+                call = top.throw(exc)
+            else:
+                call = top.send(value)
+        except StopIteration as stop:
+            stack.pop()  # кадр завершён
+            value = stop.value
+            continue
+        except BaseException as exc:
+            stack.pop()
+            if not stack:
+                raise
+            error = exc
+            continue
+        stack.append(call)  # вложенный вызов
+        value = None
+    return value
+
+
+def stack_safe(gen_func):
+    """
+    Декоратор для рекурсивных функций, записанных генератором.
+
+    Снаружи функция вызывается как обычная и возвращает результат.
+    Внутри работающего трамплина (в том же потоке) вызов возвращает кадр,
+    который нужно отдать через yield: value = yield f(...).
+    """
+    @wraps(gen_func)
+    def wrapper(*args, **kwargs):
+        if getattr(_state, "running", False):
+            return gen_func(*args, **kwargs)  # кадр для внешнего трамплина
+        _state.running = True
+        try:
+            return run(gen_func(*args, **kwargs))
+        finally:
+            _state.running = False
+
+    return wrapper
+
+
+@stack_safe
+def factorial(n):
+    """
+    Факториал той же рекурсией, что recursion.factorial, но без
+    ограничения глубины.
+    """
+    if n == 0 or n == 1:   # O(1)
+        return 1           # O(1)
+
+    return n * (yield factorial(n - 1))  # O(1) + кадр в явном стеке
+
+    # Итоговая сложность: O(n)
+    # Глубина стека: O(n) кадров в куче
+
+
+@stack_safe
+def hanoi(n, start, end, aux):
+    """
+    Ханойские башни той же рекурсией, что recursion_tasks.hanoi, но без
+    ограничения глубины.
+    """
+    if n == 1:  # O(1)
+        print(f"Перенести диск 1 со стержня {start} на стержень {end}")  # O(1)
+        return  # O(1)
+
+    yield hanoi(n - 1, start, aux, end)  # O(2^(n-1))
+
+    print(f"Перенести диск {n} со стержня {start} на стержень {end}")  # O(1)
+
+    yield hanoi(n - 1, aux, end, start)  # O(2^(n-1))
+
+    # Итоговая сложность: O(2^n)
+    # Глубина стека: O(n) кадров в куче
+
+
+if __name__ == "__main__":
+    import sys
+
+    n = sys.getrecursionlimit() * 10
+    print(f"factorial({n}): {factorial(n).bit_length()} бит, "
+          f"лимит рекурсии {sys.getrecursionlimit()}")
+    print("\nХанойские башни для n=3:")
+    hanoi(3, 'A', 'C', 'B')
@@ -12,8 +12,22 @@ class TreeNode:
         return str(self.value)
 
 
+class SlottedTreeNode:
+    """Узел бинарного дерева поиска без __dict__ (атрибуты в __slots__)"""
+    __slots__ = ("value", "left", "right")
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+    
+    def __str__(self):
+        return str(self.value)
+
+
 class BinarySearchTree:
     """Бинарное дерево поиска"""
+    node_class = TreeNode  # класс узлов; подклассы могут заменить его
     
     def __init__(self):
         self.root = None
@@ -23,7 +37,7 @@ class BinarySearchTree:
         """Вставка значения в дерево (итеративная версия).
         Сложность: O(log n) в среднем, O(n) в худшем (вырожденное дерево)
         """
-        new_node = TreeNode(value)
+        new_node = self.node_class(value)
         
         if self.root is None:
             self.root = new_node
@@ -55,7 +69,7 @@ class BinarySearchTree:
         Используется для демонстрации, но для больших деревьев лучше итеративная.
         """
         if self.root is None:
-            self.root = TreeNode(value)
+            self.root = self.node_class(value)
             self._size = 1
         else:
             self._insert_recursive(self.root, value)
@@ -63,13 +77,13 @@ class BinarySearchTree:
     def _insert_recursive(self, node, value):
         if value < node.value:
             if node.left is None:
-                node.left = TreeNode(value)
+                node.left = self.node_class(value)
                 self._size += 1
             else:
                 self._insert_recursive(node.left, value)
         elif value > node.value:
             if node.right is None:
-                node.right = TreeNode(value)
+                node.right = self.node_class(value)
                 self._size += 1
             else:
                 self._insert_recursive(node.right, value)
@@ -106,13 +120,53 @@ class BinarySearchTree:
             return self._search_recursive(node.right, value)
     
     def delete(self, value):
-        """Удаление значения из дерева.
+        """Удаление значения из дерева (итеративная версия).
         Сложность: O(log n) в среднем, O(n) в худшем (вырожденное дерево)
         """
-        self.root = self._delete_recursive(self.root, value)
-        if self.root is not None:
-            # Обновляем размер
-            self._size = self._size_recursive(self.root)
+        parent = None
+        node = self.root
+        
+        # Поиск узла для удаления и его родителя
+        while node is not None:
+            if value < node.value:
+                parent, node = node, node.left
+            elif value > node.value:
+                parent, node = node, node.right
+            else:
+                break
+        
+        if node is None:
+            # Значения нет в дереве
+            return
+        
+        # Узел с двумя потомками: переносим в него минимальное значение
+        # правого поддерева и удаляем узел-преемник (у него нет левого потомка)
+        if node.left is not None and node.right is not None:
+            parent = node
+            successor = node.right
+            while successor.left is not None:
+                parent, successor = successor, successor.left
+            node.value = successor.value
+            node = successor
+        
+        # Узел без потомков или с одним потомком: заменяем его потомком
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        
+        self._size -= 1
+    
+    def delete_recursive(self, value):
+        """Удаление значения из дерева (рекурсивная версия).
+        Используется для сравнения: глубина рекурсии O(h).
+        """
+        if self.search(value):
+            self.root = self._delete_recursive(self.root, value)
+            self._size -= 1
     
     def _delete_recursive(self, node, value):
         if node is None:
@@ -175,20 +229,21 @@ class BinarySearchTree:
         return current
     
     def is_valid_bst(self):
-        """Проверка, является ли дерево корректным BST.
+        """Проверка, является ли дерево корректным BST (явный стек вместо рекурсии).
         Сложность: O(n)
         """
-        return self._is_valid_recursive(self.root, float('-inf'), float('inf'))
-    
-    def _is_valid_recursive(self, node, min_val, max_val):
-        if node is None:
-            return True
+        stack = [(self.root, float('-inf'), float('inf'))]
         
-        if node.value <= min_val or node.value >= max_val:
-            return False
+        while stack:
+            node, min_val, max_val = stack.pop()
+            if node is None:
+                continue
+            if node.value <= min_val or node.value >= max_val:
+                return False
+            stack.append((node.right, node.value, max_val))
+            stack.append((node.left, min_val, node.value))
         
-        return (self._is_valid_recursive(node.left, min_val, node.value) and
-                self._is_valid_recursive(node.right, node.value, max_val))
+        return True
     
     def height(self, node=None):
         """Вычисление высоты дерева/поддерева.
@@ -199,10 +254,15 @@ class BinarySearchTree:
         if node is None:
             return 0
         
-        left_height = self.height(node.left) if node.left else 0
-        right_height = self.height(node.right) if node.right else 0
+        # Обход по уровням: высота — число уровней
+        height = 0
+        level = [node]
+        while level:
+            height += 1
+            level = [child for current in level
+                     for child in (current.left, current.right) if child is not None]
         
-        return max(left_height, right_height) + 1
+        return height
     
     def size(self):
         """Возвращает количество узлов в дереве.
@@ -210,20 +270,23 @@ class BinarySearchTree:
         """
         return self._size
     
-    def _size_recursive(self, node):
-        """Рекурсивный подсчет размера (для внутреннего использования)"""
-        if node is None:
-            return 0
-        return 1 + self._size_recursive(node.left) + self._size_recursive(node.right)
-    
     def get_inorder_list(self):
         """Возвращает список элементов в порядке in-order"""
         result = []
-        self._inorder_recursive(self.root, result)
+        stack = []
+        current = self.root
+        
+        while current is not None or stack:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current.value)
+            current = current.right
+        
         return result
-    
-    def _inorder_recursive(self, node, result):
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
\ No newline at end of file
+
+
+class SlottedBinarySearchTree(BinarySearchTree):
+    """BinarySearchTree на узлах SlottedTreeNode — меньше памяти на каждый узел"""
+    node_class = SlottedTreeNode
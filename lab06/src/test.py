@@ -2,6 +2,7 @@ import unittest
 from binary_search_tree import BinarySearchTree, TreeNode
 from tree_traversal import *
 import random
+import sys
 
 
 class TestBinarySearchTree(unittest.TestCase):
@@ -225,6 +226,54 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(bst.find_min().value, 0)
         self.assertEqual(bst.find_max().value, 99)
 
+    def test_delete_matches_recursive(self):
+        """Итеративное и рекурсивное удаление дают одинаковые деревья"""
+        rng = random.Random(0)
+        values = rng.sample(range(1000), 200)
+        iterative_bst = BinarySearchTree()
+        recursive_bst = BinarySearchTree()
+        for value in values:
+            iterative_bst.insert(value)
+            recursive_bst.insert(value)
+        
+        for value in rng.sample(range(1000), 300):
+            iterative_bst.delete(value)
+            recursive_bst.delete_recursive(value)
+            self.assertEqual(preorder_recursive(iterative_bst.root),
+                             preorder_recursive(recursive_bst.root))
+            self.assertEqual(iterative_bst.size(), recursive_bst.size())
+        
+        self.assertTrue(iterative_bst.is_valid_bst())
+        self.assertEqual(iterative_bst.get_inorder_list(),
+                         inorder_iterative(iterative_bst.root))
+    
+    def test_deep_degenerate_tree(self):
+        """Вырожденное дерево глубже лимита рекурсии: операции без рекурсии"""
+        n = sys.getrecursionlimit() * 2
+        bst = BinarySearchTree()
+        bst.insert(0)
+        node = bst.root
+        for i in range(1, n):  # цепочка вправо, как при отсортированной вставке
+            node.right = TreeNode(i)
+            node = node.right
+        bst._size = n
+        
+        self.assertEqual(bst.height(), n)
+        self.assertTrue(bst.is_valid_bst())
+        self.assertEqual(bst.get_inorder_list(), list(range(n)))
+        
+        # Удаление с конца цепочки и из середины
+        bst.delete(n - 1)
+        bst.delete(n // 2)
+        self.assertEqual(bst.size(), n - 2)
+        self.assertFalse(bst.search(n // 2))
+        self.assertEqual(bst.height(), n - 2)
+        
+        for i in range(n):
+            bst.delete(i)
+        self.assertIsNone(bst.root)
+        self.assertEqual(bst.size(), 0)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -2,10 +2,14 @@
 Реализация приоритетной очереди на основе кучи
 """
 
-class PriorityItem:
+class _PriorityItemBase:
     """
-    Элемент приоритетной очереди
+    Общая часть элементов приоритетной очереди: конструктор и сравнение
+    по приоритету. Пустые __slots__ не добавляют __dict__ — его наличие
+    решает подкласс.
     """
+    __slots__ = ()
+
     def __init__(self, value, priority):
         self.value = value
         self.priority = priority
@@ -24,11 +28,26 @@ class PriorityItem:
         return f"({self.value}, приоритет: {self.priority})"
 
 
+class PriorityItem(_PriorityItemBase):
+    """
+    Элемент приоритетной очереди
+    """
+
+
+class SlottedPriorityItem(_PriorityItemBase):
+    """
+    Элемент приоритетной очереди без __dict__ (атрибуты в __slots__).
+    Наследуется не от PriorityItem: подкласс класса с __dict__ сохраняет его.
+    """
+    __slots__ = ("value", "priority")
+
+
 class PriorityQueue:
     """
     Приоритетная очередь на основе min-heap
     Элементы с меньшим приоритетом имеют более высокий приоритет
     """
+    item_class = PriorityItem  # класс элементов; подклассы могут заменить его
     
     def __init__(self):
         self.heap = []
@@ -86,7 +105,7 @@ class PriorityQueue:
         
         Сложность: O(log n)
         """
-        item = PriorityItem(value, priority)
+        item = self.item_class(value, priority)
         self.heap.append(item)
         self._sift_up(len(self.heap) - 1)
     
@@ -160,4 +179,11 @@ class PriorityQueue:
                     min_idx = i
             
             item = temp_heap.pop(min_idx)
-            print(f"  {item.value} (приоритет: {item.priority})")
\ No newline at end of file
+            print(f"  {item.value} (приоритет: {item.priority})")
+
+
+class SlottedPriorityQueue(PriorityQueue):
+    """
+    PriorityQueue на элементах SlottedPriorityItem — меньше памяти на элемент
+    """
+    item_class = SlottedPriorityItem
@@ -95,16 +95,28 @@ class HuffmanNode:
     def is_leaf(self):
         return self.left is None and self.right is None
 
-def build_huffman_tree(frequencies: Dict[str, int]) -> Optional[HuffmanNode]:
+@dataclass(order=True, slots=True)
+class SlottedHuffmanNode:
+    """Узел дерева Хаффмана без __dict__ (атрибуты в __slots__)."""
+    freq: int
+    char: Any = field(compare=False)
+    left: Any = field(default=None, compare=False)
+    right: Any = field(default=None, compare=False)
+    
+    def is_leaf(self):
+        return self.left is None and self.right is None
+
+def build_huffman_tree(frequencies: Dict[str, int], node_class=HuffmanNode) -> Optional[HuffmanNode]:
     """
     Построение дерева Хаффмана.
+    node_class — класс узлов (HuffmanNode или SlottedHuffmanNode).
     Сложность: O(n log n)
     """
     if not frequencies:
         return None
     
     # Создаем приоритетную очередь из узлов
-    heap = [HuffmanNode(freq, char) for char, freq in frequencies.items()]
+    heap = [node_class(freq, char) for char, freq in frequencies.items()]
     heapq.heapify(heap)
     
     # Пока в очереди больше одного узла
@@ -114,7 +126,7 @@ def build_huffman_tree(frequencies: Dict[str, int]) -> Optional[HuffmanNode]:
         right = heapq.heappop(heap)
         
         # Создаем новый узел
-        merged = HuffmanNode(
+        merged = node_class(
             freq=left.freq + right.freq,
             char=None,
             left=left,
@@ -143,6 +155,29 @@ def generate_huffman_codes(node: Optional[HuffmanNode], code="", codes=None) ->
     
     return codes
 
+def generate_huffman_codes_iterative(node: Optional[HuffmanNode]) -> Dict[str, str]:
+    """
+    Генерация кодов Хаффмана с явным стеком вместо рекурсии.
+    Порядок обхода (левое поддерево раньше правого) и результат — как у
+    generate_huffman_codes, но глубина дерева не ограничена лимитом рекурсии.
+    Сложность: O(n) узлов, память O(h) пар в стеке
+    """
+    codes = {}
+    
+    if node is None:
+        return codes
+    
+    stack = [(node, "")]
+    while stack:
+        current, code = stack.pop()
+        # Спуск по левым потомкам без стека; правые откладываются
+        while not current.is_leaf():
+            stack.append((current.right, code + "1"))
+            current, code = current.left, code + "0"
+        codes[current.char] = code if code else "0"
+    
+    return codes
+
 def huffman_coding(data: str) -> Tuple[Optional[HuffmanNode], Dict[str, str]]:
     """
     Полный алгоритм Хаффмана.
@@ -159,7 +194,7 @@ def huffman_coding(data: str) -> Tuple[Optional[HuffmanNode], Dict[str, str]]:
     tree = build_huffman_tree(freq)
     
     # Генерация кодов
-    codes = generate_huffman_codes(tree)
+    codes = generate_huffman_codes_iterative(tree)
     
     return tree, codes
 
@@ -13,52 +13,90 @@ from dynamic_programming import Fibonacci, Knapsack
 class Comparison:
     """Класс для сравнения различных подходов ДП."""
     
+    # Методы вычисления F(n) и наибольшее n, до которого их имеет смысл
+    # запускать: дальше — экспоненциальное время, переполнение стека
+    # рекурсии или O(n) памяти под длинные числа
+    FIBONACCI_METHODS = {
+        'naive': (Fibonacci.naive_recursive, 30),
+        'memoization': (Fibonacci.memoization_recursive, 500),
+        'iterative': (Fibonacci.iterative, 20_000),
+        'optimized': (Fibonacci.optimized_iterative, 1_000_000),
+        'fast_doubling': (Fibonacci.fast_doubling, 10_000_000),
+        'matrix': (Fibonacci.matrix_power, 10_000_000),
+    }
+    
+    FIBONACCI_SWEEP = [5, 10, 20, 30, 50, 100, 300, 1000, 3000, 10_000, 30_000,
+                       100_000, 300_000, 1_000_000, 3_000_000, 10_000_000]
+    
     @staticmethod
-    def compare_fibonacci(n_values: List[int] = [5, 10, 20, 30, 40]) -> Dict[str, List[float]]:
+    def _time_call(func, n: int, min_time: float = 0.01) -> float:
+        """Время одного вызова func(n): быстрые вызовы повторяются, пока не наберётся min_time."""
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                func(n)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                return elapsed / number
+            number *= 10
+    
+    @staticmethod
+    def compare_fibonacci(n_values: List[int] = FIBONACCI_SWEEP) -> Dict[str, List[float]]:
         """
         Сравнение времени работы разных методов вычисления чисел Фибоначчи.
+        Метод пропускается (значение nan) для n больше его предела из FIBONACCI_METHODS.
         """
-        results = {
-            'naive': [],
-            'memoization': [],
-            'iterative': [],
-            'optimized': []
-        }
+        results = {method: [] for method in Comparison.FIBONACCI_METHODS}
         
         for n in n_values:
             print(f"\nВычисление F({n}):")
-            
-            # Наивная рекурсия (только для небольших n)
-            if n <= 30:
+            expected = None
+            for method, (func, limit) in Comparison.FIBONACCI_METHODS.items():
+                if n > limit:
+                    results[method].append(float('nan'))
+                    continue
                 start = time.perf_counter()
-                result = Fibonacci.naive_recursive(n)
+                result = func(n)
                 elapsed = time.perf_counter() - start
-                results['naive'].append(elapsed)
-                print(f"  Наивная рекурсия: {result} за {elapsed:.6f} сек")
-            
-            # Рекурсия с мемоизацией
-            start = time.perf_counter()
-            result = Fibonacci.memoization_recursive(n)
-            elapsed = time.perf_counter() - start
-            results['memoization'].append(elapsed)
-            print(f"  С мемоизацией: {result} за {elapsed:.6f} сек")
-            
-            # Итеративный подход
-            start = time.perf_counter()
-            result = Fibonacci.iterative(n)
-            elapsed = time.perf_counter() - start
-            results['iterative'].append(elapsed)
-            print(f"  Итеративный: {result} за {elapsed:.6f} сек")
-            
-            # Оптимизированный итеративный
-            start = time.perf_counter()
-            result = Fibonacci.optimized_iterative(n)
-            elapsed = time.perf_counter() - start
-            results['optimized'].append(elapsed)
-            print(f"  Оптимизированный: {result} за {elapsed:.6f} сек")
+                if expected is None:
+                    expected = result
+                assert result == expected, f"{method}: неверное F({n})"
+                if elapsed < 0.01:  # быстрый вызов — повторяем для точности
+                    elapsed = Comparison._time_call(func, n)
+                results[method].append(elapsed)
+                shown = result if n <= 100 else f"{result.bit_length()} бит"
+                print(f"  {method}: {shown} за {elapsed:.6f} сек")
         
         return results
     
+    @staticmethod
+    def find_crossovers(n_values: List[int],
+                        results: Dict[str, List[float]]) -> List[Tuple[str, str, int]]:
+        """
+        Точки пересечения: для каждой пары методов — первое n, начиная с
+        которого второй метод становится быстрее первого (по измеренным n,
+        где оба метода запускались).
+        """
+        crossovers = []
+        methods = list(results)
+        for i, first in enumerate(methods):
+            for second in methods[i + 1:]:
+                previous = None
+                for n, t1, t2 in zip(n_values, results[first], results[second]):
+                    if t1 != t1 or t2 != t2:  # nan — метод не запускался
+                        continue
+                    faster = t2 < t1
+                    if previous is not None and faster != previous:
+                        winner, loser = (second, first) if faster else (first, second)
+                        crossovers.append((winner, loser, n))
+                    previous = faster
+        
+        print("\nТочки пересечения (с какого n метод становится быстрее):")
+        for winner, loser, n in crossovers:
+            print(f"  {winner} быстрее {loser} начиная с n = {n}")
+        return crossovers
+    
     @staticmethod
     def compare_knapsack_algorithms() -> None:
         """
@@ -114,6 +152,14 @@ class Comparison:
                 "Время": "O(n)",
                 "Память": "O(1)"
             },
+            "Числа Фибоначчи (быстрое удвоение)": {
+                "Время": "O(log n) умножений",
+                "Память": "O(1)"
+            },
+            "Числа Фибоначчи (степень матрицы)": {
+                "Время": "O(log n) умножений",
+                "Память": "O(1)"
+            },
             "Задача о рюкзаке 0-1": {
                 "Время": "O(n*W)",
                 "Память": "O(n*W)"
@@ -157,6 +203,7 @@ class Comparison:
         plt.title('Сравнение методов вычисления чисел Фибоначчи')
         plt.legend()
         plt.grid(True)
+        plt.xscale('log')
         plt.yscale('log')  # Логарифмическая шкала для наглядности
         plt.savefig('fibonacci_comparison.png', dpi=300, bbox_inches='tight')
         plt.show()
@@ -171,11 +218,12 @@ def main():
     print("Сравнение методов вычисления чисел Фибоначчи")
     print("="*60)
     
-    n_values = [5, 10, 20, 30, 40, 50]
+    n_values = Comparison.FIBONACCI_SWEEP
     results = Comparison.compare_fibonacci(n_values)
+    Comparison.find_crossovers(n_values, results)
     
     # Построение графика
-    Comparison.plot_fibonacci_comparison(n_values[:len(results['memoization'])], results)
+    Comparison.plot_fibonacci_comparison(n_values, results)
     
     # Сравнение алгоритмов для рюкзака
     Comparison.compare_knapsack_algorithms()
@@ -4,7 +4,7 @@
 
 import functools
 import time
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 
 
 class Fibonacci:
@@ -77,6 +77,75 @@ class Fibonacci:
             prev, curr = curr, prev + curr
         
         return curr
+    
+    @staticmethod
+    def _doubling_pair(n: int, m: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Пара (F(n), F(n+1)) быстрым удвоением; если задан m — по модулю m.
+        F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2.
+        Биты n обрабатываются от старшего к младшему, без рекурсии.
+        Единственная реализация удвоения в классе: на ней построены
+        fast_doubling и fib_mod.
+        """
+        if n < 0:
+            raise ValueError("n должно быть неотрицательным")
+        a, b = (0, 1) if m is None else (0, 1 % m)  # (F(k), F(k+1)) для k = 0
+        for bit in bin(n)[2:]:
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            if m is not None:
+                c, d = c % m, d % m
+            a, b = (d, c + d) if bit == "1" else (c, d)
+            if m is not None:
+                b %= m
+        return a, b
+    
+    @staticmethod
+    def fast_doubling(n: int) -> int:
+        """
+        Быстрое удвоение (F(0) = 0, F(1) = 1, n >= 0; при n < 0 — ValueError).
+        То же поведение, что fibonacci_fast_doubling в lab03 (там — рекурсивно).
+        
+        Временная сложность: O(log n) умножений длинных чисел
+        Пространственная сложность: O(1) - две переменные (не считая длины чисел)
+        """
+        return Fibonacci._doubling_pair(n)[0]
+    
+    @staticmethod
+    def matrix_power(n: int) -> int:
+        """
+        Возведение матрицы [[1, 1], [1, 0]] в степень n двоичным методом:
+        [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]].
+        
+        Временная сложность: O(log n) умножений матриц 2x2
+        Пространственная сложность: O(1)
+        """
+        def multiply(x: Tuple[int, int, int, int],
+                     y: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+            a, b, c, d = x
+            e, f, g, h = y
+            return (a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h)
+        
+        result = (1, 0, 0, 1)  # единичная матрица
+        base = (1, 1, 1, 0)
+        while n:
+            if n & 1:
+                result = multiply(result, base)
+            n >>= 1
+            if n:  # лишнее возведение в квадрат на последнем шаге самое дорогое
+                base = multiply(base, base)
+        return result[1]
+    
+    @staticmethod
+    def fib_mod(n: int, m: int) -> int:
+        """
+        F(n) mod m для огромных n (например, 10^100) быстрым удвоением по модулю m
+        (n >= 0, m >= 1; при n < 0 — ValueError). То же поведение, что fib_mod в lab03.
+        
+        Временная сложность: O(log n) операций с числами меньше m
+        Пространственная сложность: O(1)
+        """
+        return Fibonacci._doubling_pair(n, m)[0]
 
 
 class Knapsack:
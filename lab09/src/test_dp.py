@@ -35,8 +35,28 @@ def test_fibonacci():
         result_opt = Fibonacci.optimized_iterative(n)
         print(f"  Оптимизированный: {result_opt}")
         
+        # Быстрое удвоение и степень матрицы — O(log n)
+        result_doubling = Fibonacci.fast_doubling(n)
+        result_matrix = Fibonacci.matrix_power(n)
+        print(f"  Быстрое удвоение: {result_doubling}")
+        print(f"  Степень матрицы: {result_matrix}")
+        
         # Проверка корректности
         assert result_memo == result_iter == result_opt, f"Ошибка для n={n}"
+        assert result_doubling == result_matrix == result_opt, f"Ошибка для n={n}"
+    
+    # Большие n: O(log n) методы против итеративного
+    for n in [100, 1000, 12345]:
+        expected = Fibonacci.optimized_iterative(n)
+        assert Fibonacci.fast_doubling(n) == expected, f"Ошибка для n={n}"
+        assert Fibonacci.matrix_power(n) == expected, f"Ошибка для n={n}"
+        for m in [1, 2, 10, 10**9 + 7]:
+            assert Fibonacci.fib_mod(n, m) == expected % m, f"Ошибка для n={n}, m={m}"
+    
+    # Период Пизано для m = 10 равен 60: F(n) mod 10 = F(n mod 60) mod 10
+    huge = 10**100
+    assert Fibonacci.fib_mod(huge, 10) == Fibonacci.optimized_iterative(huge % 60) % 10
+    print(f"\nF(10^100) mod (10^9 + 7) = {Fibonacci.fib_mod(huge, 10**9 + 7)}")
     
     print("\n✓ Все вычисления корректны!")
 